@@ -1,3 +1,4 @@
+import datetime
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin
 from django.contrib.auth.models import User
@@ -42,6 +43,7 @@ from .models import NonCollegeSchoolTimeCommitment
 from .models import Notification
 from .models import OfficialSchool
 from .models import OfficialSchoolTerm
+from .models import OutboundEmail
 from .models import Participation
 from .models import PaymentEligibility
 from .models import Project
@@ -164,6 +166,7 @@ class ProjectSkillAdmin(reversion.admin.VersionAdmin):
     list_filter = (
             'project__project_round__participating_round',
             'project__project_round__community',
+            'projectskillcategory__category',
             )
     search_fields = (
             'skill',
@@ -691,6 +694,37 @@ class InformalChatContactAdmin(reversion.admin.VersionAdmin):
             'topics',
             )
 
+class OutboundEmailAdmin(admin.ModelAdmin):
+    list_display = (
+            'subject',
+            'status',
+            'created',
+            'attempts',
+            'next_attempt',
+            'sent',
+            )
+    list_filter = (
+            'status',
+            )
+    search_fields = (
+            'subject',
+            'to',
+            )
+    readonly_fields = (
+            'created',
+            'sent',
+            )
+    actions = ['retry_now']
+
+    def retry_now(modeladmin, request, queryset):
+        now = datetime.datetime.now(datetime.timezone.utc)
+        queryset.exclude(status=OutboundEmail.SENT).update(
+                status=OutboundEmail.QUEUED,
+                attempts=0,
+                next_attempt=now,
+                )
+    retry_now.short_description = 'Retry sending selected messages now'
+
 admin.site.unregister(User)
 admin.site.register(User, ComradeAdmin)
 
@@ -711,6 +745,7 @@ admin.site.register(MentorRelationship, MentorRelationshipAdmin)
 admin.site.register(NewCommunity, CommunityAdmin)
 admin.site.register(Notification)
 admin.site.register(OfficialSchool, OfficialSchoolAdmin)
+admin.site.register(OutboundEmail, OutboundEmailAdmin)
 admin.site.register(Participation, ParticipationAdmin)
 admin.site.register(RoundPage, RoundPageAdmin)
 admin.site.register(Project, ProjectAdmin)
@@ -0,0 +1,396 @@
+"""
+Blog posts which are written as Django templates in home/templates/home/blog/,
+rather than as pages in the Wagtail CMS.
+
+Every post is listed in POSTS, which is used to build each post's URL (in
+home/urls.py), its entry in the blog feed and index page (in home/feeds.py),
+and its pre-rendered copy (see the prerender_blog management command).
+"""
+
+import datetime
+from django.urls import reverse
+# TODO: please replace the usage of pytz with the native timezone support introduced in Python 3.9
+from pytz import timezone
+
+pacific = timezone('US/Pacific')
+
+def published(*args):
+    return pacific.localize(datetime.datetime(*args))
+
+class BlogPost(object):
+    """
+    One blog post. `path` is its URL, and `name` is the URL name which
+    templates can use to link to it.
+
+    If the post mentions an internship cohort, `round_filter` is used to find
+    that RoundPage, which is passed to the template as `round_name`.
+    Posts which need more than that can give a function as `extra_context`,
+    which takes the RoundPage (or None) and returns more template variables.
+    """
+
+    def __init__(self, path, name, template, title, first_published_at, last_published_at=None,
+            round_filter=None, round_name='current_round', extra_context=None):
+        self.path = path
+        self.name = name
+        self.template = 'home/blog/' + template
+        self.title = title
+        self.first_published_at = first_published_at
+        self.last_published_at = last_published_at or first_published_at
+        self.round_filter = round_filter
+        self.round_name = round_name
+        self.extra_context = extra_context
+
+    def __str__(self):
+        return self.title
+
+    def get_absolute_url(self):
+        return reverse(self.name)
+
+    def get_round(self):
+        # models.py imports feeds.py, which imports this module, so wait to
+        # import it until needed.
+        from .models import RoundPage
+        try:
+            return RoundPage.objects.get(**self.round_filter)
+        except RoundPage.DoesNotExist:
+            return None
+
+    def get_context(self):
+        if self.round_filter is None:
+            return {}
+        current_round = self.get_round()
+        context = {self.round_name: current_round}
+        if self.extra_context is not None:
+            context.update(self.extra_context(current_round))
+        return context
+
+def cohort(internstarts, internends):
+    return {
+        'internstarts__gte': internstarts,
+        'internends__lte': internends,
+    }
+
+def thank_you_context(current_round):
+    from .models import ApprovalStatus, CoordinatorApproval, MentorApproval
+
+    if current_round is None:
+        return {
+            'mentors': None,
+            'mentor_names': None,
+            'community_names': None,
+            'coordinator_names': None,
+        }
+
+    # Mentors who were approved, their project was approved, and their community was approved
+    mentors = MentorApproval.objects.filter(
+            approval_status=ApprovalStatus.APPROVED,
+            project__approval_status=ApprovalStatus.APPROVED,
+            project__project_round__approval_status=ApprovalStatus.APPROVED,
+            project__project_round__participating_round=current_round,
+            ).select_related(
+            'mentor',
+            'project__project_round__community',
+            ).order_by('mentor__public_name')
+    mentor_names = sorted(set(mentor.mentor.public_name for mentor in mentors))
+    community_names = sorted(set(mentor.project.project_round.community.name for mentor in mentors))
+    coordinators = CoordinatorApproval.objects.filter(
+            approval_status=ApprovalStatus.APPROVED,
+            community__participation__participating_round=current_round,
+            community__participation__approval_status=ApprovalStatus.APPROVED,
+            ).select_related('coordinator').distinct()
+    coordinator_names = sorted(set(coordinator.coordinator.public_name for coordinator in coordinators))
+    return {
+        'mentors': mentors,
+        'mentor_names': mentor_names,
+        'community_names': community_names,
+        'coordinator_names': coordinator_names,
+    }
+
+# Add new posts at the end.
+POSTS = [
+    BlogPost(
+        'blog/2019-07-23/outreachy-schedule-changes/',
+        'blog-schedule-changes',
+        '2019-07-23-outreachy-schedule-changes.html',
+        'Schedule changes for Outreachy',
+        published(2019, 7, 23, 15, 5, 1),
+        published(2019, 7, 24, 16, 5, 38),
+        round_filter={
+            'contributions_open__gte': '2019-07-23',
+            'contributions_open__lte': '2019-12-01',
+        },
+        round_name='changed_round',
+    ),
+    BlogPost(
+        'blog/2019-10-01/pick-a-project/',
+        '2019-12-pick-a-project',
+        '2019-10-01-picking-a-project.html',
+        'Picking an Outreachy Project - December 2019 round',
+        published(2019, 10, 1, 7, 26, 0),
+        published(2019, 10, 4, 12, 49, 0),
+        round_filter={
+            'contributions_open__gte': '2019-07-23',
+            'contributions_open__lte': '2019-12-01',
+        },
+        round_name='changed_round',
+    ),
+    BlogPost(
+        'blog/2019-10-18/open-projects/',
+        '2019-12-project-promotion',
+        '2019-10-18-open-projects.html',
+        'Projects that need more applicants - December 2019 round',
+        published(2019, 10, 17, 17, 38, 0),
+    ),
+    BlogPost(
+        'blog/2020-03-27/outreachy-response-to-covid-19/',
+        '2020-03-covid',
+        '2020-03-27-outreachy-response-to-covid-19.html',
+        'Outreachy response to COVID-19',
+        published(2020, 3, 27, 16, 0, 0),
+        published(2020, 5, 1, 16, 0, 0),
+    ),
+    BlogPost(
+        'blog/2020-08-28/december-2020-internship-applications-open/',
+        '2020-08-initial-apps-open',
+        '2020-08-23-initial-applications-open.html',
+        'December 2020 internship applications open',
+        published(2020, 8, 28, 9, 0, 0),
+        round_filter=cohort('2020-11-01', '2021-04-01'),
+    ),
+    BlogPost(
+        'blog/2021-01-15/may-2021-community-cfp-open/',
+        '2021-01-community-cfp-open',
+        '2021-01-15-community-cfp-open.html',
+        'Call for May 2021 mentoring communities',
+        published(2021, 1, 15, 11, 0, 0),
+        round_filter=cohort('2021-05-01', '2021-09-01'),
+    ),
+    BlogPost(
+        'blog/2021-02-01/may-2021-initial-applications-open/',
+        '2021-01-initial-applications-open',
+        '2021-02-01-initial-applications-open.html',
+        'Initial applications open for May 2021 internships',
+        published(2021, 2, 1, 14, 0, 0),
+        round_filter=cohort('2021-05-01', '2021-09-01'),
+    ),
+    BlogPost(
+        'blog/2021-03-23/fsf-participation-barred/',
+        '2021-03-fsf-participation-barred',
+        '2021-03-23-fsf-participation-barred.html',
+        'Outreachy bars FSF from participation in its program',
+        published(2021, 3, 23, 14, 0, 0),
+    ),
+    BlogPost(
+        'blog/2021-03-30/contribution-period-open/',
+        '2021-03-contribution-period-open',
+        '2021-03-30-contribution-period-open.html',
+        'Outreachy May 2021 contribution period open',
+        published(2021, 3, 30, 16, 0, 0),
+    ),
+    BlogPost(
+        'blog/2021-08-13/december-2021-initial-applications-open/',
+        '2021-08-initial-applications-open',
+        '2021-08-13-initial-applications-open.html',
+        'Outreachy December 2021 internship applications open',
+        published(2021, 8, 13, 16, 0, 0),
+        published(2021, 8, 18, 16, 0, 0),
+        round_filter=cohort('2021-08-01', '2022-04-01'),
+    ),
+    BlogPost(
+        'blog/2021-08-18/december-2021-call-for-mentoring-communities/',
+        '2021-08-cfp-open',
+        '2021-08-18-cfp-open.html',
+        'Call for December 2021 mentoring communities',
+        published(2021, 8, 18, 16, 0, 0),
+        round_filter=cohort('2021-08-01', '2022-04-01'),
+    ),
+    BlogPost(
+        'blog/2021-10-14/hiring-for-an-outreachy-community-manager/',
+        '2021-10-outreachy-hiring',
+        '2021-10-12-outreachy-is-hiring.html',
+        'Hiring for an Outreachy community manager',
+        published(2021, 10, 14, 17, 25, 0),
+        published(2021, 10, 15, 16, 20, 0),
+    ),
+    BlogPost(
+        'blog/2022-01-10/may-2022-call-for-mentoring-communities/',
+        '2022-01-cfp-open',
+        '2022-01-10-community-cfp-open.html',
+        'Call for May 2022 mentoring communities',
+        published(2022, 1, 10, 16, 0, 0),
+        published(2021, 1, 10, 16, 0, 0),
+        round_filter=cohort('2022-05-01', '2022-09-01'),
+    ),
+    BlogPost(
+        'blog/2022-02-04/may-2022-initial-applications-open/',
+        '2022-02-initial-applications-open',
+        '2022-02-04-initial-applications-open.html',
+        'Outreachy May 2022 internship applications',
+        published(2022, 2, 4, 16, 0, 0),
+        round_filter=cohort('2022-05-01', '2022-09-01'),
+    ),
+    BlogPost(
+        'blog/2022-04-15/outreachy-welcomes-new-community-manager/',
+        '2022-04-new-community-manager',
+        '2022-04-15-new-outreachy-community-manager.html',
+        'Outreachy welcomes new community manager',
+        published(2022, 4, 15, 16, 0, 0),
+    ),
+    BlogPost(
+        'blog/2022-06-14/remembering-and-honoring-marina-zhurakhinskaya-founder-of-outreachy/',
+        '2022-06-remembering-marina',
+        '2022-06-14-remembering-and-honoring-marina.html',
+        'Remembering and Honoring Marina Zhurakhinskaya, Founder of Outreachy',
+        published(2022, 6, 15, 3, 0, 0),
+        published(2022, 6, 15, 14, 0, 0),
+    ),
+    BlogPost(
+        'blog/2022-08-09/december-2022-initial-applications-open/',
+        '2022-08-initial-applications-open',
+        '2022-08-09-initial-applications-open.html',
+        'Outreachy December 2022 internship applications',
+        published(2022, 8, 9, 15, 0, 0),
+        published(2022, 8, 9, 15, 5, 0),
+        round_filter=cohort('2022-12-01', '2023-04-01'),
+    ),
+    BlogPost(
+        'blog/2022-12-05/thank-you-december-2022-mentors-and-coordinators/',
+        '2022-12-thank-you',
+        '2022-12-05-thank-you.html',
+        'Thank you December 2022 mentors and coordinators!',
+        published(2022, 12, 5, 14, 0, 0),
+        round_filter=cohort('2022-12-01', '2023-04-01'),
+        extra_context=thank_you_context,
+    ),
+    BlogPost(
+        'blog/2023-01-05/may-2023-call-for-mentoring-organizations/',
+        '2023-01-cfp-open',
+        '2023-01-05-community-cfp-open.html',
+        'Call for May 2023 mentoring communities',
+        published(2023, 1, 5, 16, 0, 0),
+        round_filter=cohort('2023-05-01', '2023-09-01'),
+    ),
+    BlogPost(
+        'blog/2023-01-16/may-2023-initial-applications-open/',
+        '2023-01-initial-applications-open',
+        '2023-01-16-initial-applications-open.html',
+        'Outreachy May 2023 internship applications open',
+        published(2023, 1, 16, 2, 0, 0),
+        round_filter=cohort('2023-05-01', '2023-09-01'),
+    ),
+    BlogPost(
+        'blog/2023-08-01/december-2023-call-for-mentoring-organizations/',
+        '2023-08-cfp-open',
+        '2023-08-01-community-cfp-open.html',
+        'Call for December 2023 mentoring communities',
+        published(2023, 8, 1, 16, 0, 0),
+        round_filter=cohort('2023-12-01', '2024-04-01'),
+    ),
+    BlogPost(
+        'blog/2023-08-08/december-2023-initial-applications-open/',
+        '2023-08-initial-applications-open',
+        '2023-08-08-initial-applications-open.html',
+        'Outreachy December 2023 internship applications open',
+        published(2023, 8, 8, 16, 0, 0),
+        round_filter=cohort('2023-12-01', '2024-04-01'),
+    ),
+    BlogPost(
+        'blog/2023-08-24/outreachy-welcomes-mentor-advocate/',
+        '2023-08-tilda',
+        '2023-08-24-announcing-tilda-a-new-Outreachy-organizer.html',
+        'Outreachy welcomes mentor advocate',
+        published(2023, 8, 25, 1, 0, 0),
+    ),
+    BlogPost(
+        'blog/2024-01-08/may-2024-call-for-mentoring-organizations/',
+        '2024-01-cfp-open',
+        '2024-01-08-community-cfp-open.html',
+        'Call for May 2024 mentoring communities',
+        published(2024, 1, 8, 16, 0, 0),
+        round_filter=cohort('2024-01-01', '2024-09-01'),
+    ),
+    BlogPost(
+        'blog/2024-01-11/outreachy-2023-in-review/',
+        'outreachy-2023-year-in-review',
+        '2024-01-10-outreachy-2023-year-in-review.html',
+        'Outreachy 2023: Year in Review',
+        published(2024, 1, 11, 12, 0, 0),
+    ),
+    BlogPost(
+        'blog/2024-01-15/may-2024-initial-applications-open/',
+        '2024-01-initial-applications-open',
+        '2024-01-15-initial-applications-open.html',
+        'Outreachy May 2024 internship applications open',
+        published(2024, 1, 15, 21, 15, 0),
+        round_filter=cohort('2024-01-01', '2024-09-01'),
+    ),
+    BlogPost(
+        'blog/2024-04-03/mentor-spotlight-agien-petra/',
+        '2024-04-mentor-spotlight-agien-petra',
+        '2024-04-mentor-spotlight-agien-petra.html',
+        'Outreachy Mentor Spotlight: Agien Petra',
+        published(2024, 4, 3, 13, 0, 0),
+    ),
+    BlogPost(
+        'blog/2024-07-19/outreachy-impact-ahmed-rafiat/',
+        '2024-07-outreachy-impact-ahmed-rafiat',
+        '2024-07-19-outreachy-impact-ahmed-rafiat.html',
+        'Outreachy Impact: Intern Stories with Ahmed & Rafiat',
+        published(2024, 7, 19, 13, 0, 0),
+    ),
+    BlogPost(
+        'blog/2024-08-14/outreachy-needs-your-help/',
+        '2024-08-outreachy-needs-your-help',
+        '2024-08-14-outreachy-needs-your-help.html',
+        'Outreachy Needs Your Help!',
+        published(2024, 8, 14, 13, 0, 0),
+    ),
+    BlogPost(
+        'blog/2025-01-20/june-2025-call-for-mentoring-organizations/',
+        '2025-01-cfp-open',
+        '2025-01-20-community-cfp-open.html',
+        'Call for June 2025 mentoring communities',
+        published(2025, 1, 20, 16, 0, 0),
+        round_filter=cohort('2025-05-01', '2025-09-01'),
+    ),
+    BlogPost(
+        'blog/2025-01-27/june-2025-initial-applications-open/',
+        '2025-01-initial-applications-open',
+        '2025-01-27-initial-applications-open.html',
+        'Outreachy June 2025 internship applications open',
+        published(2025, 1, 21, 16, 0, 0),
+        round_filter=cohort('2025-01-01', '2025-09-01'),
+    ),
+    BlogPost(
+        'blog/2025-08-14/december-2025-call-for-mentoring-organizations/',
+        '2025-08-cfp-open',
+        '2025-08-14-community-cfp-open.html',
+        'Call for December 2025 mentoring communities',
+        published(2025, 8, 14, 16, 0, 0),
+        round_filter=cohort('2025-11-01', '2026-04-01'),
+    ),
+    BlogPost(
+        'blog/2025-08-25/december-2025-initial-applications-open/',
+        '2025-08-25-initial-applications-open',
+        '2025-08-25-initial-applications-open.html',
+        'Outreachy December 2025 internship applications open',
+        published(2025, 8, 25, 16, 0, 0),
+        round_filter=cohort('2025-11-01', '2026-04-01'),
+    ),
+    BlogPost(
+        'blog/2026-02-06/may-2026-call-for-mentoring-organizations/',
+        '2026-02-cfp-open',
+        '2026-02-06-community-cfp-open.html',
+        'Call for May 2026 mentoring communities',
+        published(2026, 2, 6, 16, 0, 0),
+        round_filter=cohort('2026-02-01', '2026-09-01'),
+    ),
+    BlogPost(
+        'blog/2026-02-06/may-2026-initial-applications-open/',
+        '2026-02-initial-applications-open',
+        '2026-02-06-initial-applications-open.html',
+        'Outreachy May 2026 internship applications open',
+        published(2026, 2, 6, 16, 0, 0),
+        round_filter=cohort('2026-02-01', '2026-09-01'),
+    ),
+]
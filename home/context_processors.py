@@ -1,12 +1,39 @@
-from .models import ApprovalStatus, DASHBOARD_MODELS
+from django.core.cache import cache
+
+from .models import ApprovalStatus, DASHBOARD_MODELS, PENDING_APPROVALS_GENERATION_KEY, cache_generation
+
+# Counts are dropped whenever a dashboard model changes, but other processes
+# may be using their own local cache, so don't let them get too far behind.
+PENDING_APPROVALS_TIMEOUT = 5 * 60
+
+def count_pending_approvals(user):
+    """
+    Count the pending objects on this user's dashboard, using cached counts
+    where possible. Users who share a dashboard_scope for a model (such as
+    all staff, for some models) share one cached count for it.
+    """
+    generation = cache_generation(PENDING_APPROVALS_GENERATION_KEY)
+    keys = {
+        model: 'pending-approvals:{}:{}:{}'.format(
+            generation, model._meta.label_lower, model.dashboard_scope(user))
+        for model in DASHBOARD_MODELS
+    }
+    counts = cache.get_many(keys.values())
+
+    missing = {}
+    for model, key in keys.items():
+        if key not in counts:
+            missing[key] = model.objects_for_dashboard(user).pending().distinct().count()
+    if missing:
+        cache.set_many(missing, PENDING_APPROVALS_TIMEOUT)
+        counts.update(missing)
+
+    return sum(counts.values())
 
 def header(request):
     if request.user.is_authenticated:
         # TODO: don't count objects where the submission_and_approval_deadline has passed
-        pending_approvals = sum(
-            model.objects_for_dashboard(request.user).pending().distinct().count()
-            for model in DASHBOARD_MODELS
-        )
+        pending_approvals = count_pending_approvals(request.user)
     else:
         pending_approvals = 0
 
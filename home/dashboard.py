@@ -25,34 +25,37 @@ The context value can be any type. Here are some examples:
   that list.
 """
 
-from collections import defaultdict
+from collections import defaultdict, deque
 from django.contrib.auth.mixins import LoginRequiredMixin
-from django.core import mail
 from django.core.exceptions import PermissionDenied
 from django.core.mail.backends.base import BaseEmailBackend
-from django.db import models
+from django.core.paginator import Paginator
+from django.db import models, transaction
 from django.shortcuts import get_object_or_404, redirect
-from django.utils.html import urlize
 from django.views.generic import TemplateView
 import datetime
 import re
+import zlib
 
 from . import email
 from .mixins import ComradeRequiredMixin
 from .models import ApplicantApproval
 from .models import ApplicationReviewer
 from .models import ApprovalStatus
+from .models import BulkEmailCheckpoint
 from .models import Community
 from .models import Comrade
 from .models import DASHBOARD_MODELS
+from .models import EmailSendMetrics
 from .models import InformalChatContact
-from .models import InitialApplicationReview
 from .models import MentorApproval
 from .models import MentorRelationship
 from .models import Participation
 from .models import Project
 from .models import Role
+from .models import RoundEventDate
 from .models import RoundPage
+from .models import RoundTimeline
 from .models import Sponsorship
 from .models import get_deadline_date_for
 
@@ -72,23 +75,23 @@ def get_dashboard_sections(request):
 
 
 def intern_announcement(request, today):
+    timeline = RoundTimeline.for_request(request, today)
     try:
         # Find the newest round whose intern announcement date has passed.
-        current_round = RoundPage.objects.filter(
+        current_round = timeline.filter(
             internannounce__lte=today,
         ).latest('internannounce')
-        current_round.today = today
     except RoundPage.DoesNotExist:
         return None
 
     # Hide this message once the next round starts, where "starts" is defined
     # by pingnew, and "next round" means it has a later intern announcement
     # date than this one.
-    later_open_rounds = RoundPage.objects.filter(
+    later_open_rounds = timeline.filter(
         pingnew__lte=today,
         internannounce__gt=current_round.internannounce,
     )
-    if later_open_rounds.exists():
+    if later_open_rounds:
         return None
 
     roles = []
@@ -113,11 +116,11 @@ def coordinator_reminder(request, today):
     # will have to select another intern after the intern announcement date.
     # Show coordinator's communities until the day after their mentors' interns
     # start.
+    timeline = RoundTimeline.for_request(request, today)
     try:
-        current_round = RoundPage.objects.filter(
+        current_round = timeline.filter(
             internstarts__gt=today,
         ).earliest('internstarts')
-        current_round.today = today
     except RoundPage.DoesNotExist:
         return None
 
@@ -133,12 +136,12 @@ def application_summary(request, today):
     # views.applicant_review_summary doesn't raise an exception like
     # PermissionDenied.
 
+    timeline = RoundTimeline.for_request(request, today)
     try:
-        current_round = RoundPage.objects.get(
+        current_round = timeline.get(
             initial_applications_open__lte=today,
             contributions_close__gt=today,
         )
-        current_round.today = today
     except RoundPage.DoesNotExist:
         return None
 
@@ -148,48 +151,22 @@ def application_summary(request, today):
     except Comrade.DoesNotExist:
         return None
 
-    current_applicants = current_round.applicantapproval_set
-
-    pending_applications_count = current_applicants.pending().distinct().count()
-    pending_unreviewed_unowned_count = current_applicants.pending().filter(initialapplicationreview__isnull=True, review_owner=None).distinct().count()
-    pending_unreviewed_unowned_non_student_count = current_applicants.pending().filter(initialapplicationreview__isnull=True, review_owner=None, schoolinformation__isnull=True).distinct().count()
-    pending_reviewed_unowned_count = current_applicants.pending().filter(initialapplicationreview__isnull=False, review_owner=None).distinct().count()
-
-    rejected_applications_count = current_applicants.rejected().distinct().count()
-    approved_applications_count = current_applicants.approved().distinct().count()
-
-    reviewed_strong_count = current_applicants.pending().filter(review_owner=None).filter(initialapplicationreview__essay_rating=InitialApplicationReview.STRONG).distinct().count()
-    reviewed_good_count = current_applicants.pending().filter(review_owner=None).filter(initialapplicationreview__essay_rating=InitialApplicationReview.GOOD).distinct().count()
-    reviewed_maybe_count = current_applicants.pending().filter(review_owner=None).filter(initialapplicationreview__essay_rating=InitialApplicationReview.MAYBE).distinct().count()
-    reviewed_unclear_count = current_applicants.pending().filter(review_owner=None).filter(initialapplicationreview__essay_rating=InitialApplicationReview.UNCLEAR).distinct().count()
-
     reviewers = ApplicationReviewer.objects.filter(reviewing_round=current_round).approved().order_by('comrade__public_name').annotate(number_pending_applications_owned=models.Count('applicantapproval', filter=models.Q(applicantapproval__approval_status=ApprovalStatus.PENDING)))
 
-    return {
-        'pending_applications_count': pending_applications_count,
-        'pending_unreviewed_unowned_count': pending_unreviewed_unowned_count,
-        'pending_unreviewed_unowned_non_student_count': pending_unreviewed_unowned_non_student_count,
-        'pending_reviewed_unowned_count': pending_reviewed_unowned_count,
-        'reviewed_strong_count': reviewed_strong_count,
-        'reviewed_good_count': reviewed_good_count,
-        'reviewed_maybe_count': reviewed_maybe_count,
-        'reviewed_unclear_count': reviewed_unclear_count,
-        'rejected_applications_count': rejected_applications_count,
-        'approved_applications_count': approved_applications_count,
-        'reviewers': reviewers,
-    }
+    context = current_round.get_initial_application_counts()
+    context['reviewers'] = reviewers
+    return context
 
 
 def staff_subscriptions(request, today):
     if not request.user.is_staff:
         return None
 
-    try:
-        cohorts = RoundPage.objects.filter(
-            contributions_open__lte=today,
-        ).order_by('-internstarts')
-    except RoundPage.DoesNotExist:
-        return None
+    timeline = RoundTimeline.for_request(request, today)
+    # Newest cohorts first
+    cohorts = list(reversed(timeline.filter(
+        contributions_open__lte=today,
+    ).rounds))
 
     return {
         'cohorts': cohorts,
@@ -222,45 +199,208 @@ class SendEmailView(RoundEvent, LoginRequiredMixin, ComradeRequiredMixin, BaseEm
         pass
 
     def get_round(self):
+        # Only staff can preview or send these emails. The check lives here
+        # rather than in generate_messages, so the round_events command can
+        # generate them without a real request.
+        if not self.request.user.is_staff:
+            raise PermissionDenied("You are not authorized to send emails.")
         return get_object_or_404(RoundPage, slug=self.kwargs['round_slug'])
 
+    # Cohort-wide announcements can merge messages which came out the same
+    # for several people into one Bcc'd message. Messages from templates
+    # which use the 'recipient' variable are still sent separately.
+    merge_identical_messages = False
+
+    def sending_connection(self):
+        """
+        Connection for really sending the generated messages.
+        """
+        return email.BatchingBackend(merge=self.merge_identical_messages)
+
+    # Dry runs list every message's recipients, a page at a time, but only
+    # render the messages on the requested page plus a small sample spread
+    # across all the recipients.
+    preview_page_size = 50
+    preview_sample_size = 5
+    preview_sample_rate = 20
+
+    # Good enough to find the links in plain text messages, and much cheaper
+    # than running urlize over every message.
+    url_re = re.compile(r'https?://[^\s<>"]+')
+    email_re = re.compile(r'[\w.+-]+@[\w-]+(?:\.[\w-]+)+')
+
+    def start_preview(self, page=1):
+        """
+        Get ready to collect messages sent to this view's BaseEmailBackend
+        implementation.
+        """
+        self.message_count = 0
+        self.message_summaries = []
+        self.sample = []
+        self.sample_planned = 0
+        self.rendered_count = 0
+        self.urls = set()
+        self.preview_range = range(
+            (page - 1) * self.preview_page_size,
+            page * self.preview_page_size,
+        )
+        # What wants_text decided about each message which hasn't reached
+        # send_messages yet, in order.
+        self.planned = deque()
+
+    def in_sample(self, recipients):
+        # Choose by address, so every page load shows the same sample no
+        # matter what order the messages were generated in.
+        key = ','.join(str(r) for r in recipients).encode()
+        return zlib.crc32(key) % self.preview_sample_rate == 0
+
+    def wants_text(self, recipients):
+        """
+        Called by the helpers in home/email.py before rendering a message to
+        `recipients`. Messages which aren't on the requested page or in the
+        sample are only counted, so they don't need rendering.
+        """
+        summary = {
+            'to': ', '.join(str(r) for r in recipients),
+        }
+        on_page = self.message_count in self.preview_range
+        # Always include the first message, so the sample isn't empty.
+        in_sample = self.sample_planned < self.preview_sample_size and (not self.sample_planned or self.in_sample(recipients))
+        if in_sample:
+            self.sample_planned += 1
+
+        self.message_summaries.append(summary)
+        self.message_count += 1
+        self.planned.append((summary, on_page, in_sample))
+        return on_page or in_sample
+
     def get_context_data(self, **kwargs):
         """
         Use this view's BaseEmailBackend implementation to do a dry-run of
         sending the generated messages, and return a preview of the messages
         that would be sent.
         """
-        self.messages = []
-        self.generate_messages(current_round=self.get_round(), connection=self)
-
-        # Find all URLs in all messages by asking Django's urlize function to
-        # mark up URL-like text as HTML and then looking for the HTML that
-        # urlize generated.
-        urlize_re = re.compile(r'<a href="(.*?)"')
-        urls = set()
-        for message in self.messages:
-            for url in urlize_re.finditer(urlize(message.body)):
-                urls.add(url.group(1))
+        try:
+            page = max(1, int(self.request.GET.get('page', 1)))
+        except ValueError:
+            page = 1
+
+        current_round = self.get_round()
+        # Previews are only logged, so reloading this page doesn't pile up
+        # EmailSendMetrics rows.
+        with email.EmailMetrics(self.slug):
+            self.start_preview(page)
+            self.generate_messages(current_round=current_round, connection=self)
+
+            # We only know how many pages there are after a pass, so a page
+            # past the end takes a second pass to render the last page.
+            last_page = max(1, (self.message_count + self.preview_page_size - 1) // self.preview_page_size)
+            if page > last_page:
+                page = last_page
+                self.start_preview(page)
+                self.generate_messages(current_round=current_round, connection=self)
 
         context = super(SendEmailView, self).get_context_data(**kwargs)
-        context['messages'] = self.messages
-        context['urls'] = sorted(urls)
+        context['message_count'] = self.message_count
+        context['sample'] = self.sample
+        context['page_obj'] = Paginator(self.message_summaries, self.preview_page_size).get_page(page)
+        # Links are only collected from the rendered messages, so the
+        # template has to say when that isn't all of them.
+        context['urls'] = sorted(self.urls)
+        context['rendered_count'] = self.rendered_count
+        if self.resumable:
+            context['interrupted_send'] = self.interrupted_send(current_round)
         return context
 
     def send_messages(self, messages):
         """
-        Implementation of BaseEmailBackend that just saves the generated
+        Implementation of BaseEmailBackend that just summarizes the generated
         messages on self, so get_context_data can dig them back out again.
         """
-        self.messages.extend(messages)
+        email.record_email_messages(len(messages))
+        for message in messages:
+            if not self.planned:
+                # This message was rendered without asking wants_text first.
+                self.wants_text(message.to)
+            summary, on_page, in_sample = self.planned.popleft()
+            if not (on_page or in_sample):
+                continue
+
+            self.rendered_count += 1
+            for url in self.url_re.finditer(message.body):
+                self.urls.add(url.group(0).rstrip('.,;:!?)\''))
+            for address in self.email_re.finditer(message.body):
+                self.urls.add('mailto:' + address.group(0).rstrip('.'))
+
+            summary['subject'] = message.subject
+            if on_page:
+                summary['message'] = message.message()
+            if in_sample:
+                self.sample.append(message)
         return len(messages)
 
+    # Views which send with email.send_bulk_template_mail, passing it
+    # bulk_checkpoint, can pick up where an interrupted send stopped.
+    resumable = False
+
+    def checkpoint_prefix(self, current_round):
+        return '{}:{}:'.format(self.slug, current_round.slug)
+
+    def checkpoint_name(self, current_round):
+        """
+        Name for saving progress through this round's bulk send. Events
+        which happen more than once in a round, like the two contributor
+        deadline reminders, get a separate name each time, named for the
+        latest one which is already due.
+        """
+        due = [instance(current_round) for instance in self.instances()]
+        started = [d for d in due if d <= current_round.today]
+        return '{}{}'.format(
+            self.checkpoint_prefix(current_round),
+            max(started) if started else min(due),
+        )
+
+    def bulk_checkpoint(self, current_round, connection):
+        """
+        Name for saving progress through a bulk send with
+        email.send_bulk_template_mail, or None during a dry-run, which
+        shouldn't save anything.
+
+        Progress left over from an earlier time this event was sent belongs
+        to a different send, so it's thrown away.
+        """
+        if connection is self:
+            return None
+        name = self.checkpoint_name(current_round)
+        BulkEmailCheckpoint.objects.filter(
+            name__startswith=self.checkpoint_prefix(current_round),
+        ).exclude(name=name).delete()
+        return name
+
+    def interrupted_send(self, current_round):
+        """
+        Progress saved by an earlier attempt at this send, if it didn't finish.
+        """
+        return BulkEmailCheckpoint.objects.filter(name=self.checkpoint_name(current_round)).first()
+
     def post(self, request, *args, **kwargs):
         """
-        Use the real email backend to send the generated messages.
+        Use the real email backend to send the generated messages, all over
+        one connection. Unless merge_identical_messages is set, each message
+        goes out separately, so reminders stay addressed to the person
+        they're for.
         """
-        with mail.get_connection() as connection:
-            self.generate_messages(current_round=self.get_round(), connection=connection)
+        current_round = self.get_round()
+        # Like notify_applicants --restart, forget how far an interrupted
+        # send got, and email everyone again.
+        if self.resumable and request.POST.get('restart'):
+            BulkEmailCheckpoint.objects.filter(
+                name__startswith=self.checkpoint_prefix(current_round),
+            ).delete()
+        with email.EmailMetrics(self.slug) as metrics:
+            with self.sending_connection() as connection:
+                self.generate_messages(current_round=current_round, connection=connection)
+        EmailSendMetrics.record(metrics, current_round, self.slug)
         return redirect('dashboard')
 
 class CFPOpen(SendEmailView):
@@ -279,8 +419,6 @@ class CFPOpen(SendEmailView):
         return current_round.pingnew
 
     def generate_messages(self, current_round, connection):
-        if not self.request.user.is_staff:
-            raise PermissionDenied("You are not authorized to send reminder emails.")
         email.cfp_open(current_round, self.request, connection=connection)
 
 class CoordinatorProjectDeadline(SendEmailView):
@@ -299,8 +437,6 @@ class CoordinatorProjectDeadline(SendEmailView):
         return current_round.project_soft_deadline() - datetime.timedelta(days=7)
 
     def generate_messages(self, current_round, connection):
-        if not self.request.user.is_staff:
-            raise PermissionDenied("You are not authorized to send reminder emails.")
         # for i in current_round get approved and pending participations:
         participations = current_round.participation_set.exclude(approval_status=ApprovalStatus.WITHDRAWN).exclude(approval_status=ApprovalStatus.REJECTED)
         for p in participations:
@@ -323,8 +459,6 @@ class MentorCheckDeadlinesReminder(SendEmailView):
         return current_round.contributions_close - datetime.timedelta(weeks=2)
 
     def generate_messages(self, current_round, connection):
-        if not self.request.user.is_staff:
-            raise PermissionDenied("You are not authorized to send reminder emails.")
         projects = Project.objects.filter(
             approval_status__in=[Project.APPROVED, Project.PENDING],
             project_round__participating_round=current_round,
@@ -356,8 +490,6 @@ class MentorApplicationDeadlinesReminder(SendEmailView):
         return due
 
     def generate_messages(self, current_round, connection):
-        if not self.request.user.is_staff:
-            raise PermissionDenied("You are not authorized to send reminder emails.")
 
         # Don't ask mentors to encourage interns to apply if it's too late for
         # anyone to apply any more.
@@ -386,8 +518,6 @@ class MentorInternSelectionReminder(SendEmailView):
         return current_round.contributions_close
 
     def generate_messages(self, current_round, connection):
-        if not self.request.user.is_staff:
-            raise PermissionDenied("You are not authorized to send reminder emails.")
 
         projects = Project.objects.approved().filter(
             project_round__participating_round=current_round,
@@ -418,8 +548,6 @@ class CoordinatorInternSelectionReminder(SendEmailView):
         return current_round.contributions_close
 
     def generate_messages(self, current_round, connection):
-        if not self.request.user.is_staff:
-            raise PermissionDenied("You are not authorized to send reminder emails.")
         for p in current_round.participation_set.approved():
             email.coordinator_intern_selection_reminder(p, self.request, connection=connection)
 
@@ -444,8 +572,6 @@ class ApplicantsDeadlinesReminder(SendEmailView):
         return MentorCheckDeadlinesReminder.instance(current_round) + datetime.timedelta(days=3)
 
     def generate_messages(self, current_round, connection):
-        if not self.request.user.is_staff:
-            raise PermissionDenied("You are not authorized to send reminder emails.")
 
         projects = Project.objects.filter(
             project_round__participating_round=current_round,
@@ -467,26 +593,25 @@ class ContributorsApplicationPeriodEndedReminder(SendEmailView):
     """
     description = 'Contributor Final Email'
     slug = 'application-period-ended'
+    merge_identical_messages = True
+    resumable = True
 
     @staticmethod
     def instance(current_round):
         return current_round.contributions_close
 
     def generate_messages(self, current_round, connection):
-        if not self.request.user.is_staff:
-            raise PermissionDenied("You are not authorized to send reminder emails.")
-        contributors = Comrade.objects.filter(
-            applicantapproval__application_round=current_round,
-            applicantapproval__approval_status=ApprovalStatus.APPROVED,
-            applicantapproval__contribution__isnull=False).distinct()
-
-        for c in contributors:
-            email.contributor_application_period_ended(
-                c,
-                current_round,
-                self.request,
-                connection=connection,
-            )
+        contributors = current_round.applicantapproval_set.approved().filter(
+            contribution__isnull=False,
+        ).distinct().select_related('applicant__account')
+
+        email.contributors_application_period_ended(
+            contributors,
+            current_round,
+            self.request,
+            connection=connection,
+            checkpoint=self.bulk_checkpoint(current_round, connection),
+        )
 
 
 class ContributorsDeadlinesReminder(SendEmailView):
@@ -499,6 +624,8 @@ class ContributorsDeadlinesReminder(SendEmailView):
     """
     description = 'Contributor Deadline Email'
     slug = 'contributor-deadline-reminder'
+    merge_identical_messages = True
+    resumable = True
 
     @staticmethod
     def first_reminder(current_round):
@@ -513,26 +640,21 @@ class ContributorsDeadlinesReminder(SendEmailView):
         return (cls.first_reminder, cls.second_reminder)
 
     def generate_messages(self, current_round, connection):
-        if not self.request.user.is_staff:
-            raise PermissionDenied("You are not authorized to send reminder emails.")
 
         # Don't ask contributors to submit final applications if it's too late
         # for anyone to apply any more.
         if current_round.contributions_close.has_passed():
             return
 
-        contributors = Comrade.objects.filter(
-            applicantapproval__application_round=current_round,
-            applicantapproval__approval_status=ApprovalStatus.APPROVED,
-        ).distinct()
+        contributors = current_round.applicantapproval_set.approved().select_related('applicant__account')
 
-        for c in contributors:
-            email.contributor_deadline_reminder(
-                c,
-                current_round,
-                self.request,
-                connection=connection,
-            )
+        email.contributors_deadline_reminder(
+            contributors,
+            current_round,
+            self.request,
+            connection=connection,
+            checkpoint=self.bulk_checkpoint(current_round, connection),
+        )
 
 class MentorInternSelectionDeadlineReminder(SendEmailView):
     """
@@ -550,8 +672,6 @@ class MentorInternSelectionDeadlineReminder(SendEmailView):
         return current_round.mentor_intern_selection_deadline
 
     def generate_messages(self, current_round, connection):
-        if not self.request.user.is_staff:
-            raise PermissionDenied("You are not authorized to send reminder emails.")
 
         # Find approved projects for this internship cohort
         # Look for projects that haven't made an intern selection yet
@@ -588,8 +708,6 @@ class InternNotification(SendEmailView):
         return current_round.internannounce
 
     def generate_messages(self, current_round, connection):
-        if not self.request.user.is_staff:
-            raise PermissionDenied("You are not authorized to send reminder emails.")
         interns = current_round.get_approved_intern_selections()
 
         for i in interns:
@@ -611,8 +729,6 @@ class ContractReminder(SendEmailView):
         return current_round.intern_agreement_deadline()
 
     def generate_messages(self, current_round, connection):
-        if not self.request.user.is_staff:
-            raise PermissionDenied("You are not authorized to send reminder emails.")
         interns = current_round.get_approved_intern_selections().filter(intern_contract__isnull=True)
 
         for i in interns:
@@ -640,8 +756,6 @@ class InternWeek(SendEmailView):
         return current_round.internstarts + datetime.timedelta(weeks=cls.week - 1)
 
     def generate_messages(self, current_round, connection):
-        if not self.request.user.is_staff:
-            raise PermissionDenied("You are not authorized to send reminder emails.")
 
         template = 'home/email/internship-week-{}.txt'.format(self.week)
         interns = current_round.get_in_good_standing_intern_selections()
@@ -683,8 +797,6 @@ class InitialFeedbackInstructions(FeedbackInstructions):
         return current_round.initialfeedback
 
     def generate_messages(self, current_round, connection):
-        if not self.request.user.is_staff:
-            raise PermissionDenied("You are not authorized to send reminder emails.")
 
         # Only get interns that are in good standing and
         # where a mentor or intern hasn't submitted feedback.
@@ -713,8 +825,6 @@ class MidpointFeedbackInstructions(FeedbackInstructions):
         return current_round.midfeedback
 
     def generate_messages(self, current_round, connection):
-        if not self.request.user.is_staff:
-            raise PermissionDenied("You are not authorized to send reminder emails.")
 
         # Only get interns that are in good standing and
         # where a mentor or intern hasn't submitted feedback.
@@ -752,8 +862,6 @@ class Feedback3FeedbackInstructions(FeedbackInstructions):
         return current_round.midfeedback
 
     def generate_messages(self, current_round, connection):
-        if not self.request.user.is_staff:
-            raise PermissionDenied("You are not authorized to send reminder emails.")
 
         # Only get interns that are in good standing and
         # where a mentor or intern hasn't submitted feedback.
@@ -782,8 +890,6 @@ class FinalFeedbackInstructions(FeedbackInstructions):
         return current_round.finalfeedback
 
     def generate_messages(self, current_round, connection):
-        if not self.request.user.is_staff:
-            raise PermissionDenied("You are not authorized to send reminder emails.")
 
         # Only get interns that are in good standing and
         # where a mentor or intern hasn't submitted feedback.
@@ -811,8 +917,6 @@ class CareerChatInvitation(SendEmailView):
         return current_round.week_six_chat_text_date.date()
 
     def generate_messages(self, current_round, connection):
-        if not self.request.user.is_staff:
-            raise PermissionDenied("You are not authorized to send reminder emails.")
 
         email.career_chat_invitation(current_round, self.request, template='home/email/career-chat-invitation.txt', connection=connection)
 
@@ -836,8 +940,6 @@ class InformalChatAvailabilityCheck(SendEmailView):
         return current_round.week_eight_chat_text_date.date()
 
     def generate_messages(self, current_round, connection):
-        if not self.request.user.is_staff:
-            raise PermissionDenied("You are not authorized to send reminder emails.")
 
         contacts = InformalChatContact.objects.all()
 
@@ -860,8 +962,6 @@ class InitialApplicationReviewerAvailabilityCheck(SendEmailView):
         return current_round.initial_applications_open - datetime.timedelta(days=7*1)
 
     def generate_messages(self, current_round, connection):
-        if not self.request.user.is_staff:
-            raise PermissionDenied("You are not authorized to send reminder emails.")
 
         # Find all initial application reviewers who were approved
         # within the 3 cohorts (approximately 18 months)
@@ -890,9 +990,6 @@ class MentoringOrgCFPOpen(SendEmailView):
         return current_round.pingold
 
     def generate_messages(self, current_round, connection):
-        if not self.request.user.is_staff:
-            raise PermissionDenied("You are not authorized to send emails.")
-
         # Find all the communities who were approved
         # within the last 4 cohorts (approximately 24 months).
         # Exclude communities that have already signed up to participate.
@@ -949,37 +1046,68 @@ all_round_events = (
     FinalFeedbackInstructions,
 )
 
+round_events_by_slug = {event.slug: event for event in all_round_events}
+
+def update_round_event_calendar(current_round):
+    """
+    Record when every instance of every event in all_round_events is due
+    for this round. RoundPage.save calls this whenever the round's dates may
+    have changed.
+    """
+    with transaction.atomic():
+        RoundEventDate.objects.filter(internship_round=current_round).delete()
+        RoundEventDate.objects.bulk_create(
+            RoundEventDate(internship_round=current_round, event=event.slug, due=due(current_round))
+            for event in all_round_events
+            for due in event.instances()
+        )
+
+def get_due_round_events(today, early=datetime.timedelta(weeks=2), late=datetime.timedelta(weeks=1)):
+    """
+    Find events which are due between ``early`` before and ``late`` after
+    today. If more than one instance of an event is in that window, pick the
+    one whose due date is closest to today.
+    """
+    due_dates = RoundEventDate.objects.filter(
+        due__gte=today - late,
+        due__lte=today + early,
+    ).select_related('internship_round')
+
+    closest = {}
+    for d in due_dates:
+        event = round_events_by_slug.get(d.event)
+        if event is None:
+            # This event was removed from all_round_events since the
+            # calendar was last rebuilt.
+            continue
+        key = (d.internship_round_id, d.event)
+        if key not in closest or abs(today - d.due) < abs(today - closest[key]['due']):
+            d.internship_round.today = today
+            closest[key] = {
+                'kind': event,
+                'current_round': d.internship_round,
+                'due': d.due,
+            }
+
+    return sorted(closest.values(), key=lambda d: d['due'])
+
 def round_events(request, today):
     if not request.user.is_staff:
         return None
 
-    # How long before and after the ideal date should we display each reminder?
-    early = datetime.timedelta(weeks=2)
-    late = datetime.timedelta(weeks=1)
-
-    # Check all rounds for events. Most rounds won't have any
-    # currently-relevant events, but there will never be so many rounds that
-    # this becomes a performance bottleneck, and it's a lot easier to
-    # understand this way than trying to craft a more precise query.
-    events = []
-    for current_round in RoundPage.objects.order_by():
-        for event in all_round_events:
-            # If this event has multiple instances, pick the one whose due date
-            # is closest to today.
-            due = min(
-                (due(current_round) for due in event.instances()),
-                key=lambda due: abs(today - due),
-            )
-
-            if due - early <= today <= due + late:
-                events.append({
-                    'kind': event,
-                    'current_round': current_round,
-                    'due': due,
-                })
-
+    events = get_due_round_events(today)
     if events:
-        events.sort(key=lambda d: d['due'])
+        # Show how long each reminder took the last time it was sent, so
+        # slow ones stand out before they're due.
+        latest = {}
+        for metrics in EmailSendMetrics.objects.filter(
+            internship_round__in=set(e['current_round'] for e in events),
+            event__in=set(e['kind'].slug for e in events),
+        ).order_by('recorded'):
+            latest[(metrics.internship_round_id, metrics.event)] = metrics
+        for event in events:
+            event['metrics'] = latest.get((event['current_round'].pk, event['kind'].slug))
+
         return {
             'events': events,
             'today': today,
@@ -990,11 +1118,11 @@ def sponsor_statistics(request, today):
     if not request.user.is_staff:
         return None
 
+    timeline = RoundTimeline.for_request(request, today)
     try:
-        current_round = RoundPage.objects.filter(
+        current_round = timeline.filter(
             pingnew__lte=today,
         ).latest('pingnew')
-        current_round.today = today
     except RoundPage.DoesNotExist:
         return None
 
@@ -1005,12 +1133,12 @@ def staff_intern_progress(request, today):
     if not request.user.is_staff:
         return None
 
+    timeline = RoundTimeline.for_request(request, today)
     try:
-        current_round = RoundPage.objects.get(
+        current_round = timeline.get(
             internstarts__lte=today,
             finalfeedback__gt=today - datetime.timedelta(days=45),
         )
-        current_round.today = today
     except RoundPage.DoesNotExist:
         return None
 
@@ -1021,14 +1149,14 @@ def staff_intern_selection(request, today):
     if not request.user.is_staff:
         return None
 
+    timeline = RoundTimeline.for_request(request, today)
     try:
         # There can't be any interns selected until they start making
         # contributions, so don't display this section until then.
-        current_round = RoundPage.objects.get(
+        current_round = timeline.get(
             contributions_open__lte=today,
             initialfeedback__gt=today + datetime.timedelta(days=7),
         )
-        current_round.today = today
     except RoundPage.DoesNotExist:
         return None
 
@@ -1039,15 +1167,15 @@ def staff_community_progress(request, today):
     if not request.user.is_staff:
         return None
 
+    timeline = RoundTimeline.for_request(request, today)
     try:
         # Show staff this table as soon as communities can start applying to
         # participate in a round, but nothing in it is relevant any more after
         # interns are announced.
-        current_round = RoundPage.objects.get(
+        current_round = timeline.get(
             pingnew__lte=today,
             internannounce__gt=today,
         )
-        current_round.today = today
     except RoundPage.DoesNotExist:
         return None
 
@@ -1094,12 +1222,12 @@ def intern(request, today):
 
 
 def eligibility_prompts(request, today):
+    timeline = RoundTimeline.for_request(request, today)
     try:
-        current_round = RoundPage.objects.get(
+        current_round = timeline.get(
             pingnew__lte=today,
             internannounce__gt=today,
         )
-        current_round.today = today
     except RoundPage.DoesNotExist:
         return None
 
@@ -1130,14 +1258,14 @@ def unselected_intern(request, today):
 
 
 def coordinator_feedback(request, today):
+    timeline = RoundTimeline.for_request(request, today)
     try:
-        current_round = RoundPage.objects.get(
+        current_round = timeline.get(
             internstarts__lte=today,
             # Keep the section visible for 45 days after the final feedback deadline
             # so coordinators can still review late or newly-submitted feedback.
             finalfeedback__gt=today - datetime.timedelta(days=45),
         )
-        current_round.today = today
     except RoundPage.DoesNotExist:
         return None
 
@@ -1161,11 +1289,11 @@ def mentor_projects(request, today):
     # and a mentor will have to select another intern
     # after the intern announcement date.
     # Show their project until the day after their intern starts.
+    timeline = RoundTimeline.for_request(request, today)
     try:
-        current_round = RoundPage.objects.filter(
+        current_round = timeline.filter(
             internstarts__gt=today,
         ).earliest('internstarts')
-        current_round.today = today
     except RoundPage.DoesNotExist:
         return None
 
@@ -1204,9 +1332,9 @@ def approval_status(request, today):
     by_status = defaultdict(list)
     for model in DASHBOARD_MODELS:
         by_model = defaultdict(list)
-        for obj in model.objects_for_dashboard(request.user).distinct():
-            if obj.is_approved() or not obj.submission_and_approval_deadline().has_passed():
-                by_model[obj.approval_status].append(obj)
+        objects = model.objects_for_dashboard(request.user).approved_or_before_deadline(today)
+        for obj in objects.select_related(*model.dashboard_select_related).distinct():
+            by_model[obj.approval_status].append(obj)
 
         label = model._meta.verbose_name
         for status, objects in by_model.items():
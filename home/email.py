@@ -1,10 +1,17 @@
-from django.core.mail import send_mail
-from django.db import transaction
+from django.core import mail
+from django.core.mail import EmailMessage, EmailMultiAlternatives, send_mail
+from django.core.mail.backends.base import BaseEmailBackend
+from django.db import connection as db_connection, transaction
 from django.template import TemplateDoesNotExist
 from django.template.loader import get_template
 from django.test import override_settings, RequestFactory
 from email.headerregistry import Address
+import contextvars
+import hashlib
+import json
 import logging
+import re
+import time
 
 logger = logging.getLogger(__name__)
 
@@ -13,26 +20,437 @@ applicant_help = Address("Outreachy Applicant Helpers", "applicant-help", "outre
 mentors_mailing_list = Address("Outreachy mentors list", "mentors", "lists.outreachy.org")
 opportunities_mailing_list = Address("Outreachy opportunities list", "opportunities", "lists.outreachy.org")
 
+class OutboxBackend(BaseEmailBackend):
+    """
+    Email backend which queues messages in the database instead of sending
+    them, so web requests don't wait on the mail server. Because the messages
+    are saved in the request's transaction, nothing is sent if the request
+    fails. Run the deliver_outbox management command to actually send them,
+    using the backend named in the OUTBOX_EMAIL_BACKEND setting.
+    """
+
+    def send_messages(self, messages):
+        # models.py imports this module, so wait to import it until needed.
+        from .models import OutboundEmail
+        queued = [OutboundEmail.from_message(m) for m in messages if m.recipients()]
+        OutboundEmail.objects.bulk_create(queued)
+        return len(queued)
+
+# The EmailMetrics which is collecting measurements right now, if any.
+current_email_metrics = contextvars.ContextVar('current_email_metrics', default=None)
+
+class EmailMetrics(object):
+    """
+    Context manager which measures the email generated while it's active:
+    how long each template took to render and how many database queries
+    rendering it made, how many messages were produced, and how long it took
+    to hand them to the mail server. On exit, the totals are logged as a
+    single line of JSON.
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self.templates = {}
+        self.messages = 0
+        self.transactions = 0
+        self.delivery_seconds = 0.0
+        self.total_seconds = 0.0
+
+    def __enter__(self):
+        self.token = current_email_metrics.set(self)
+        self.started = time.monotonic()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.total_seconds = time.monotonic() - self.started
+        current_email_metrics.reset(self.token)
+        logger.info("email metrics %s", json.dumps(self.as_dict(), sort_keys=True))
+
+    def render(self, template, context, request):
+        queries = 0
+
+        def count_query(execute, sql, params, many, context):
+            nonlocal queries
+            queries += 1
+            return execute(sql, params, many, context)
+
+        started = time.monotonic()
+        with db_connection.execute_wrapper(count_query):
+            result = template.render(context, request)
+        seconds = time.monotonic() - started
+
+        origin = getattr(template, 'origin', None)
+        name = getattr(origin, 'template_name', None) or str(origin)
+        stats = self.templates.setdefault(name, {'renders': 0, 'seconds': 0.0, 'queries': 0})
+        stats['renders'] += 1
+        stats['seconds'] += seconds
+        stats['queries'] += queries
+        return result
+
+    def record_delivery(self, transactions, seconds):
+        self.transactions += transactions
+        self.delivery_seconds += seconds
+
+    @property
+    def render_seconds(self):
+        return sum(t['seconds'] for t in self.templates.values())
+
+    @property
+    def render_queries(self):
+        return sum(t['queries'] for t in self.templates.values())
+
+    def as_dict(self):
+        return {
+            'name': self.name,
+            'messages': self.messages,
+            'transactions': self.transactions,
+            'render_seconds': round(self.render_seconds, 3),
+            'render_queries': self.render_queries,
+            'delivery_seconds': round(self.delivery_seconds, 3),
+            'total_seconds': round(self.total_seconds, 3),
+            'templates': self.templates,
+        }
+
+def record_email_messages(count):
+    """
+    Tell the active EmailMetrics, if any, that `count` messages were produced.
+    """
+    metrics = current_email_metrics.get()
+    if metrics is not None:
+        metrics.messages += count
+
+def record_email_delivery(transactions, seconds):
+    """
+    Tell the active EmailMetrics, if any, that the mail server took `seconds`
+    to accept `transactions` sends.
+    """
+    metrics = current_email_metrics.get()
+    if metrics is not None:
+        metrics.record_delivery(transactions, seconds)
+
+class BatchingBackend(BaseEmailBackend):
+    """
+    Email backend which wraps another connection and holds on to the messages
+    it is given until it is flushed or closed. Everything is then sent
+    through the wrapped connection, which stays open for the whole run.
+
+    If `merge` is set, messages addressed to a single recipient which are
+    otherwise identical are merged, and Bcc'd to up to `max_recipients`
+    recipients at a time. Only use it for announcements where nobody needs
+    to see their own address in the To header. Messages marked
+    `per_recipient` are never merged.
+
+    Afterward, `messages_received` and `messages_sent` count the messages
+    before and after merging, and `renders` and `renders_skipped` count how
+    often send_template_mail rendered a template and how often it could reuse
+    an earlier rendering instead.
+    """
+
+    # Most mail providers refuse messages with more recipients than this.
+    max_recipients = 50
+
+    def __init__(self, connection=None, max_recipients=None, merge=False, **kwargs):
+        super(BatchingBackend, self).__init__(**kwargs)
+        self.merge = merge
+        self.owns_connection = connection is None
+        if connection is None:
+            connection = mail.get_connection(fail_silently=self.fail_silently)
+        self.connection = connection
+        if max_recipients is not None:
+            self.max_recipients = max_recipients
+        self.groups = {}
+        self.messages_received = 0
+        self.messages_sent = 0
+        self.renders = 0
+        self.renders_skipped = 0
+
+    @staticmethod
+    def batch_key(message):
+        """
+        Hash of everything about a message except its recipient, or None if
+        the message can't be merged with others.
+        """
+        # send_mail always builds an EmailMultiAlternatives, but without any
+        # alternatives it's the same as a plain EmailMessage.
+        if type(message) not in (EmailMessage, EmailMultiAlternatives) or getattr(message, 'alternatives', None):
+            return None
+        if getattr(message, 'per_recipient', False):
+            return None
+        if len(message.to) != 1 or message.cc or message.bcc or message.attachments:
+            return None
+        parts = [str(message.from_email), str(message.subject), message.body]
+        parts.extend(str(a) for a in message.reply_to)
+        parts.extend('{}: {}'.format(k, v) for k, v in sorted(message.extra_headers.items()))
+        return hashlib.sha256('\0'.join(parts).encode()).hexdigest()
+
+    def send_messages(self, messages):
+        record_email_messages(len(messages))
+        for message in messages:
+            self.messages_received += 1
+            key = self.batch_key(message) if self.merge else None
+            if key is None:
+                # Keep messages which can't be merged in their own group.
+                key = id(message)
+            self.groups.setdefault(key, []).append(message)
+        return len(messages)
+
+    def batched_messages(self, group):
+        if len(group) == 1:
+            return group
+        first = group[0]
+        recipients = [message.to[0] for message in group]
+        headers = dict(first.extra_headers)
+        # Don't show everyone the rest of the recipients.
+        headers['To'] = 'undisclosed-recipients:;'
+        return [
+            EmailMessage(
+                subject=first.subject,
+                body=first.body,
+                from_email=first.from_email,
+                bcc=recipients[i:i + self.max_recipients],
+                reply_to=first.reply_to,
+                headers=headers,
+            )
+            for i in range(0, len(recipients), self.max_recipients)
+        ]
+
+    def flush(self):
+        """
+        Send every message collected so far.
+        """
+        messages = []
+        for group in self.groups.values():
+            messages.extend(self.batched_messages(group))
+        self.groups = {}
+        if messages:
+            started = time.monotonic()
+            self.connection.open()
+            sent = self.connection.send_messages(messages) or 0
+            self.messages_sent += sent
+
+            # Queueing messages in the outbox isn't delivering them; the
+            # deliver_outbox command measures that when it really sends them.
+            if not isinstance(self.connection, OutboxBackend):
+                record_email_delivery(sent, time.monotonic() - started)
+
+    def open(self):
+        return self.connection.open()
+
+    def close(self):
+        try:
+            self.flush()
+        finally:
+            if self.owns_connection:
+                self.connection.close()
+        logger.info(
+            "sent %d messages as %d, rendered %d templates and reused %d renders",
+            self.messages_received, self.messages_sent, self.renders, self.renders_skipped)
+
+    def summary(self):
+        return 'Sent {} messages as {} ({} saved); rendered {} templates ({} saved)'.format(
+            self.messages_received,
+            self.messages_sent,
+            self.messages_received - self.messages_sent,
+            self.renders,
+            self.renders_skipped,
+        )
+
+# Tags which pull in other templates. We can follow them when the template
+# name is a string literal, like the email footers.
+template_tags_re = re.compile(r'{%\s*(?:extends|include)\s+(\S+)')
+
+def template_uses_recipient(template):
+    """
+    Guess whether a template's output may depend on the 'recipient' context
+    variable. This errs on the side of saying yes.
+    """
+    return source_uses_recipient(getattr(template, 'template', None), set())
+
+def source_uses_recipient(template, seen):
+    source = getattr(template, 'source', None)
+    engine = getattr(template, 'engine', None)
+    if source is None or engine is None:
+        return True
+    if 'recipient' in source:
+        return True
+    for match in template_tags_re.finditer(source):
+        name = match.group(1)
+        if len(name) < 2 or name[0] not in '\'"' or name[-1] != name[0]:
+            # The name comes from a variable, so it could be anything.
+            return True
+        name = name[1:-1]
+        if name in seen:
+            continue
+        seen.add(name)
+        try:
+            included = engine.get_template(name)
+        except TemplateDoesNotExist:
+            return True
+        if source_uses_recipient(included, seen):
+            return True
+    return False
+
+def count_render(connection, skipped=False):
+    if isinstance(connection, BatchingBackend):
+        if skipped:
+            connection.renders_skipped += 1
+        else:
+            connection.renders += 1
+
+def wants_text(connection, recipients):
+    """
+    Whether the message about to be sent to `recipients` through `connection`
+    needs rendering. Email previews (SendEmailView in home/dashboard.py) only
+    look at the text of a few messages, and just count the rest.
+    """
+    check = getattr(connection, 'wants_text', None)
+    return check is None or check(recipients)
+
 def send_template_mail(template_name, context, recipient_list, request=None, **kwargs):
     # Only load the template once, no matter how many messages we're sending.
     template = get_template(template_name, using='plaintext')
+    # If the template never looks at who it's addressed to, everyone gets
+    # the same message, so only render it once.
+    per_recipient = template_uses_recipient(template)
+    connection = kwargs.get('connection')
+    kwargs.setdefault('from_email', organizers)
+
+    rendered = None
     for recipient in recipient_list:
+        # Django quietly drops messages with no recipients, without handing
+        # them to the connection, so don't tell wants_text about them either.
+        if not recipient:
+            continue
         # Templates used with this function expect the 'recipient' context
         # variable to contain a single address, not a list, so override
         # send_group_template_mail's default.
         context['recipient'] = recipient
-        send_group_template_mail(template, context, [recipient], request, **kwargs)
+        if not wants_text(connection, [recipient]):
+            subject, body = '', ''
+        else:
+            if rendered is None or per_recipient:
+                rendered = render_template_mail(template, context, request)
+                count_render(connection)
+            else:
+                count_render(connection, skipped=True)
+            subject, body = rendered
+        send_mail(message=body, subject=subject, recipient_list=[recipient], **kwargs)
+
+def render_template_mail(template, context, request=None):
+    """
+    Render a plaintext email template, whose first line is the subject, and
+    return the subject and body separately.
+    """
+    metrics = current_email_metrics.get()
+    if metrics is not None:
+        message = metrics.render(template, context, request)
+    else:
+        message = template.render(context, request)
+    message = message.strip()
+    subject, body = message.split('\n', 1)
+    return subject.strip(), body.strip()
 
 def send_group_template_mail(template, context, recipient_list, request=None, **kwargs):
     # Load the specified template name unless it's already a Template object.
     if not hasattr(template, 'render'):
         template = get_template(template, using='plaintext')
 
+    # Django quietly drops messages with no recipients, without handing
+    # them to the connection, so don't tell wants_text about them either.
+    if not any(recipient_list):
+        return
+
     context.setdefault('recipient', recipient_list)
-    message = template.render(context, request).strip()
-    subject, body = message.split('\n', 1)
+    connection = kwargs.get('connection')
+    if wants_text(connection, recipient_list):
+        subject, body = render_template_mail(template, context, request)
+        count_render(connection)
+    else:
+        subject, body = '', ''
     kwargs.setdefault('from_email', organizers)
-    send_mail(message=body.strip(), subject=subject.strip(), recipient_list=recipient_list, **kwargs)
+    send_mail(message=body, subject=subject, recipient_list=recipient_list, **kwargs)
+
+def send_bulk_template_mail(template, objects, get_context, request=None, checkpoint=None, chunk_size=200, connection=None, from_email=organizers):
+    """
+    Send one message to each object in the queryset `objects`. `get_context`
+    is called with each object and returns the template context, including
+    a single 'recipient' address; objects with no recipient are skipped.
+
+    Objects are loaded in chunks in primary key order, so any
+    select_related or prefetch_related on the queryset is done once per
+    chunk, and each chunk's messages are handed to the connection together.
+
+    If `checkpoint` names this send, progress is saved after every chunk.
+    When a send is interrupted, running it again with the same name picks up
+    after the last chunk which was sent, instead of emailing everyone again.
+    The checkpoint is removed once every message has been sent.
+
+    Returns the number of messages sent.
+    """
+    # models.py imports this module, so wait to import it until needed.
+    from .models import BulkEmailCheckpoint
+
+    if not hasattr(template, 'render'):
+        template = get_template(template, using='plaintext')
+    if connection is None:
+        connection = mail.get_connection()
+    # Messages from templates which greet people by name mustn't be merged
+    # into one Bcc'd message, even if two of them come out the same.
+    per_recipient = template_uses_recipient(template)
+
+    last_pk = None
+    total = 0
+    if checkpoint is not None:
+        try:
+            progress = BulkEmailCheckpoint.objects.get(name=checkpoint)
+        except BulkEmailCheckpoint.DoesNotExist:
+            pass
+        else:
+            last_pk = progress.last_pk
+            total = progress.sent
+            logger.info("resuming %s after %s, with %d messages already sent", checkpoint, last_pk, total)
+
+    objects = objects.order_by('pk')
+    while True:
+        chunk = objects
+        if last_pk is not None:
+            chunk = chunk.filter(pk__gt=last_pk)
+        chunk = list(chunk[:chunk_size])
+        if not chunk:
+            break
+
+        messages = []
+        for obj in chunk:
+            context = get_context(obj)
+            recipient = context.get('recipient')
+            if not recipient:
+                continue
+            if wants_text(connection, [recipient]):
+                subject, body = render_template_mail(template, context, request)
+                count_render(connection)
+            else:
+                subject, body = '', ''
+            message = EmailMessage(subject, body, from_email, [recipient], connection=connection)
+            message.per_recipient = per_recipient
+            messages.append(message)
+        last_pk = chunk[-1].pk
+
+        # If the connection saves messages in the database, save them
+        # together with the checkpoint so a crash can't lose or repeat them.
+        with transaction.atomic():
+            if messages:
+                total += connection.send_messages(messages) or 0
+            if isinstance(connection, BatchingBackend):
+                connection.flush()
+            if checkpoint is not None:
+                BulkEmailCheckpoint.objects.update_or_create(name=checkpoint, defaults={
+                    'last_pk': last_pk,
+                    'sent': total,
+                })
+
+    if checkpoint is not None:
+        BulkEmailCheckpoint.objects.filter(name=checkpoint).delete()
+    return total
 
 def approval_status_changed(obj, request, **kwargs):
     get_recipients = {
@@ -239,30 +657,39 @@ def applicant_school_info_needs_updated(applicant, request):
         from_email=applicant_help,
         recipient_list=[applicant.email_address()])
 
-def contributor_deadline_reminder(contributor, current_round, request, **kwargs):
+def contributor_context(application, current_round):
+    """
+    Template context for emailing a contributor about their application to
+    current_round. The caller should select_related 'applicant__account'.
+    """
     from .models import Role # oops, circular import dependency :-(
-    send_template_mail('home/email/contributors-deadline-reminder.txt', {
+    contributor = application.applicant
+    # only use information available to the subject, not to request.user
+    role = Role(contributor.account, current_round)
+    # We already have the application Role would look up.
+    role.__dict__['application'] = application
+    return {
         'current_round': current_round,
-        # only use information available to the subject, not to request.user
-        'role': Role(contributor.account, current_round),
+        'role': role,
         'timezone': contributor.timezone,
         'comrade': contributor,
-        },
+        'recipient': contributor.email_address(),
+    }
+
+def contributors_deadline_reminder(applications, current_round, request, **kwargs):
+    return send_bulk_template_mail(
+        'home/email/contributors-deadline-reminder.txt',
+        applications,
+        lambda application: contributor_context(application, current_round),
         request=request,
-        recipient_list=[contributor.email_address()],
         **kwargs)
 
-def contributor_application_period_ended(contributor, current_round, request, **kwargs):
-    from .models import Role # oops, circular import dependency :-(
-    send_template_mail('home/email/contributors_application_period_ended.txt', {
-        'current_round': current_round,
-        # only use information available to the subject, not to request.user
-        'role': Role(contributor.account, current_round),
-        'timezone': contributor.timezone,
-        'comrade': contributor,
-        },
+def contributors_application_period_ended(applications, current_round, request, **kwargs):
+    return send_bulk_template_mail(
+        'home/email/contributors_application_period_ended.txt',
+        applications,
+        lambda application: contributor_context(application, current_round),
         request=request,
-        recipient_list=[contributor.email_address()],
         **kwargs)
 
 def notify_accepted_intern(intern_selection, request, **kwargs):
@@ -1,13 +1,23 @@
 from collections import namedtuple
-import datetime
 from django.contrib.auth.models import User
 from django.contrib.syndication.views import Feed
+from django.core.cache import cache
 from django.core.exceptions import ObjectDoesNotExist
-from django.urls import reverse
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response
 from django.utils.feedgenerator import Atom1Feed
+from django.utils.http import http_date, quote_etag
+import hashlib
 import operator
-# TODO: please replace the usage of pytz with the native timezone support introduced in Python 3.9
-from pytz import timezone
+
+from . import blog
+
+# Blog posts in home/blog.py only change when the code is deployed, so give
+# each version of that list its own cached feeds.
+BLOG_POSTS_VERSION = hashlib.md5(repr([
+    (post.path, post.title, post.first_published_at, post.last_published_at)
+    for post in blog.POSTS
+]).encode()).hexdigest()
 
 
 class FullHistoryFeed(Atom1Feed):
@@ -41,6 +51,63 @@ PseudoPage.__doc__ = "Just enough like Wagtail's Page model to work as an item o
 class WagtailFeed(Feed):
     feed_type = FullHistoryFeed
 
+    def __call__(self, request, page):
+        """
+        Feed readers ask for the feed over and over, so send the cached copy,
+        or just "304 Not Modified" if they already have it.
+        """
+        key = self.cache_key(page, request) + ':response'
+        cached = cache.get(key)
+        if cached is None:
+            feedgen = self.get_feed(page, request)
+            content = feedgen.writeString('utf-8').encode('utf-8')
+            cached = {
+                'content': content,
+                'content_type': feedgen.content_type,
+                'etag': quote_etag(hashlib.md5(content).hexdigest()),
+                'last_modified': feedgen.latest_post_date().timestamp(),
+            }
+            cache.set(key, cached, self.cache_timeout())
+
+        etag = cached['etag']
+        last_modified = cached['last_modified']
+        response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+        if response is None:
+            response = HttpResponse(cached['content'], content_type=cached['content_type'])
+        response.headers['ETag'] = etag
+        response.headers['Last-Modified'] = http_date(last_modified)
+        return response
+
+    def cache_key(self, obj, request):
+        """
+        Both the feed and the blog index page are cached until a Wagtail page
+        is published or unpublished.
+        """
+        # models.py imports this module, so wait to import it until needed.
+        from .models import BLOG_FEED_GENERATION_KEY, cache_generation
+
+        # Links in the feed include the host name, and the feed's own URL.
+        url = '{}://{}{}'.format(request.scheme, request.get_host(), request.path)
+        return 'blog-feed:{}:{}:{}:{}'.format(
+            obj.pk,
+            hashlib.md5(url.encode()).hexdigest(),
+            BLOG_POSTS_VERSION,
+            cache_generation(BLOG_FEED_GENERATION_KEY),
+        )
+
+    def cache_timeout(self):
+        # models.py imports this module, so wait to import it until needed.
+        from .models import BLOG_FEED_TIMEOUT
+        return BLOG_FEED_TIMEOUT
+
+    def get_feed(self, obj, request):
+        key = self.cache_key(obj, request)
+        feedgen = cache.get(key)
+        if feedgen is None:
+            feedgen = super(WagtailFeed, self).get_feed(obj, request)
+            cache.set(key, feedgen, self.cache_timeout())
+        return feedgen
+
     def get_object(self, request, page):
         return page
 
@@ -55,16 +122,13 @@ class WagtailFeed(Feed):
 
         # add special posts that aren't stored as Wagtail pages
 
-        staff = User.objects.filter(is_staff=True, comrade__isnull=False)
+        staff = User.objects.filter(is_staff=True, comrade__isnull=False).select_related('comrade')
         try:
             author = staff.get(username='sage')
         except User.DoesNotExist:
             author = staff[0]
 
-        pacific = timezone('US/Pacific')
-
-        # Append blog pages created with Django here.
-        # Append the newest blog post last.
+        # Blog posts written as Django templates are listed in home/blog.py.
         #
         # These blog posts will automatically show up in the RSS feed,
         # and show up on the blog index page
@@ -75,252 +139,14 @@ class WagtailFeed(Feed):
         #
         # TODO: FIXME: Move all blog posts from Wagtail into Django templates,
         # and stop using a Wagtail page.
-        items.append(PseudoPage(
-            title='Schedule changes for Outreachy',
-            full_url=reverse('blog-schedule-changes'),
-            owner=author,
-            first_published_at=pacific.localize(datetime.datetime(2019, 7, 23, 15, 5, 1)),
-            last_published_at=pacific.localize(datetime.datetime(2019, 7, 24, 16, 5, 38)),
-        ))
-
-        items.append(PseudoPage(
-            title='Picking an Outreachy Project - December 2019 round',
-            full_url=reverse('2019-12-pick-a-project'),
-            owner=author,
-            first_published_at=pacific.localize(datetime.datetime(2019, 10, 1, 7, 26, 0)),
-            last_published_at=pacific.localize(datetime.datetime(2019, 10, 4, 12, 49, 0)),
-        ))
-        items.append(PseudoPage(
-            title='Projects that need more applicants - December 2019 round',
-            full_url=reverse('2019-12-project-promotion'),
-            owner=author,
-            first_published_at=pacific.localize(datetime.datetime(2019, 10, 17, 17, 38, 0)),
-            last_published_at=pacific.localize(datetime.datetime(2019, 10, 17, 17, 38, 0)),
-        ))
-        items.append(PseudoPage(
-            title='Outreachy response to COVID-19',
-            full_url=reverse('2020-03-covid'),
-            owner=author,
-            first_published_at=pacific.localize(datetime.datetime(2020, 3, 27, 16, 00, 0)),
-            last_published_at=pacific.localize(datetime.datetime(2020, 5, 1, 16, 00, 0)),
-        ))
-        items.append(PseudoPage(
-            title='December 2020 internship applications open',
-            full_url=reverse('2020-08-initial-apps-open'),
-            owner=author,
-            first_published_at=pacific.localize(datetime.datetime(2020, 8, 28, 9, 00, 0)),
-            last_published_at=pacific.localize(datetime.datetime(2020, 8, 28, 9, 00, 0)),
-        ))
-        items.append(PseudoPage(
-            title='Call for May 2021 mentoring communities',
-            full_url=reverse('2021-01-community-cfp-open'),
-            owner=author,
-            first_published_at=pacific.localize(datetime.datetime(2021, 1, 15, 11, 00, 0)),
-            last_published_at=pacific.localize(datetime.datetime(2021, 1, 15, 11, 00, 0)),
-        ))
-        items.append(PseudoPage(
-            title='Initial applications open for May 2021 internships',
-            full_url=reverse('2021-01-initial-applications-open'),
-            owner=author,
-            first_published_at=pacific.localize(datetime.datetime(2021, 2, 1, 14, 00, 0)),
-            last_published_at=pacific.localize(datetime.datetime(2021, 2, 1, 14, 00, 0)),
-        ))
-        items.append(PseudoPage(
-            title='Outreachy bars FSF from participation in its program',
-            full_url=reverse('2021-03-fsf-participation-barred'),
-            owner=author,
-            first_published_at=pacific.localize(datetime.datetime(2021, 3, 23, 14, 00, 0)),
-            last_published_at=pacific.localize(datetime.datetime(2021, 3, 23, 14, 00, 0)),
-        ))
-        items.append(PseudoPage(
-            title='Outreachy May 2021 contribution period open',
-            full_url=reverse('2021-03-contribution-period-open'),
-            owner=author,
-            first_published_at=pacific.localize(datetime.datetime(2021, 3, 30, 16, 00, 0)),
-            last_published_at=pacific.localize(datetime.datetime(2021, 3, 30, 16, 00, 0)),
-        ))
-        items.append(PseudoPage(
-            title='Outreachy December 2021 internship applications open',
-            full_url=reverse('2021-08-initial-applications-open'),
-            owner=author,
-            first_published_at=pacific.localize(datetime.datetime(2021, 8, 13, 16, 00, 0)),
-            last_published_at=pacific.localize(datetime.datetime(2021, 8, 18, 16, 00, 0)),
-        ))
-        items.append(PseudoPage(
-            title='Call for December 2021 mentoring communities',
-            full_url=reverse('2021-08-cfp-open'),
-            owner=author,
-            first_published_at=pacific.localize(datetime.datetime(2021, 8, 18, 16, 00, 0)),
-            last_published_at=pacific.localize(datetime.datetime(2021, 8, 18, 16, 00, 0)),
-        ))
-        items.append(PseudoPage(
-            title='Hiring for an Outreachy community manager',
-            full_url=reverse('2021-10-outreachy-hiring'),
-            owner=author,
-            first_published_at=pacific.localize(datetime.datetime(2021, 10, 14, 17, 25, 0)),
-            last_published_at=pacific.localize(datetime.datetime(2021, 10, 15, 16, 20, 0)),
-        ))
-        items.append(PseudoPage(
-            title='Call for May 2022 mentoring communities',
-            full_url=reverse('2022-01-cfp-open'),
-            owner=author,
-            first_published_at=pacific.localize(datetime.datetime(2022, 1, 10, 16, 00, 0)),
-            last_published_at=pacific.localize(datetime.datetime(2021, 1, 10, 16, 00, 0)),
-        ))
-        items.append(PseudoPage(
-            title='Outreachy May 2022 internship applications',
-            full_url=reverse('2022-02-initial-applications-open'),
-            owner=author,
-            first_published_at=pacific.localize(datetime.datetime(2022, 2, 4, 16, 00, 0)),
-            last_published_at=pacific.localize(datetime.datetime(2022, 2, 4, 16, 00, 0)),
-        ))
-        items.append(PseudoPage(
-            title='Outreachy welcomes new community manager',
-            full_url=reverse('2022-04-new-community-manager'),
-            owner=author,
-            first_published_at=pacific.localize(datetime.datetime(2022, 4, 15, 16, 00, 0)),
-            last_published_at=pacific.localize(datetime.datetime(2022, 4, 15, 16, 00, 0)),
-        ))
-        items.append(PseudoPage(
-            title='Remembering and Honoring Marina Zhurakhinskaya, Founder of Outreachy',
-            full_url=reverse('2022-06-remembering-marina'),
-            owner=author,
-            first_published_at=pacific.localize(datetime.datetime(2022, 6, 15, 3, 00, 0)),
-            last_published_at=pacific.localize(datetime.datetime(2022, 6, 15, 14, 00, 0)),
-        ))
-        items.append(PseudoPage(
-            title='Outreachy December 2022 internship applications',
-            full_url=reverse('2022-08-initial-applications-open'),
-            owner=author,
-            first_published_at=pacific.localize(datetime.datetime(2022, 8, 9, 15, 00, 0)),
-            last_published_at=pacific.localize(datetime.datetime(2022, 8, 9, 15, 5, 0)),
-        ))
-        items.append(PseudoPage(
-            title='Thank you December 2022 mentors and coordinators!',
-            full_url=reverse('2022-12-thank-you'),
-            owner=author,
-            first_published_at=pacific.localize(datetime.datetime(2022, 12, 5, 14, 00, 0)),
-            last_published_at=pacific.localize(datetime.datetime(2022, 12, 5, 14, 00, 0)),
-        ))
-        items.append(PseudoPage(
-            title='Call for May 2023 mentoring communities',
-            full_url=reverse('2023-01-cfp-open'),
-            owner=author,
-            first_published_at=pacific.localize(datetime.datetime(2023, 1, 5, 16, 00, 0)),
-            last_published_at=pacific.localize(datetime.datetime(2023, 1, 5, 16, 00, 0)),
-        ))
-        items.append(PseudoPage(
-            title='Outreachy May 2023 internship applications open',
-            full_url=reverse('2023-01-initial-applications-open'),
-            owner=author,
-            first_published_at=pacific.localize(datetime.datetime(2023, 1, 16, 2, 00, 0)),
-            last_published_at=pacific.localize(datetime.datetime(2023, 1, 16, 2, 00, 0)),
-        ))
-        items.append(PseudoPage(
-            title='Call for December 2023 mentoring communities',
-            full_url=reverse('2023-08-cfp-open'),
-            owner=author,
-            first_published_at=pacific.localize(datetime.datetime(2023, 8, 1, 16, 00, 0)),
-            last_published_at=pacific.localize(datetime.datetime(2023, 8, 1, 16, 00, 0)),
-        ))
-        items.append(PseudoPage(
-            title='Outreachy December 2023 internship applications open',
-            full_url=reverse('2023-08-initial-applications-open'),
-            owner=author,
-            first_published_at=pacific.localize(datetime.datetime(2023, 8, 8, 16, 00, 0)),
-            last_published_at=pacific.localize(datetime.datetime(2023, 8, 8, 16, 00, 0)),
-        ))
-        items.append(PseudoPage(
-            title='Outreachy welcomes mentor advocate',
-            full_url=reverse('2023-08-tilda'),
-            owner=author,
-            first_published_at=pacific.localize(datetime.datetime(2023, 8, 25, 1, 00, 0)),
-            last_published_at=pacific.localize(datetime.datetime(2023, 8, 25, 1, 00, 0)),
-        ))
-        items.append(PseudoPage(
-            title='Call for May 2024 mentoring communities',
-            full_url=reverse('2024-01-cfp-open'),
-            owner=author,
-            first_published_at=pacific.localize(datetime.datetime(2024, 1, 8, 16, 00, 0)),
-            last_published_at=pacific.localize(datetime.datetime(2024, 1, 8, 16, 00, 0)),
-        ))
-        items.append(PseudoPage(
-            title='Outreachy 2023: Year in Review',
-            full_url=reverse('outreachy-2023-year-in-review'),
-            owner=author,
-            first_published_at=pacific.localize(datetime.datetime(2024, 1, 11, 12, 00, 0)),
-            last_published_at=pacific.localize(datetime.datetime(2024, 1, 11, 12, 00, 0)),
-        ))
-        items.append(PseudoPage(
-            title='Outreachy May 2024 internship applications open',
-            full_url=reverse('2024-01-initial-applications-open'),
-            owner=author,
-            first_published_at=pacific.localize(datetime.datetime(2024, 1, 15, 21, 15, 0)),
-            last_published_at=pacific.localize(datetime.datetime(2024, 1, 15, 21, 15, 0)),
-        ))
-        items.append(PseudoPage(
-            title='Outreachy Mentor Spotlight: Agien Petra',
-            full_url=reverse('2024-04-mentor-spotlight-agien-petra'),
-            owner=author,
-            first_published_at=pacific.localize(datetime.datetime(2024, 4, 3, 13, 00, 0)),
-            last_published_at=pacific.localize(datetime.datetime(2024, 4, 3, 13, 00, 0)),
-        ))
-        items.append(PseudoPage(
-            title='Outreachy Impact: Intern Stories with Ahmed & Rafiat',
-            full_url=reverse('2024-07-outreachy-impact-ahmed-rafiat'),
-            owner=author,
-            first_published_at=pacific.localize(datetime.datetime(2024, 7, 19, 13, 00, 0)),
-            last_published_at=pacific.localize(datetime.datetime(2024, 7, 19, 13, 00, 0)),
-        ))
-        items.append(PseudoPage(
-            title='Outreachy Needs Your Help!',
-            full_url=reverse('2024-08-outreachy-needs-your-help'),
-            owner=author,
-            first_published_at=pacific.localize(datetime.datetime(2024, 8, 14, 13, 00, 0)),
-            last_published_at=pacific.localize(datetime.datetime(2024, 8, 14, 13, 00, 0)),
-        ))
-        items.append(PseudoPage(
-            title='Call for June 2025 mentoring communities',
-            full_url=reverse('2025-01-cfp-open'),
-            owner=author,
-            first_published_at=pacific.localize(datetime.datetime(2025, 1, 20, 16, 00, 0)),
-            last_published_at=pacific.localize(datetime.datetime(2025, 1, 20, 16, 00, 0)),
-        ))
-        items.append(PseudoPage(
-            title='Outreachy June 2025 internship applications open',
-            full_url=reverse('2025-01-initial-applications-open'),
-            owner=author,
-            first_published_at=pacific.localize(datetime.datetime(2025, 1, 21, 16, 00, 0)),
-            last_published_at=pacific.localize(datetime.datetime(2025, 1, 21, 16, 00, 0)),
-        ))
-        items.append(PseudoPage(
-            title='Call for December 2025 mentoring communities',
-            full_url=reverse('2025-08-cfp-open'),
-            owner=author,
-            first_published_at=pacific.localize(datetime.datetime(2025, 8, 14, 16, 00, 0)),
-            last_published_at=pacific.localize(datetime.datetime(2025, 8, 14, 16, 00, 0)),
-        ))
-        items.append(PseudoPage(
-            title='Outreachy December 2025 internship applications open',
-            full_url=reverse('2025-08-25-initial-applications-open'),
-            owner=author,
-            first_published_at=pacific.localize(datetime.datetime(2025, 8, 25, 16, 00, 0)),
-            last_published_at=pacific.localize(datetime.datetime(2025, 8, 25, 16, 00, 0)),
-        ))
-        items.append(PseudoPage(
-            title='Call for May 2026 mentoring communities',
-            full_url=reverse('2026-02-cfp-open'),
-            owner=author,
-            first_published_at=pacific.localize(datetime.datetime(2026, 2, 6, 16, 00, 0)),
-            last_published_at=pacific.localize(datetime.datetime(2026, 2, 6, 16, 00, 0)),
-        ))
-        items.append(PseudoPage(
-            title='Outreachy May 2026 internship applications open',
-            full_url=reverse('2026-02-initial-applications-open'),
-            owner=author,
-            first_published_at=pacific.localize(datetime.datetime(2026, 2, 6, 16, 00, 0)),
-            last_published_at=pacific.localize(datetime.datetime(2026, 2, 6, 16, 00, 0)),
-        ))
+        for post in blog.POSTS:
+            items.append(PseudoPage(
+                title=post.title,
+                full_url=post.get_absolute_url(),
+                owner=author,
+                first_published_at=post.first_published_at,
+                last_published_at=post.last_published_at,
+            ))
 
         # put the Wagtail pages and special posts together in the right order
         items.sort(key=operator.attrgetter('first_published_at'), reverse=True)
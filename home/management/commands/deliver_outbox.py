@@ -0,0 +1,53 @@
+import time
+from django.conf import settings
+from django.core import mail
+from django.core.management.base import BaseCommand, CommandError
+from django.db import close_old_connections
+from django.utils.module_loading import import_string
+from home.email import EmailMetrics, OutboxBackend
+from home.models import OutboundEmail
+
+class Command(BaseCommand):
+    help = 'Sends email which the web site has queued in the outbox'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=100, help='How many messages to claim from the outbox at once.')
+        parser.add_argument('--loop', action='store_true', help='Keep checking for new messages instead of exiting once the outbox is empty.')
+        parser.add_argument('--interval', type=float, default=10, help='Seconds to wait between checks when using --loop.')
+
+    def handle(self, *args, **options):
+        backend = settings.OUTBOX_EMAIL_BACKEND
+        if issubclass(import_string(backend), OutboxBackend):
+            raise CommandError('OUTBOX_EMAIL_BACKEND must be a backend which really sends email')
+
+        while True:
+            self.drain(backend, options['batch_size'])
+            if not options['loop']:
+                break
+            time.sleep(options['interval'])
+            # Don't hold a database connection which may have gone stale.
+            close_old_connections()
+
+    def drain(self, backend, batch_size):
+        total_sent = total_failed = 0
+
+        delivery_seconds = 0.0
+
+        # Only connect to the mail server if there's something to send, but
+        # then reuse the connection for every batch.
+        if OutboundEmail.objects.filter(status=OutboundEmail.QUEUED).exists():
+            # EmailMetrics logs how long the mail server took to accept them.
+            with EmailMetrics('deliver_outbox') as metrics, mail.get_connection(backend) as connection:
+                while True:
+                    sent, failed = OutboundEmail.deliver(connection, limit=batch_size)
+                    total_sent += sent
+                    total_failed += failed
+                    if sent + failed < batch_size:
+                        break
+            delivery_seconds = metrics.delivery_seconds
+
+        purged = OutboundEmail.purge_sent()
+
+        if total_sent or total_failed or purged:
+            self.stdout.write('Sent {} messages, {} failed, purged {} old messages; delivery took {:.1f}s'.format(
+                total_sent, total_failed, purged, delivery_seconds))
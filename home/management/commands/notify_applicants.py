@@ -1,10 +1,9 @@
 import datetime
 from django.core import mail
 from django.core.management.base import BaseCommand
-from django.template.loader import get_template
 from email.headerregistry import Address
-from home.email import send_group_template_mail
-from home.models import RoundPage, ApprovalStatus, get_deadline_date_for
+from home.email import send_bulk_template_mail
+from home.models import BulkEmailCheckpoint, RoundPage, get_deadline_date_for
 
 class Command(BaseCommand):
     help = 'Sends email updates about current-round initial applications'
@@ -13,6 +12,8 @@ class Command(BaseCommand):
         parser.add_argument('--scheme', default='https', choices=('http', 'https'), help='Scheme for web site links.')
         parser.add_argument('--server', default='www.outreachy.org', help='Hostname for web site links.')
 
+        parser.add_argument('--restart', action='store_true', help='Forget how far an interrupted run got, and email everyone again.')
+
         parser.add_argument('message', choices=(
             'received',
             'approved',
@@ -39,14 +40,28 @@ class Command(BaseCommand):
             template_name = "home/email/applicantapproval-approved.txt"
             applicants = current_round.applicantapproval_set.approved()
 
-        template = get_template(template_name, using='plaintext')
         applicant_help = Address("Outreachy Applicant Helpers", "applicant-help", "outreachy.org")
 
+        # If this command dies partway through, running it again continues
+        # from where it stopped.
+        checkpoint = 'notify_applicants:{}:{}'.format(options['message'], current_round.slug)
+        if options['restart']:
+            BulkEmailCheckpoint.objects.filter(name=checkpoint).delete()
+
+        def get_context(application):
+            return {
+                'application': application,
+                'recipient': application.applicant.email_address(),
+            }
 
         with mail.get_connection() as connection:
-            for application in applicants.iterator():
-                recipient = application.applicant.email_address()
-                send_group_template_mail(template, {
-                    'application': application,
-                    'recipient': recipient,
-                }, [recipient], from_email=applicant_help, request=request, connection=connection)
+            sent = send_bulk_template_mail(
+                template_name,
+                applicants.select_related('applicant__account', 'application_round'),
+                get_context,
+                request=request,
+                checkpoint=checkpoint,
+                connection=connection,
+                from_email=applicant_help,
+            )
+        self.stdout.write('Sent {} messages'.format(sent))
@@ -0,0 +1,51 @@
+from django.conf import settings
+from django.contrib.auth.models import AnonymousUser
+from django.core.management.base import BaseCommand, CommandError
+from django.test import RequestFactory
+import gzip
+import os
+import shutil
+
+from home import blog
+from home import views
+
+class Command(BaseCommand):
+    help = 'Renders every blog post in home.blog.POSTS to a static HTML file, as seen by a visitor who is not logged in'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--output', metavar='DIR', help='Where to write the pages (default: settings.PRERENDERED_ROOT).')
+        parser.add_argument('--scheme', default='https', choices=('http', 'https'), help='Scheme for web site links.')
+        parser.add_argument('--server', default='www.outreachy.org', help='Hostname for web site links.')
+
+    def handle(self, *args, **options):
+        root = options['output'] or settings.PRERENDERED_ROOT
+
+        # Render everything before touching the old copies, so a broken post
+        # doesn't leave the site with none.
+        factory = RequestFactory()
+        pages = []
+        for post in blog.POSTS:
+            url = post.get_absolute_url()
+            request = factory.get(
+                url,
+                secure=options['scheme'] == 'https',
+                HTTP_HOST=options['server'],
+            )
+            request.user = AnonymousUser()
+            response = views.blog_post(request, post)
+            if response.status_code != 200:
+                raise CommandError('{} returned status {}'.format(url, response.status_code))
+            pages.append((url, response.content))
+
+        shutil.rmtree(root, ignore_errors=True)
+        for url, content in pages:
+            directory = os.path.join(root, *url.strip('/').split('/'))
+            os.makedirs(directory, exist_ok=True)
+            path = os.path.join(directory, 'index.html')
+            with open(path, 'wb') as f:
+                f.write(content)
+            # WhiteNoise serves this to browsers which accept gzip.
+            with gzip.GzipFile(path + '.gz', 'wb', mtime=0) as f:
+                f.write(content)
+
+        self.stdout.write('Rendered {} blog posts to {}'.format(len(pages), root))
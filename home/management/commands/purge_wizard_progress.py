@@ -0,0 +1,9 @@
+from django.core.management.base import BaseCommand
+from home.models import WizardProgress
+
+class Command(BaseCommand):
+    help = 'Deletes form wizard progress which has been abandoned for longer than a session would last'
+
+    def handle(self, *args, **options):
+        count = WizardProgress.purge_expired()
+        self.stdout.write('Deleted {} abandoned wizards'.format(count))
@@ -0,0 +1,80 @@
+import datetime
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from home.dashboard import get_due_round_events, update_round_event_calendar
+from home.email import EmailMetrics
+from home.models import EmailSendMetrics, RoundPage, get_deadline_date_for
+
+class Command(BaseCommand):
+    help = 'Lists or sends the staff email reminders which are due around today'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--date', type=datetime.date.fromisoformat, help='Act as if today were this date (YYYY-MM-DD).')
+        parser.add_argument('--rebuild', action='store_true', help='Regenerate the reminder calendar for every round first.')
+
+        parser.add_argument('--send', metavar='EVENT', help='Send the reminder with this slug, as listed by this command.')
+        parser.add_argument('--round', metavar='ROUND_SLUG', help='Which round to send the reminder for, if it is due for more than one.')
+        parser.add_argument('--user', metavar='USERNAME', help='Staff account to send the reminder as.')
+        parser.add_argument('--force', action='store_true', help='Really send email (default: dry-run)')
+
+        parser.add_argument('--scheme', default='https', choices=('http', 'https'), help='Scheme for web site links.')
+        parser.add_argument('--server', default='www.outreachy.org', help='Hostname for web site links.')
+
+    def handle(self, *args, **options):
+        if options['rebuild']:
+            rounds = RoundPage.objects.all()
+            for current_round in rounds:
+                update_round_event_calendar(current_round)
+            self.stdout.write('Rebuilt reminder calendar for {} rounds'.format(len(rounds)))
+
+        today = options['date']
+        if today is None:
+            now = datetime.datetime.now(datetime.timezone.utc)
+            today = get_deadline_date_for(now)
+
+        events = get_due_round_events(today)
+
+        if not options['send']:
+            for event in events:
+                self.stdout.write('{due} {round} {slug}: {description}'.format(
+                    due=event['due'],
+                    round=event['current_round'].slug,
+                    slug=event['kind'].slug,
+                    description=event['kind'].description,
+                ))
+            return
+
+        events = [e for e in events if e['kind'].slug == options['send']]
+        if options['round']:
+            events = [e for e in events if e['current_round'].slug == options['round']]
+        if not events:
+            raise CommandError('{} is not due around {}'.format(options['send'], today))
+        if len(events) > 1:
+            raise CommandError('{} is due for more than one round; pick one with --round'.format(options['send']))
+        event = events[0]
+
+        if not User.objects.filter(username=options['user'], is_staff=True).exists():
+            raise CommandError('--user must name a staff account')
+
+        request = {
+            'scheme': options['scheme'],
+            'get_host': options['server'],
+        }
+        view = event['kind']()
+        view.request = request
+
+        if not options['force']:
+            # The view is also an email backend which just collects messages.
+            view.start_preview()
+            with EmailMetrics(event['kind'].slug):
+                view.generate_messages(current_round=event['current_round'], connection=view)
+            self.stdout.write('Would send {} messages; use --force to send them'.format(view.message_count))
+            return
+
+        with EmailMetrics(event['kind'].slug) as metrics:
+            with view.sending_connection() as connection:
+                view.generate_messages(current_round=event['current_round'], connection=connection)
+        EmailSendMetrics.record(metrics, event['current_round'], event['kind'].slug)
+        self.stdout.write(connection.summary())
+        self.stdout.write('Rendering took {:.1f}s and {} queries; delivery took {:.1f}s'.format(
+            metrics.render_seconds, metrics.render_queries, metrics.delivery_seconds))
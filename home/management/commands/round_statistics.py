@@ -0,0 +1,35 @@
+from django.core.management.base import BaseCommand, CommandError
+from home.models import RoundPage, RoundStatisticsSnapshot
+
+class Command(BaseCommand):
+    help = 'Updates the statistics shown for each round whose application period has closed'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--round', metavar='ROUND_SLUG', help='Only update this round.')
+        parser.add_argument('--refreeze', action='store_true', help='Also recompute rounds whose statistics are already frozen.')
+
+    def handle(self, *args, **options):
+        rounds = RoundPage.objects.select_related('roundstatisticssnapshot').order_by('internstarts')
+        if options['round']:
+            rounds = rounds.filter(slug=options['round'])
+            if not rounds:
+                raise CommandError('No round with slug {}'.format(options['round']))
+
+        for current_round in rounds:
+            # There's nothing to report until the application period closes.
+            if not current_round.contributions_close.has_passed():
+                continue
+
+            try:
+                snapshot = current_round.roundstatisticssnapshot
+            except RoundStatisticsSnapshot.DoesNotExist:
+                snapshot = RoundStatisticsSnapshot(internship_round=current_round)
+
+            if snapshot.frozen and not options['refreeze']:
+                continue
+
+            snapshot.update()
+            self.stdout.write('{}: {}'.format(
+                current_round.slug,
+                'frozen' if snapshot.frozen else 'updated',
+            ))
@@ -0,0 +1,128 @@
+import datetime
+import random
+import timeit
+from itertools import groupby
+from django.core.management.base import BaseCommand, CommandError
+from home.models import ApplicantApproval, RoundPage
+from home.models import create_time_commitment_calendar, find_longest_free_period
+
+def create_time_commitment_calendar_by_day(tcs, application_round):
+    """
+    The original calendar implementation, which checks every day of the
+    internship against every time commitment.
+    """
+    application_period_length = (application_round.internends - application_round.internstarts).days + 1
+    calendar = [0]*(application_period_length)
+    for tc in tcs:
+        date = application_round.internstarts
+        for i in range(application_period_length):
+            if date >= tc['start_date'] and date <= tc['end_date']:
+                calendar[i] = calendar[i] + tc['hours']
+            date = date + datetime.timedelta(days=1)
+    return calendar
+
+def find_longest_free_period_by_groupby(calendar):
+    """
+    The original search for the longest free period, from
+    ApplicantApproval.get_time_commitments.
+    """
+    longest_period_free = 0
+    free_period_start_day = 0
+    for key, group in groupby(enumerate(calendar), lambda day: day[1] <= 20):
+        group = list(group)
+        if key is True and len(group) > longest_period_free:
+            longest_period_free = len(group)
+            free_period_start_day = group[0][0]
+    return free_period_start_day, longest_period_free
+
+def random_time_commitments(application_round, count):
+    nearby = datetime.timedelta(days=90)
+    earliest = application_round.internstarts - nearby
+    span = (application_round.internends + nearby - earliest).days
+    tcs = []
+    for i in range(count):
+        start = earliest + datetime.timedelta(days=random.randrange(span))
+        tcs.append({
+            'start_date': start,
+            'end_date': start + datetime.timedelta(days=random.randrange(1, 120)),
+            'hours': random.choice((0, 5, 10, 20, 40)),
+        })
+    return tcs
+
+class Command(BaseCommand):
+    help = 'Compares the speed of the time commitment calendar with the original implementation'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--round', metavar='ROUND_SLUG', help='Round to use applicants from (default: the most recent round).')
+        parser.add_argument('--synthetic', type=int, default=200, metavar='N', help='Number of random applicants to also time the calendar with.')
+        parser.add_argument('--commitments', type=int, default=4, metavar='N', help='Number of time commitments per random applicant.')
+        parser.add_argument('--repeat', type=int, default=3, help='How many times to run each implementation.')
+
+    def handle(self, *args, **options):
+        rounds = RoundPage.objects.order_by('-internstarts')
+        if options['round']:
+            rounds = rounds.filter(slug=options['round'])
+        application_round = rounds.first()
+        if application_round is None:
+            raise CommandError('No matching round found')
+
+        repeat = options['repeat']
+
+        # The calendar on its own, with random commitments.
+        samples = [
+            random_time_commitments(application_round, options['commitments'])
+            for i in range(options['synthetic'])
+        ]
+
+        def old_calendars():
+            return [
+                find_longest_free_period_by_groupby(create_time_commitment_calendar_by_day(tcs, application_round))
+                for tcs in samples
+            ]
+
+        def new_calendars():
+            return [
+                find_longest_free_period(create_time_commitment_calendar(tcs, application_round))
+                for tcs in samples
+            ]
+
+        if old_calendars() != new_calendars():
+            raise CommandError('Free periods differ from the original implementation')
+
+        self.report('{} random applicants'.format(len(samples)), repeat,
+            timeit.timeit(old_calendars, number=repeat),
+            timeit.timeit(new_calendars, number=repeat))
+
+        # The whole computation, including queries, for real applicants.
+        applicants = ApplicantApproval.objects.filter(
+            application_round=application_round,
+        ).select_related('application_round').order_by('pk')
+        count = applicants.count()
+        if not count:
+            self.stdout.write('No applicants in {} to compare with'.format(application_round.slug))
+            return
+
+        # get_time_commitments remembers its results, so each run needs to
+        # start over with freshly loaded applicants.
+        def one_at_a_time():
+            return [ a.get_time_commitments()['longest_period_free'] for a in applicants.all() ]
+
+        def batch():
+            current_applicants = list(applicants.all())
+            free_periods = ApplicantApproval.get_free_periods(current_applicants)
+            return [ free_periods[a.pk]['longest_period_free'] for a in current_applicants ]
+
+        if one_at_a_time() != batch():
+            raise CommandError('Batch free periods differ from get_time_commitments')
+
+        self.report('{} applicants in {}'.format(count, application_round.slug), repeat,
+            timeit.timeit(one_at_a_time, number=repeat),
+            timeit.timeit(batch, number=repeat))
+
+    def report(self, description, repeat, old, new):
+        self.stdout.write('{}: {:.4f}s before, {:.4f}s after, {:.1f}x faster'.format(
+            description,
+            old / repeat,
+            new / repeat,
+            old / new if new else float('inf'),
+        ))
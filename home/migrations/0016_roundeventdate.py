@@ -0,0 +1,74 @@
+# Generated by Django 4.2.15 on 2026-10-18
+
+from django.db import migrations, models
+import datetime
+import django.db.models.deletion
+
+# When each reminder in home/dashboard.py's all_round_events was due when
+# this migration was written, as (slug, due date) pairs for a round. This
+# is a copy so later changes to the reminders don't change this migration;
+# run `round_events --rebuild` to pick those up.
+def feedback_instructions(slug, due):
+    # Sent from one week before the due date until four weeks after.
+    return [(slug, due + datetime.timedelta(weeks=week)) for week in range(-1, 5)]
+
+def round_event_dates(r):
+    mentor_application_deadline = r.contributions_close - datetime.timedelta(days=3)
+    mentor_application_deadline -= datetime.timedelta(days=mentor_application_deadline.weekday())
+
+    events = [
+        ('cfp-open', r.pingnew),
+        ('mentoring-org-cfp-open', r.pingold),
+        ('informal-chat-availability-check', r.week_eight_chat_text_date.date()),
+        ('initial-application-reviewer-availability-check', r.initial_applications_open - datetime.timedelta(days=7)),
+        ('coordinator-project-deadline', r.lateprojects - datetime.timedelta(days=14)),
+        ('deadline-review', r.contributions_close - datetime.timedelta(weeks=2)),
+        ('deadline-reminder', r.contributions_close - datetime.timedelta(weeks=2) + datetime.timedelta(days=3)),
+        ('contributor-deadline-reminder', r.contributions_close - datetime.timedelta(weeks=1)),
+        ('contributor-deadline-reminder', r.contributions_close - datetime.timedelta(days=1)),
+        ('mentor-application-deadline-reminder', mentor_application_deadline),
+        ('mentor-intern-selection-reminder', r.contributions_close),
+        ('coordinator-intern-selection-reminder', r.contributions_close),
+        ('application-period-ended', r.contributions_close),
+        ('mentor-intern-selection-deadline-reminder', r.mentor_intern_selection_deadline),
+        ('intern-welcome', r.internannounce),
+        ('reminder-sign-internship-agreement', r.internannounce + datetime.timedelta(days=5)),
+        ('career-chat-invitation', r.week_six_chat_text_date.date()),
+    ]
+    for week in (1, 3, 5, 6, 7, 9, 11, 13):
+        events.append(('internship-week-{}'.format(week), r.internstarts + datetime.timedelta(weeks=week - 1)))
+    events.extend(feedback_instructions('initial-feedback-instructions', r.initialfeedback))
+    events.extend(feedback_instructions('midpoint-feedback-instructions', r.midfeedback))
+    events.extend(feedback_instructions('feedback3-feedback-instructions', r.feedback3_due or r.midfeedback))
+    events.extend(feedback_instructions('final-feedback-instructions', r.finalfeedback))
+    return events
+
+def backfill_round_event_dates(apps, schema_editor):
+    RoundPage = apps.get_model('home', 'RoundPage')
+    RoundEventDate = apps.get_model('home', 'RoundEventDate')
+
+    RoundEventDate.objects.bulk_create([
+        RoundEventDate(internship_round=r, event=event, due=due)
+        for r in RoundPage.objects.all()
+        for event, due in round_event_dates(r)
+    ], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('home', '0015_add_technical_task_or_project'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RoundEventDate',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('event', models.SlugField(max_length=100)),
+                ('due', models.DateField(db_index=True)),
+                ('internship_round', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='home.roundpage')),
+            ],
+        ),
+        migrations.RunPython(backfill_round_event_dates, migrations.RunPython.noop),
+    ]
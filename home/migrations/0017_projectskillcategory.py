@@ -0,0 +1,76 @@
+# Generated by Django 4.2.15 on 2026-10-18 20:48
+
+from django.db import migrations, models
+import django.db.models.deletion
+import re
+
+# A copy of home.models.SKILL_CATEGORIES, ADDITIONAL_SKILL_CATEGORIES, and
+# categorize_skill as they were when this migration was written, so later
+# changes to the categories don't change what this migration does.
+SKILL_CATEGORIES = [(category, re.compile(pattern, re.IGNORECASE)) for category, pattern in (
+    ('Python', r'python'),
+    ('JavaScript', r'javascript|(?-i:JS)'),
+    ('HTML/CSS', r'html|css'),
+    ('Java', r'java'),
+    ('Django', r'django'),
+    ('C programming', r'c program|c language|c code|programming in c|(?-i:\AC\Z)'),
+    ('C++', r'c\+\+'),
+    ('Rust', r'rust'),
+    ('Ruby on Rails', r'ruby on rails'),
+    ('Ruby', r'ruby'),
+    ('Operating Systems knowledge', r'operating systems|kernel'),
+    ('Linux', r'linux'),
+    ('Web development', r'web development'),
+    ('GTK programming', r'gtk|gobject'),
+    ('Git', r'git'),
+    ('Documentation', r'writing|documentation'),
+)]
+
+ADDITIONAL_SKILL_CATEGORIES = [(category, re.compile(pattern, re.IGNORECASE)) for category, pattern in (
+    ('Android', r'android'),
+    ('Mercurial', r'mercurial'),
+    ('node.js', r'node\.js'),
+)]
+
+def categorize_skill(skill):
+    for category, pattern in SKILL_CATEGORIES:
+        if pattern.search(skill):
+            categories = [category]
+            break
+    else:
+        categories = [skill]
+
+    categories.extend(
+        category
+        for category, pattern in ADDITIONAL_SKILL_CATEGORIES
+        if pattern.search(skill)
+    )
+    return categories
+
+def categorize_project_skills(apps, schema_editor):
+    ProjectSkill = apps.get_model('home.ProjectSkill')
+    ProjectSkillCategory = apps.get_model('home.ProjectSkillCategory')
+
+    ProjectSkillCategory.objects.bulk_create([
+        ProjectSkillCategory(project_skill=ps, category=category)
+        for ps in ProjectSkill.objects.all()
+        for category in categorize_skill(ps.skill)
+    ], batch_size=1000)
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('home', '0016_roundeventdate'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProjectSkillCategory',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('category', models.CharField(db_index=True, max_length=100)),
+                ('project_skill', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='home.projectskill')),
+            ],
+        ),
+        migrations.RunPython(categorize_project_skills, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 4.2.15 on 2026-10-18 20:56
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('home', '0017_projectskillcategory'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RoundStatisticsSnapshot',
+            fields=[
+                ('internship_round', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, serialize=False, to='home.roundpage')),
+                ('updated', models.DateTimeField(auto_now=True)),
+                ('frozen', models.BooleanField(default=False)),
+                ('total_eligibility_checks', models.IntegerField(default=0)),
+                ('total_eligible', models.IntegerField(default=0)),
+                ('percentage_rejected_essay', models.FloatField(default=0)),
+                ('percentage_rejected_time', models.FloatField(default=0)),
+                ('percentage_rejected_general', models.FloatField(default=0)),
+                ('countries', models.JSONField(default=list)),
+                ('total_contributors', models.IntegerField(default=0)),
+                ('percentage_us_contributors_not_bipoc', models.FloatField(default=0)),
+                ('percentage_us_contributors_bipoc', models.FloatField(default=0)),
+                ('percentage_contributors_cisgender', models.FloatField(default=0)),
+                ('percentage_contributors_transgender', models.FloatField(default=0)),
+                ('percentage_contributors_genderqueer', models.FloatField(default=0)),
+                ('total_final_applicants', models.IntegerField(default=0)),
+                ('total_interns_funded', models.IntegerField(default=0)),
+            ],
+        ),
+    ]
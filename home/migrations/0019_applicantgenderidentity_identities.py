@@ -0,0 +1,65 @@
+# Generated by Django 4.2.15 on 2026-10-18 21:04
+
+from django.db import migrations, models
+
+# A copy of ApplicantGenderIdentity.IDENTITY_FIELDS as it was when this
+# migration was written. Each field's bit is its position in this list.
+IDENTITY_FIELDS = (
+    'transgender',
+    'genderqueer',
+    'man',
+    'woman',
+    'demi_boy',
+    'demi_girl',
+    'trans_masculine',
+    'trans_feminine',
+    'non_binary',
+    'demi_non_binary',
+    'genderflux',
+    'genderfluid',
+    'demi_genderfluid',
+    'demi_gender',
+    'bi_gender',
+    'tri_gender',
+    'multigender',
+    'pangender',
+    'maxigender',
+    'aporagender',
+    'intergender',
+    'mavrique',
+    'gender_confusion',
+    'gender_indifferent',
+    'graygender',
+    'agender',
+    'genderless',
+    'gender_neutral',
+    'neutrois',
+    'androgynous',
+    'androgyne',
+    'prefer_not_to_say',
+)
+
+def set_identities(apps, schema_editor):
+    ApplicantGenderIdentity = apps.get_model('home.ApplicantGenderIdentity')
+    for gender_identity in ApplicantGenderIdentity.objects.all():
+        gender_identity.identities = sum(
+            1 << bit
+            for bit, field in enumerate(IDENTITY_FIELDS)
+            if getattr(gender_identity, field)
+        )
+        gender_identity.save(update_fields=['identities'])
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('home', '0018_roundstatisticssnapshot'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='applicantgenderidentity',
+            name='identities',
+            field=models.BigIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(set_identities, migrations.RunPython.noop),
+    ]
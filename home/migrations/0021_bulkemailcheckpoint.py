@@ -0,0 +1,22 @@
+# Generated by Django 4.2.15 on 2026-10-18 21:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('home', '0020_outboundemail'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BulkEmailCheckpoint',
+            fields=[
+                ('name', models.CharField(max_length=100, primary_key=True, serialize=False)),
+                ('last_pk', models.BigIntegerField()),
+                ('sent', models.PositiveIntegerField(default=0)),
+                ('updated', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+    ]
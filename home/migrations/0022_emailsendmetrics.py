@@ -0,0 +1,34 @@
+# Generated by Django 4.2.15 on 2026-10-18 21:45
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('home', '0021_bulkemailcheckpoint'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='EmailSendMetrics',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('event', models.SlugField(max_length=100)),
+                ('recorded', models.DateTimeField(auto_now_add=True)),
+                ('messages', models.PositiveIntegerField(default=0)),
+                ('transactions', models.PositiveIntegerField(default=0)),
+                ('render_seconds', models.FloatField(default=0)),
+                ('render_queries', models.PositiveIntegerField(default=0)),
+                ('delivery_seconds', models.FloatField(default=0)),
+                ('total_seconds', models.FloatField(default=0)),
+                ('templates', models.JSONField(default=dict)),
+                ('internship_round', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='home.roundpage')),
+            ],
+            options={
+                'ordering': ['-recorded'],
+                'indexes': [models.Index(fields=['internship_round', 'event', 'recorded'], name='home_emails_interns_6ee5e1_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,54 @@
+# Generated by Django 4.2.15 on 2026-10-18 21:55
+
+from django.db import migrations, models
+
+# InitialApplicationReview's essay ratings as they were when this migration
+# was written, from best to worst.
+RATINGS_ORDER = ['+3', '+2', '+1', '??', '0', '-1', '-2', '-3']
+
+def set_review_state(apps, schema_editor):
+    ApplicantApproval = apps.get_model('home.ApplicantApproval')
+    InitialApplicationReview = apps.get_model('home.InitialApplicationReview')
+    SchoolInformation = apps.get_model('home.SchoolInformation')
+
+    ratings = {}
+    for application_id, rating in InitialApplicationReview.objects.values_list('application_id', 'essay_rating'):
+        ratings.setdefault(application_id, set()).add(rating)
+    for application_id, application_ratings in ratings.items():
+        ApplicantApproval.objects.filter(pk=application_id).update(
+            has_review=True,
+            best_rating=next((r for r in RATINGS_ORDER if r in application_ratings), ''),
+        )
+
+    ApplicantApproval.objects.filter(
+        pk__in=SchoolInformation.objects.values('applicant_id'),
+    ).update(is_student=True)
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('home', '0022_emailsendmetrics'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='applicantapproval',
+            name='best_rating',
+            field=models.CharField(blank=True, max_length=2),
+        ),
+        migrations.AddField(
+            model_name='applicantapproval',
+            name='has_review',
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AddField(
+            model_name='applicantapproval',
+            name='is_student',
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AddIndex(
+            model_name='applicantapproval',
+            index=models.Index(fields=['application_round', 'approval_status', 'has_review', 'best_rating'], name='home_applic_applica_218d1d_idx'),
+        ),
+        migrations.RunPython(set_review_state, migrations.RunPython.noop),
+    ]
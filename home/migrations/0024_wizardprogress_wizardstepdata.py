@@ -0,0 +1,41 @@
+# Generated by Django 4.2.15 on 2026-10-18 22:05
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('home', '0023_applicantapproval_review_state'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='WizardProgress',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('prefix', models.CharField(max_length=100)),
+                ('current_step', models.CharField(blank=True, max_length=100)),
+                ('extra_data', models.JSONField(default=dict)),
+                ('updated', models.DateTimeField(auto_now=True)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='auth.user')),
+            ],
+            options={
+                'unique_together': {('user', 'prefix')},
+            },
+        ),
+        migrations.CreateModel(
+            name='WizardStepData',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('step', models.CharField(max_length=100)),
+                ('data', models.JSONField(default=dict)),
+                ('progress', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='steps', to='home.wizardprogress')),
+            ],
+            options={
+                'unique_together': {('progress', 'step')},
+            },
+        ),
+    ]
@@ -1,5 +1,5 @@
 from os import urandom
-from base64 import urlsafe_b64encode
+from base64 import b64decode, b64encode, urlsafe_b64encode
 from collections import Counter
 import datetime
 from email.headerregistry import Address
@@ -7,17 +7,22 @@ import random
 import os.path
 import re
 import math
+import time
 
+from django.conf import settings
 from django.contrib.auth.models import User
 from django.core import validators
+from django.core.cache import cache
 from django.core.exceptions import ObjectDoesNotExist
+from django.core.mail import EmailMessage, EmailMultiAlternatives
 from django.db import models
+from django.db.models import signals
 from django.db import transaction
 from django.forms import ValidationError
 from django.shortcuts import redirect
 from django.urls import reverse
 from django.utils.functional import cached_property
-from itertools import chain, groupby
+from itertools import accumulate, chain, groupby
 from urllib.parse import urlsplit, urlparse
 
 from ckeditor.fields import RichTextField as CKEditorField
@@ -38,6 +43,7 @@ from wagtail import blocks
 from wagtail.images.blocks import ImageChooserBlock
 from wagtail.contrib.table_block.blocks import TableBlock
 from wagtail.contrib.routable_page.models import RoutablePageMixin, route
+from wagtail.signals import page_published, page_unpublished
 
 from . import email
 from .feeds import WagtailFeed
@@ -591,60 +597,68 @@ class RoundPage(AugmentDeadlines, Page):
         return communities
 
     def get_common_skills_counter(self):
-        approved_projects = Project.objects.filter(project_round__participating_round=self, approval_status=Project.APPROVED)
-        skills = []
-        for p in approved_projects:
-            for s in p.projectskill_set.all():
-                if 'python' in s.skill.lower():
-                    skills.append('Python')
-                elif 'javascript' in s.skill.lower() or 'JS' in s.skill:
-                    skills.append('JavaScript')
-                elif 'html' in s.skill.lower() or 'css' in s.skill.lower():
-                    skills.append('HTML/CSS')
-                elif 'java' in s.skill.lower():
-                    skills.append('Java')
-                elif 'django' in s.skill.lower():
-                    skills.append('Django')
-                elif 'c program' in s.skill.lower() or 'c language' in s.skill.lower() or 'c code' in s.skill.lower() or 'programming in c' in s.skill.lower() or s.skill == 'C':
-                    skills.append('C programming')
-                elif 'c++' in s.skill.lower():
-                    skills.append('C++')
-                elif 'rust' in s.skill.lower():
-                    skills.append('Rust')
-                elif 'ruby on rails' in s.skill.lower():
-                    skills.append('Ruby on Rails')
-                elif 'ruby' in s.skill.lower():
-                    skills.append('Ruby')
-                elif 'operating systems' in s.skill.lower() or 'kernel' in s.skill.lower():
-                    skills.append('Operating Systems knowledge')
-                elif 'linux' in s.skill.lower():
-                    skills.append('Linux')
-                elif 'web development' in s.skill.lower():
-                    skills.append('Web development')
-                elif 'gtk' in s.skill.lower() or 'gobject' in s.skill.lower():
-                    skills.append('GTK programming')
-                elif 'git' in s.skill.lower():
-                    skills.append('Git')
-                elif 'writing' in s.skill.lower() or 'documentation' in s.skill.lower():
-                    skills.append('Documentation')
-                else:
-                    skills.append(s.skill)
-
-                # A lot of projects list Android in conjunction with another skill
-                if 'android' in s.skill.lower():
-                    skills.append('Android')
-                # Some projects list both Git or mercurial
-                if 'mercurial' in s.skill.lower():
-                    skills.append('Mercurial')
-                # Some projects list both JavaScipt and node.js
-                if 'node.js' in s.skill.lower():
-                    skills.append('node.js')
-        return Counter(skills)
+        categories = ProjectSkillCategory.objects.filter(
+            project_skill__project__project_round__participating_round=self,
+            project_skill__project__approval_status=Project.APPROVED,
+        ).values_list('category').annotate(
+            count=models.Count('pk'),
+        ).order_by('-count', 'category')
+        return Counter(dict(categories))
 
     # Statistics functions
     def get_common_skills(self):
-        skill_counter = self.get_common_skills_counter()
-        return skill_counter.most_common(20)
+        # The round page and applicant guide show this to every visitor, so
+        # keep it around until a project or its skills change.
+        key = 'common-skills:{}:{}'.format(
+            cache_generation(COMMON_SKILLS_GENERATION_KEY),
+            self.pk,
+        )
+        common_skills = cache.get(key)
+        if common_skills is None:
+            common_skills = self.get_common_skills_counter().most_common(20)
+            cache.set(key, common_skills, COMMON_SKILLS_TIMEOUT)
+        return common_skills
+
+    def count_initial_applications(self):
+        """
+        Count this round's initial applications in each state shown in the
+        dashboard's application summary, in a single query.
+        """
+        pending = models.Q(approval_status=ApprovalStatus.PENDING)
+        unowned = pending & models.Q(review_owner=None)
+        unreviewed = unowned & models.Q(has_review=False)
+
+        def count(condition):
+            return models.Count('pk', filter=condition)
+
+        def rated(rating):
+            return count(unowned & models.Q(best_rating=rating))
+
+        return self.applicantapproval_set.aggregate(
+            pending_applications_count=count(pending),
+            pending_unreviewed_unowned_count=count(unreviewed),
+            pending_unreviewed_unowned_non_student_count=count(unreviewed & models.Q(is_student=False)),
+            pending_reviewed_unowned_count=count(unowned & models.Q(has_review=True)),
+            reviewed_strong_count=rated(InitialApplicationReview.STRONG),
+            reviewed_good_count=rated(InitialApplicationReview.GOOD),
+            reviewed_maybe_count=rated(InitialApplicationReview.MAYBE),
+            reviewed_unclear_count=rated(InitialApplicationReview.UNCLEAR),
+            rejected_applications_count=count(models.Q(approval_status=ApprovalStatus.REJECTED)),
+            approved_applications_count=count(models.Q(approval_status=ApprovalStatus.APPROVED)),
+        )
+
+    def get_initial_application_counts(self):
+        # Every reviewer loads these on the dashboard, so share them until
+        # an application, its review, or its school information changes.
+        key = 'initial-application-counts:{}:{}'.format(
+            cache_generation(INITIAL_APPLICATION_COUNTS_GENERATION_KEY),
+            self.pk,
+        )
+        counts = cache.get(key)
+        if counts is None:
+            counts = self.count_initial_applications()
+            cache.set(key, counts, INITIAL_APPLICATION_COUNTS_TIMEOUT)
+        return counts
 
     def number_accepted_initial_applications(self):
         return self.applicantapproval_set.approved().count()
@@ -672,8 +686,11 @@ class RoundPage(AugmentDeadlines, Page):
         return (count_all, count_approved, count_rejected_essay * 100 / count_rejected_all, count_rejected_time * 100 / count_rejected_all, count_rejected_general * 100 / count_rejected_all)
 
     def get_countries_stats(self):
-        all_apps = self.applicantapproval_set.approved()
-        return Counter([a.initial_application_country_living_in_during_internship for a in all_apps]).most_common(25)
+        return list(self.applicantapproval_set.approved().values_list(
+            'initial_application_country_living_in_during_internship',
+        ).annotate(
+            count=models.Count('pk'),
+        ).order_by('-count', 'initial_application_country_living_in_during_internship')[:25])
 
     def get_contributor_demographics(self):
         contributors = self.applicantapproval_set.approved().filter(contribution__isnull=False).distinct()
@@ -696,59 +713,52 @@ class RoundPage(AugmentDeadlines, Page):
 
         return (applicants, (us_apps - us_people_of_color_apps) * 100 / us_apps, us_people_of_color_apps * 100 / us_apps)
 
+    def get_contributor_gender_counts(self):
+        """
+        Counts how many approved applicants made a contribution this round,
+        and how many of them have each kind of gender identity, in one query.
+        Applicants may be counted under several gender identities.
+        """
+        contributors = self.applicantapproval_set.approved().filter(
+            models.Exists(Contribution.objects.filter(applicant=models.OuterRef('pk'))),
+        )
+
+        counts = {}
+        for name, mask in (
+                ('cisgender', NOT_CISGENDER_IDENTITIES),
+                ('transgender', ApplicantGenderIdentity.identity_mask('transgender')),
+                ('genderqueer', ApplicantGenderIdentity.identity_mask('genderqueer')),
+                ('men', ApplicantGenderIdentity.identity_mask('man')),
+                ('women', ApplicantGenderIdentity.identity_mask('woman')),
+                ('non_binary', NON_BINARY_IDENTITIES),
+                ):
+            contributors = contributors.alias(**{
+                name + '_bits': models.F('applicantgenderidentity__identities').bitand(mask),
+            })
+            if name == 'cisgender':
+                condition = models.Q(cisgender_bits=0)
+            else:
+                condition = models.Q(**{name + '_bits__gt': 0})
+            counts[name] = models.Count('pk', filter=condition)
+
+        return contributors.aggregate(
+            total=models.Count('pk'),
+            self_identified=models.Count('pk', filter=models.Q(
+                applicantgenderidentity__isnull=False,
+            ) & ~models.Q(
+                applicantgenderidentity__self_identify='',
+            )),
+            **counts
+        )
+
     def get_contributor_gender_stats(self):
-        all_apps = self.applicantapproval_set.approved().filter(contribution__isnull=False).distinct().count()
+        counts = self.get_contributor_gender_counts()
+        all_apps = counts['total']
 
         if all_apps == 0:
             return (0, 0, 0)
 
-        cis_apps = ApplicantGenderIdentity.objects.filter(
-                transgender=False,
-                genderqueer=False,
-                demi_boy=False,
-                demi_girl=False,
-                trans_masculine=False,
-                trans_feminine=False,
-                non_binary=False,
-                demi_non_binary=False,
-                genderflux=False,
-                genderfluid=False,
-                demi_genderfluid=False,
-                demi_gender=False,
-                bi_gender=False,
-                tri_gender=False,
-                multigender=False,
-                pangender=False,
-                maxigender=False,
-                aporagender=False,
-                intergender=False,
-                mavrique=False,
-                gender_confusion=False,
-                gender_indifferent=False,
-                graygender=False,
-                agender=False,
-                genderless=False,
-                gender_neutral=False,
-                neutrois=False,
-                androgynous=False,
-                androgyne=False,
-                applicant__application_round=self,
-                applicant__approval_status=ApprovalStatus.APPROVED,
-                applicant__contribution__isnull=False).distinct().count()
-
-        trans_folks_apps = ApplicantGenderIdentity.objects.filter(
-                transgender=True,
-                applicant__application_round=self,
-                applicant__approval_status=ApprovalStatus.APPROVED,
-                applicant__contribution__isnull=False).distinct().count()
-
-        genderqueer_folks_apps = ApplicantGenderIdentity.objects.filter(
-                genderqueer=True,
-                applicant__application_round=self,
-                applicant__approval_status=ApprovalStatus.APPROVED,
-                applicant__contribution__isnull=False).distinct().count()
-
-        return (cis_apps * 100 / all_apps, trans_folks_apps * 100 / all_apps, genderqueer_folks_apps * 100 / all_apps)
+        return (counts['cisgender'] * 100 / all_apps, counts['transgender'] * 100 / all_apps, counts['genderqueer'] * 100 / all_apps)
 
     def get_contributor_applicant_funding_status(self):
         eligible = self.applicantapproval_set.approved().count()
@@ -778,6 +788,35 @@ class RoundPage(AugmentDeadlines, Page):
         context['role'] = Role(request.user, self)
         return context
 
+    def save(self, *args, **kwargs):
+        super(RoundPage, self).save(*args, **kwargs)
+
+        # Wagtail saves only a few bookkeeping fields when a draft revision
+        # is created, and this instance holds the unpublished draft dates at
+        # that point. Only rebuild the event calendar from a full save.
+        if kwargs.get('update_fields') is None:
+            # This import can't be at top-level because dashboard.py imports
+            # this file so that would be a circular dependency.
+            from .dashboard import update_round_event_calendar
+            update_round_event_calendar(self)
+
+class RoundEventDate(models.Model):
+    """
+    Index of when each staff email reminder in home/dashboard.py is due, so
+    the dashboard and the round_events management command can find the
+    reminders due around a date with a single range lookup.
+
+    Rows are regenerated whenever their RoundPage is saved. Events which have
+    several instances (like weekly feedback reminders) get one row for each.
+    """
+    internship_round = models.ForeignKey(RoundPage, on_delete=models.CASCADE)
+    # The RoundEvent's slug, as used in its "email-<slug>" URL name
+    event = models.SlugField(max_length=SENTENCE_LENGTH)
+    due = models.DateField(db_index=True)
+
+    def __str__(self):
+        return '{} - {} - {}'.format(self.due, self.event, self.internship_round)
+
 class StatisticTotalApplied(models.Model):
     internship_round = models.OneToOneField(RoundPage, on_delete=models.CASCADE, primary_key=True)
     total_applicants = models.IntegerField(
@@ -925,6 +964,98 @@ class StatisticGenderDemographics(models.Model):
     def percentage_accepted_who_are_non_binary(self):
         return int(round(100 * (self.total_non_binary_people / self.internship_round.statistictotalapplied.total_approved)))
 
+class RoundStatisticsSnapshot(models.Model):
+    """
+    The numbers shown on a round's public statistics page. Counting them
+    takes a couple dozen queries over every application in the round, so
+    they're stored here by the round_statistics management command, which
+    runs daily (see app.json).
+
+    Nothing changes these numbers once interns are announced, so at that
+    point the snapshot is frozen and isn't computed again.
+    """
+    internship_round = models.OneToOneField(RoundPage, on_delete=models.CASCADE, primary_key=True)
+    updated = models.DateTimeField(auto_now=True)
+    frozen = models.BooleanField(default=False)
+
+    # from RoundPage.get_statistics_on_eligibility_check
+    total_eligibility_checks = models.IntegerField(default=0)
+    total_eligible = models.IntegerField(default=0)
+    percentage_rejected_essay = models.FloatField(default=0)
+    percentage_rejected_time = models.FloatField(default=0)
+    percentage_rejected_general = models.FloatField(default=0)
+
+    # from RoundPage.get_countries_stats, as a list of [country, count] pairs
+    countries = models.JSONField(default=list)
+
+    # from RoundPage.get_contributor_demographics
+    total_contributors = models.IntegerField(default=0)
+    percentage_us_contributors_not_bipoc = models.FloatField(default=0)
+    percentage_us_contributors_bipoc = models.FloatField(default=0)
+
+    # from RoundPage.get_contributor_gender_stats
+    percentage_contributors_cisgender = models.FloatField(default=0)
+    percentage_contributors_transgender = models.FloatField(default=0)
+    percentage_contributors_genderqueer = models.FloatField(default=0)
+
+    # from RoundPage.get_contributor_applicant_funding_status
+    total_final_applicants = models.IntegerField(default=0)
+    total_interns_funded = models.IntegerField(default=0)
+
+    def __str__(self):
+        return 'Statistics for {start:%Y %B} to {end:%Y %B} round'.format(
+                start=self.internship_round.internstarts,
+                end=self.internship_round.internends,
+                )
+
+    @classmethod
+    def for_round(cls, internship_round):
+        """
+        The stored snapshot for this round, or if the round_statistics
+        command hasn't stored one yet, an unsaved one with live numbers.
+        """
+        try:
+            return internship_round.roundstatisticssnapshot
+        except cls.DoesNotExist:
+            snapshot = cls(internship_round=internship_round)
+            snapshot.compute()
+            return snapshot
+
+    def update(self):
+        self.compute()
+        self.save()
+
+    def compute(self):
+        current_round = self.internship_round
+
+        (
+            self.total_eligibility_checks,
+            self.total_eligible,
+            self.percentage_rejected_essay,
+            self.percentage_rejected_time,
+            self.percentage_rejected_general,
+        ) = current_round.get_statistics_on_eligibility_check()
+
+        self.countries = [[country, count] for country, count in current_round.get_countries_stats()]
+
+        (
+            self.total_contributors,
+            self.percentage_us_contributors_not_bipoc,
+            self.percentage_us_contributors_bipoc,
+        ) = current_round.get_contributor_demographics()
+
+        (
+            self.percentage_contributors_cisgender,
+            self.percentage_contributors_transgender,
+            self.percentage_contributors_genderqueer,
+        ) = current_round.get_contributor_gender_stats()
+
+        # The rest of get_contributor_applicant_funding_status was counted above.
+        self.total_final_applicants = current_round.number_final_applicants()
+        self.total_interns_funded = sum(p.interns_funded() for p in current_round.participation_set.approved())
+
+        self.frozen = current_round.internannounce.has_passed()
+
 class CohortPage(Page):
     round_start = models.DateField("Round start date")
     round_end = models.DateField("Round end date")
@@ -1153,6 +1284,19 @@ class ApprovalStatusQuerySet(models.QuerySet):
     def rejected(self):
         return self.filter(approval_status=ApprovalStatus.REJECTED)
 
+    def approved_or_before_deadline(self, today):
+        """
+        Leave out requests that aren't approved and can't be approved any
+        more, because their submission_and_approval_deadline has passed.
+        """
+        deadline = self.model.submission_and_approval_deadline_expression()
+        if deadline is None:
+            return self
+        return self.alias(submission_and_approval_deadline_date=deadline).filter(
+            models.Q(approval_status=ApprovalStatus.APPROVED)
+            | models.Q(submission_and_approval_deadline_date__gt=today)
+        )
+
 class ApprovalStatus(models.Model):
     PENDING = 'P'
     APPROVED = 'A'
@@ -1190,6 +1334,19 @@ class ApprovalStatus(models.Model):
         """
         return NoDeadline
 
+    @classmethod
+    def submission_and_approval_deadline_expression(cls):
+        """
+        Override in subclasses to return a query expression for the same
+        date that submission_and_approval_deadline returns, so querysets can
+        filter on it. None means there is no deadline.
+        """
+        return None
+
+    # Override in subclasses to list the related objects that the dashboard
+    # needs in order to display one of these requests.
+    dashboard_select_related = ()
+
     def is_approver(self, user):
         """
         Override in subclasses to return True if the given user has
@@ -1213,6 +1370,16 @@ class ApprovalStatus(models.Model):
         """
         raise NotImplementedError
 
+    @classmethod
+    def dashboard_scope(cls, user):
+        """
+        Return a string which is the same for any two users who get the
+        same results from ``objects_for_dashboard``. This is used to share
+        cached dashboard counts between those users. Override in
+        subclasses where, for example, all staff see the same objects.
+        """
+        return 'user-{}'.format(user.pk)
+
     def get_action_url(self, action, **kwargs):
         """
         Override in subclasses to return the URL for the view which
@@ -1534,6 +1701,12 @@ class Participation(ApprovalStatus):
     def submission_and_approval_deadline(self):
         return self.participating_round.contributions_close
 
+    @classmethod
+    def submission_and_approval_deadline_expression(cls):
+        return models.F('participating_round__contributions_close')
+
+    dashboard_select_related = ('community', 'participating_round')
+
     def is_approver(self, user):
         return user.is_staff
 
@@ -1566,6 +1739,12 @@ class Participation(ApprovalStatus):
                 community__coordinatorapproval__coordinator__account=user,
                 )
 
+    @classmethod
+    def dashboard_scope(cls, user):
+        if user.is_staff:
+            return 'staff'
+        return super(Participation, cls).dashboard_scope(user)
+
     def is_mentor(self, user):
         try:
             return user.comrade.get_mentored_projects().approved().filter(
@@ -1865,6 +2044,12 @@ class Project(ApprovalStatus):
     def submission_and_approval_deadline(self):
         return self.round().lateprojects
 
+    @classmethod
+    def submission_and_approval_deadline_expression(cls):
+        return models.F('project_round__participating_round__lateprojects')
+
+    dashboard_select_related = ('project_round__community', 'project_round__participating_round')
+
     def is_approver(self, user):
         return self.project_round.community.is_coordinator(user)
 
@@ -1887,53 +2072,71 @@ class Project(ApprovalStatus):
                 for ma in self.mentorapproval_set.approved()]
 
     def all_skills(self):
+        if hasattr(self, 'prefetched_skills'):
+            return sorted(self.prefetched_skills, key=lambda skill: skill.skill)
         return ProjectSkill.objects.filter(project=self).order_by('skill')
 
+    def get_skills(self, required):
+        # Pages that list many projects can prefetch all of their skills at
+        # once, with Prefetch('projectskill_set', to_attr='prefetched_skills').
+        if hasattr(self, 'prefetched_skills'):
+            return [skill for skill in self.prefetched_skills if skill.required == required]
+        return ProjectSkill.objects.filter(project=self, required=required)
+
     def required_skills(self):
-        return ProjectSkill.objects.filter(project=self, required=ProjectSkill.STRONG)
+        return self.get_skills(ProjectSkill.STRONG)
 
     def preferred_skills(self):
-        return ProjectSkill.objects.filter(project=self, required=ProjectSkill.OPTIONAL)
+        return self.get_skills(ProjectSkill.OPTIONAL)
 
     def bonus_skills(self):
-        return ProjectSkill.objects.filter(project=self, required=ProjectSkill.BONUS)
+        return self.get_skills(ProjectSkill.BONUS)
 
     def get_applicants_and_contributions_list(self):
+        # Templates often ask for this several times while rendering a single
+        # page or email, so build the list once per Project object.
+        if '_applicants_and_contributions' in self.__dict__:
+            return self._applicants_and_contributions
+
+        # FinalApplication is unique on (applicant, project), so joining in
+        # this project's final application doesn't change the number of
+        # contributions counted.
         applicants = ApplicantApproval.objects.approved().filter(
             contribution__project=self,
+        ).annotate(
+            project_application=models.FilteredRelation(
+                'finalapplication',
+                condition=models.Q(finalapplication__project=self),
+            ),
         ).annotate(
             number_contributions=models.Count('contribution'),
+            final_application_id=models.F('project_application__id'),
+            final_application_rating=models.F('project_application__rating'),
+            final_application_status=models.F('project_application__approval_status'),
+            final_application_gsoc=models.F('project_application__applying_to_gsoc'),
+            final_application_time_correct=models.F('project_application__time_correct'),
+            final_application_time_updates=models.F('project_application__time_updates'),
         )
 
+        rating_tips = dict(FinalApplication.RATING_CHOICES)
+        applicants = list(applicants)
         for a in applicants:
-            try:
-                fa = a.finalapplication_set.get(project=self)
-                a.submitted_application = True
-                if fa.rating == fa.UNRATED:
-                    a.rating = "Unrated"
-                else:
-                    a.rating = fa.rating
-                a.rating_tip = fa.get_rating_display()
-                if a.finalapplication_set.filter(project=self).withdrawn().exists():
-                    a.withdrew_application = True
-                else:
-                    a.withdrew_application = False
-
-                if a.finalapplication_set.filter(project=self).exclude(applying_to_gsoc="").exists():
-                    a.applying_to_gsoc = True
-                else:
-                    a.applying_to_gsoc = False
-
-                if a.finalapplication_set.filter(project=self).exclude(time_correct="True").exists():
-                    a.incorrect_time_commitments = True
-                elif a.finalapplication_set.filter(project=self).exclude(time_updates="").exists():
-                    a.incorrect_time_commitments = True
-                else:
-                    a.incorrect_time_commitments = False
-            except:
+            if a.final_application_id is None:
                 a.submitted_application = False
                 a.incorrect_time_commitments = False
+                continue
+
+            a.submitted_application = True
+            if a.final_application_rating == FinalApplication.UNRATED:
+                a.rating = "Unrated"
+            else:
+                a.rating = a.final_application_rating
+            a.rating_tip = rating_tips.get(a.final_application_rating, a.final_application_rating)
+            a.withdrew_application = a.final_application_status == ApprovalStatus.WITHDRAWN
+            a.applying_to_gsoc = a.final_application_gsoc != ""
+            a.incorrect_time_commitments = not a.final_application_time_correct or a.final_application_time_updates != ""
 
+        self._applicants_and_contributions = applicants
         return applicants
 
     def get_applications(self):
@@ -2110,6 +2313,52 @@ class ProfessionalSkill(models.Model):
             case self.INDEPENDENT:
                 return "(Independent) Used this skill in several projects and I can use this skill independently"
 
+# Mentors describe project skills in their own words. To summarize which
+# skills are most in demand, each skill is sorted into a common category when
+# it's saved. A skill goes in the first of these categories that matches, or
+# if none of them match, its own name is its category.
+SKILL_CATEGORIES = [(category, re.compile(pattern, re.IGNORECASE)) for category, pattern in (
+    ('Python', r'python'),
+    ('JavaScript', r'javascript|(?-i:JS)'),
+    ('HTML/CSS', r'html|css'),
+    ('Java', r'java'),
+    ('Django', r'django'),
+    ('C programming', r'c program|c language|c code|programming in c|(?-i:\AC\Z)'),
+    ('C++', r'c\+\+'),
+    ('Rust', r'rust'),
+    ('Ruby on Rails', r'ruby on rails'),
+    ('Ruby', r'ruby'),
+    ('Operating Systems knowledge', r'operating systems|kernel'),
+    ('Linux', r'linux'),
+    ('Web development', r'web development'),
+    ('GTK programming', r'gtk|gobject'),
+    ('Git', r'git'),
+    ('Documentation', r'writing|documentation'),
+)]
+
+# Projects often list these together with another skill (Android with Java,
+# Mercurial with Git, node.js with JavaScript) so they're counted separately.
+ADDITIONAL_SKILL_CATEGORIES = [(category, re.compile(pattern, re.IGNORECASE)) for category, pattern in (
+    ('Android', r'android'),
+    ('Mercurial', r'mercurial'),
+    ('node.js', r'node\.js'),
+)]
+
+def categorize_skill(skill):
+    for category, pattern in SKILL_CATEGORIES:
+        if pattern.search(skill):
+            categories = [category]
+            break
+    else:
+        categories = [skill]
+
+    categories.extend(
+        category
+        for category, pattern in ADDITIONAL_SKILL_CATEGORIES
+        if pattern.search(skill)
+    )
+    return categories
+
 class ProjectSkill(models.Model):
     project = models.ForeignKey(Project, verbose_name="Project", on_delete=models.CASCADE)
 
@@ -2195,6 +2444,29 @@ class ProjectSkill(models.Model):
             skill=self.skill,
         )
 
+    def save(self, *args, **kwargs):
+        super(ProjectSkill, self).save(*args, **kwargs)
+        self.update_categories()
+
+    @transaction.atomic
+    def update_categories(self):
+        self.projectskillcategory_set.all().delete()
+        ProjectSkillCategory.objects.bulk_create([
+            ProjectSkillCategory(project_skill=self, category=category)
+            for category in categorize_skill(self.skill)
+        ])
+        invalidate_common_skills(ProjectSkill)
+
+class ProjectSkillCategory(models.Model):
+    project_skill = models.ForeignKey(ProjectSkill, on_delete=models.CASCADE)
+    category = models.CharField(max_length=SENTENCE_LENGTH, db_index=True)
+
+    def __str__(self):
+        return '{skill} - {category}'.format(
+            skill=self.project_skill.skill,
+            category=self.category,
+        )
+
 def mentor_read_instructions(value):
     if value is False:
         raise ValidationError('Please read this to understand your duties as mentor.')
@@ -2324,6 +2596,19 @@ class MentorApproval(ApprovalStatus):
     def submission_and_approval_deadline(self):
         return self.project.round().internends + datetime.timedelta(days=7 * 5)
 
+    @classmethod
+    def submission_and_approval_deadline_expression(cls):
+        return models.ExpressionWrapper(
+            models.F('project__project_round__participating_round__internends') + datetime.timedelta(days=7 * 5),
+            output_field=models.DateField(),
+        )
+
+    dashboard_select_related = (
+        'mentor__account',
+        'project__project_round__community',
+        'project__project_round__participating_round',
+    )
+
     def is_approver(self, user):
         return self.project.project_round.community.is_coordinator(user)
 
@@ -2401,6 +2686,8 @@ class CoordinatorApproval(ApprovalStatus):
             kwargs['username'] = self.coordinator.account.username
         return self.community.reverse('coordinatorapproval-action', action=action, **kwargs)
 
+    dashboard_select_related = ('coordinator__account', 'community')
+
     def is_approver(self, user):
         return user.is_staff or self.community.is_coordinator(user)
 
@@ -2425,21 +2712,89 @@ class CoordinatorApproval(ApprovalStatus):
                 | models.Q(coordinator__account=user)
                 )
 
+    @classmethod
+    def dashboard_scope(cls, user):
+        if user.is_staff:
+            return 'staff'
+        return super(CoordinatorApproval, cls).dashboard_scope(user)
+
 
 # --------------------------------------------------------------------------- #
 # initial application models
 # --------------------------------------------------------------------------- #
 
 def create_time_commitment_calendar(tcs, application_round):
-    application_period_length = (application_round.internends - application_round.internstarts).days + 1
-    calendar = [0]*(application_period_length)
+    """
+    Returns a list with the total hours per week committed on each day of
+    the internship, from internstarts through internends inclusive.
+
+    Each commitment is converted to a range of day offsets. We record where
+    its hours start and stop counting, then a running sum over those changes
+    gives the load on every day. That costs one pass over the calendar no
+    matter how many commitments there are.
+    """
+    internstarts = application_round.internstarts
+    application_period_length = (application_round.internends - internstarts).days + 1
+    if application_period_length <= 0:
+        return []
+    changes = [0]*(application_period_length + 1)
     for tc in tcs:
-        date = application_round.internstarts
-        for i in range(application_period_length):
-            if date >= tc['start_date'] and date <= tc['end_date']:
-                calendar[i] = calendar[i] + tc['hours']
-            date = date + datetime.timedelta(days=1)
-    return calendar
+        first = max((tc['start_date'] - internstarts).days, 0)
+        last = min((tc['end_date'] - internstarts).days, application_period_length - 1)
+        if first <= last:
+            changes[first] += tc['hours']
+            changes[last + 1] -= tc['hours']
+    return list(accumulate(changes[:-1]))
+
+# Applicants with more than this many hours per week of other commitments
+# aren't considered free to do an internship.
+MAX_FREE_HOURS_PER_WEEK = 20
+
+def find_longest_free_period(calendar, max_hours=MAX_FREE_HOURS_PER_WEEK):
+    """
+    Finds the longest run of days in a calendar from
+    create_time_commitment_calendar where the applicant has at most
+    max_hours of other commitments. Returns the offset of the first day of
+    that run and its length. If there are several equally long runs, the
+    earliest wins. If there aren't any free days, the length is 0.
+    """
+    best_start = 0
+    best_length = 0
+    run_start = None
+    for day, hours in enumerate(calendar):
+        if hours > max_hours:
+            run_start = None
+            continue
+        if run_start is None:
+            run_start = day
+        if day - run_start + 1 > best_length:
+            best_start = run_start
+            best_length = day - run_start + 1
+    return best_start, best_length
+
+def summarize_time_commitment_calendar(calendar, application_round):
+    free_period_start_day, longest_period_free = find_longest_free_period(calendar)
+
+    internship_total_days = application_round.internends - application_round.internstarts
+
+    # Catch the case where the person is never free during the internship period
+    if longest_period_free == 0 and calendar:
+        longest_period_free = None
+        free_period_start_date = None
+        free_period_end_date = None
+        percentage_free = 0
+    else:
+        free_period_start_date = application_round.internstarts + datetime.timedelta(days=free_period_start_day)
+        free_period_end_date = application_round.internstarts + datetime.timedelta(days=free_period_start_day + longest_period_free - 1)
+        percentage_free = int(100 * longest_period_free / internship_total_days.days)
+
+    return {
+            'longest_period_free': longest_period_free,
+            'percentage_free': percentage_free,
+            'free_period_start_date': free_period_start_date,
+            'free_period_end_date': free_period_end_date,
+            'internship_total_days': internship_total_days,
+            }
 
 # Note: We cannot add a uniqueness constraint here,
 # because we are using one Comrade to make multiple review queues.
@@ -2494,6 +2849,13 @@ class ApplicantApproval(ApprovalStatus):
     review_owner = models.ForeignKey(ApplicationReviewer, blank=True, null=True, on_delete=models.SET_NULL)
     collected_statistics = models.BooleanField(default=False)
 
+    # Summary of this application's reviews and school information, so the
+    # review lists can filter on them without joining those tables. Kept
+    # current by update_review_state whenever either one changes.
+    has_review = models.BooleanField(default=False)
+    best_rating = models.CharField(max_length=2, blank=True)
+    is_student = models.BooleanField(default=False)
+
     # This information is saved to pass onto Software Freedom Conservancy accounting
     initial_application_country_living_in_during_internship = models.CharField(
             verbose_name='Country applicant will be living in during the internship - from initial application',
@@ -2507,6 +2869,38 @@ class ApplicantApproval(ApprovalStatus):
             blank=True,
             )
 
+    def update_review_state(self):
+        """
+        Recompute has_review, best_rating, and is_student from this
+        application's reviews and school information, and save them.
+        """
+        ApplicantApproval.update_review_states([self])
+
+    @classmethod
+    def update_review_states(cls, applications):
+        """
+        Like update_review_state, for several applications at once.
+        """
+        ratings = {}
+        for application_id, rating in InitialApplicationReview.objects.filter(
+            application__in=applications,
+        ).values_list('application_id', 'essay_rating'):
+            ratings.setdefault(application_id, set()).add(rating)
+        students = set(SchoolInformation.objects.filter(
+            applicant__in=applications,
+        ).values_list('applicant_id', flat=True))
+
+        for application in applications:
+            application_ratings = ratings.get(application.pk, ())
+            application.has_review = bool(application_ratings)
+            # RATING_CHOICES is in order from best to worst.
+            application.best_rating = next((r for r, _ in InitialApplicationReview.RATING_CHOICES if r in application_ratings), '')
+            application.is_student = application.pk in students
+
+        # Only update these fields, so this doesn't overwrite anything else
+        # that changed since the applications were loaded.
+        cls.objects.bulk_update(applications, ['has_review', 'best_rating', 'is_student'])
+
     def get_essay_qualities(self):
         return [q.__str__ for q in self.essay_qualities.all()]
 
@@ -2622,14 +3016,7 @@ class ApplicantApproval(ApprovalStatus):
                 if gender_identity.trans_feminine:
                     stats.total_trans_feminine_people += 1
 
-                non_binary_genders = [f.attname for f in gender_identity._meta.get_fields() if f.get_internal_type() == 'BooleanField' and f.name != 'prefer_not_to_say' and f.name != 'man' and f.name != 'woman' and f.name != 'trans_masculine' and f.name != 'trans_feminine' and f.name != 'transgender' and f.name != 'genderqueer']
-
-                is_non_binary = False
-                for gender in non_binary_genders:
-                    if getattr(gender_identity, gender) == True:
-                        is_non_binary = True
-
-                if is_non_binary:
+                if gender_identity.is_non_binary():
                     stats.total_non_binary_people += 1
 
                 if gender_identity.self_identify:
@@ -2729,11 +3116,9 @@ class ApplicantApproval(ApprovalStatus):
         return True
 
     def required_days_free(self):
-        try:
-            SchoolInformation.objects.get(applicant=self)
+        if self.is_student:
             return self.application_round.minimum_days_free_for_students
-        except SchoolInformation.DoesNotExist:
-            return self.application_round.minimum_days_free_for_non_students
+        return self.application_round.minimum_days_free_for_non_students
 
     def get_reason_for_status(self):
         if self.is_approved():
@@ -2797,71 +3182,175 @@ class ApplicantApproval(ApprovalStatus):
                 }
 
     def get_time_commitments(self, **kwargs):
-        current_round = self.application_round
-        relevant = models.Q(applicant=self, **kwargs)
+        """
+        Summarizes this applicant's time commitments and when they're free
+        during the internship. Any keyword arguments filter which time
+        commitments are considered.
+
+        Templates often ask for this several times for the same applicant
+        while rendering a single page, so the result for each set of filters
+        is remembered for as long as this object is around. Use
+        prefetch_time_commitments to fill in the results for many applicants
+        at once.
+        """
+        key = tuple(sorted(kwargs.items()))
+        memo = self.__dict__.setdefault('_time_commitments', {})
+        if key not in memo:
+            relevant = models.Q(applicant=self, **kwargs)
 
-        noncollege_school_time_commitments = NonCollegeSchoolTimeCommitment.objects.filter(relevant)
-        school_time_commitments = SchoolTimeCommitment.objects.filter(relevant).order_by('start_date')
-        volunteer_time_commitments = VolunteerTimeCommitment.objects.filter(relevant)
-        employment_time_commitments = EmploymentTimeCommitment.objects.filter(relevant)
+            try:
+                # XXX: there's at most one of these, but that isn't enforced in the model
+                contractor_time_commitment = self.contractorinformation_set.get()
+            except ContractorInformation.DoesNotExist:
+                contractor_time_commitment = None
+
+            memo[key] = self.summarize_time_commitments(
+                    school_time_commitments=SchoolTimeCommitment.objects.filter(relevant).order_by('start_date'),
+                    noncollege_school_time_commitments=NonCollegeSchoolTimeCommitment.objects.filter(relevant),
+                    volunteer_time_commitments=VolunteerTimeCommitment.objects.filter(relevant),
+                    employment_time_commitments=EmploymentTimeCommitment.objects.filter(relevant),
+                    contractor_time_commitment=contractor_time_commitment,
+                    )
+        return memo[key]
 
-        try:
-            # XXX: there's at most one of these, but that isn't enforced in the model
-            contractor_time_commitment = self.contractorinformation_set.get()
-        except ContractorInformation.DoesNotExist:
-            contractor_time_commitment = None
+    def remember_time_commitments(self, related_objects):
+        """
+        Fill in get_time_commitments() from a list of this applicant's
+        related objects, such as the ones an application form is about to
+        save, instead of reading them back from the database.
+        """
+        found = {
+                'school_time_commitments': [],
+                'noncollege_school_time_commitments': [],
+                'volunteer_time_commitments': [],
+                'employment_time_commitments': [],
+                'contractor_time_commitment': None,
+                }
+        for obj in related_objects:
+            if isinstance(obj, SchoolTimeCommitment):
+                found['school_time_commitments'].append(obj)
+            elif isinstance(obj, NonCollegeSchoolTimeCommitment):
+                found['noncollege_school_time_commitments'].append(obj)
+            elif isinstance(obj, VolunteerTimeCommitment):
+                found['volunteer_time_commitments'].append(obj)
+            elif isinstance(obj, EmploymentTimeCommitment):
+                found['employment_time_commitments'].append(obj)
+            elif isinstance(obj, ContractorInformation):
+                found['contractor_time_commitment'] = obj
+        found['school_time_commitments'].sort(key=lambda tc: tc.start_date)
+        self.__dict__.setdefault('_time_commitments', {})[()] = self.summarize_time_commitments(**found)
+
+    def summarize_time_commitments(self, **time_commitments):
+        calendar = create_time_commitment_calendar(
+                self.time_commitments_for_calendar(
+                    time_commitments['school_time_commitments'],
+                    time_commitments['noncollege_school_time_commitments'],
+                    time_commitments['volunteer_time_commitments'],
+                    time_commitments['employment_time_commitments'],
+                    ),
+                self.application_round)
+
+        result = summarize_time_commitment_calendar(calendar, self.application_round)
+        result.update(time_commitments)
+        return result
 
+    def time_commitments_for_calendar(self, school=(), noncollege_school=(), volunteer=(), employment=()):
         tcs = [ self.time_commitment_from_model(d, d.hours_per_week)
-                for d in volunteer_time_commitments or []
+                for d in volunteer or []
                 if d ]
         ctcs = [ self.time_commitment_from_model(d, 0 if d.quit_on_acceptance else d.hours_per_week)
-                for d in noncollege_school_time_commitments or []
+                for d in noncollege_school or []
                 if d ]
 
         etcs = [ self.time_commitment_from_model(d, 0 if d.quit_on_acceptance else d.hours_per_week)
-                for d in employment_time_commitments or []
+                for d in employment or []
                 if d ]
 
         stcs = [ self.time_commitment_from_model(d, 40)
-                for d in school_time_commitments or []
+                for d in school or []
                 if d ]
-        calendar = create_time_commitment_calendar(chain(tcs, ctcs, etcs, stcs), current_round)
-
-        longest_period_free = 0
-        free_period_start_day = 0
-        counter = 0
-        for key, group in groupby(calendar, lambda hours: hours <= 20):
-            group_len = len(list(group))
-            if key is True and group_len > longest_period_free:
-                longest_period_free = group_len
-                free_period_start_day = counter
-            counter = counter + group_len
-
-        internship_total_days = current_round.internends - current_round.internstarts
-
-        # Catch the case where the person is never free during the internship period
-        if longest_period_free == 0 and free_period_start_day == 0 and counter != 0:
-            longest_period_free = None
-            free_period_start_date = None
-            free_period_end_date = None
-            percentage_free = 0
-        else:
-            free_period_start_date = current_round.internstarts + datetime.timedelta(days=free_period_start_day)
-            free_period_end_date = current_round.internstarts + datetime.timedelta(days=free_period_start_day + longest_period_free - 1)
-            percentage_free = int(100 * longest_period_free / internship_total_days.days)
+        return chain(tcs, ctcs, etcs, stcs)
 
-        return {
-                'longest_period_free': longest_period_free,
-                'percentage_free': percentage_free,
-                'free_period_start_date': free_period_start_date,
-                'free_period_end_date': free_period_end_date,
-                'internship_total_days': internship_total_days,
-                'school_time_commitments': school_time_commitments,
-                'noncollege_school_time_commitments': noncollege_school_time_commitments,
-                'volunteer_time_commitments': volunteer_time_commitments,
-                'employment_time_commitments': employment_time_commitments,
-                'contractor_time_commitment': contractor_time_commitment,
+    @classmethod
+    def prefetch_time_commitments(cls, applicants, **kwargs):
+        """
+        Loads the time commitments for a list of applicants using one query
+        per kind of time commitment, instead of several queries for each
+        applicant. Afterward, calling get_time_commitments on any of these
+        objects with the same keyword arguments doesn't need any queries.
+
+        The list may contain several objects for the same applicant, such as
+        when each one came from a different contribution; they all get the
+        results.
+        """
+        by_pk = {}
+        for applicant in applicants:
+            by_pk.setdefault(applicant.pk, []).append(applicant)
+        if not by_pk:
+            return
+
+        relevant = models.Q(applicant__in=by_pk.keys(), **kwargs)
+        found = {
+                pk: {
+                    'school_time_commitments': [],
+                    'noncollege_school_time_commitments': [],
+                    'volunteer_time_commitments': [],
+                    'employment_time_commitments': [],
+                    'contractor_time_commitment': None,
+                    }
+                for pk in by_pk
                 }
+        for key, commitments in (
+                ('school_time_commitments', SchoolTimeCommitment.objects.filter(relevant).order_by('start_date')),
+                ('noncollege_school_time_commitments', NonCollegeSchoolTimeCommitment.objects.filter(relevant)),
+                ('volunteer_time_commitments', VolunteerTimeCommitment.objects.filter(relevant)),
+                ('employment_time_commitments', EmploymentTimeCommitment.objects.filter(relevant)),
+                ):
+            for tc in commitments:
+                found[tc.applicant_id][key].append(tc)
+
+        for contractor in ContractorInformation.objects.filter(applicant__in=by_pk.keys()):
+            found[contractor.applicant_id]['contractor_time_commitment'] = contractor
+
+        # Only look up rounds which the caller didn't already load.
+        round_ids = set(
+                a.application_round_id
+                for a in chain.from_iterable(by_pk.values())
+                if not cls.application_round.is_cached(a)
+                )
+        rounds = RoundPage.objects.in_bulk(round_ids) if round_ids else {}
+
+        key = tuple(sorted(kwargs.items()))
+        for pk, same_applicant in by_pk.items():
+            for applicant in same_applicant:
+                if applicant.application_round_id in rounds:
+                    applicant.application_round = rounds[applicant.application_round_id]
+            result = same_applicant[0].summarize_time_commitments(**found[pk])
+            for applicant in same_applicant:
+                applicant.__dict__.setdefault('_time_commitments', {})[key] = result
+
+    @classmethod
+    def get_free_periods(cls, applicants, **kwargs):
+        """
+        Computes the free period summary from get_time_commitments for a
+        whole list of applicants at once, using prefetch_time_commitments.
+        Returns a dictionary mapping each applicant's primary key to the free
+        period summary, without the lists of time commitments.
+        """
+        applicants = list(applicants)
+        cls.prefetch_time_commitments(applicants, **kwargs)
+        keys = (
+                'longest_period_free',
+                'percentage_free',
+                'free_period_start_date',
+                'free_period_end_date',
+                'internship_total_days',
+                )
+        free_periods = {}
+        for applicant in applicants:
+            tcs = applicant.get_time_commitments(**kwargs)
+            free_periods[applicant.pk] = { key: tcs[key] for key in keys }
+        return free_periods
 
     def get_relevant_time_commitments(self):
         """
@@ -2937,6 +3426,9 @@ class ApplicantApproval(ApprovalStatus):
         unique_together = (
                 ('applicant', 'application_round'),
                 )
+        indexes = [
+            models.Index(fields=['application_round', 'approval_status', 'has_review', 'best_rating']),
+        ]
 
 def get_answers_for_all_booleans(obj):
     # getattr looks up the field's value on the object
@@ -3074,6 +3566,76 @@ class ApplicantGenderIdentity(models.Model):
             blank=True,
             help_text="If your gender identity is NOT listed above, what is your gender identity? Please note that 'gender identity' is NOT your name. Gender identity is your gender.")
 
+    # Each of the boolean fields above is also stored as one bit in
+    # `identities`, so that statistics can count any combination of gender
+    # identities in a single query. The bit for each field is its position
+    # in this list, so only ever add new fields to the end.
+    IDENTITY_FIELDS = (
+            'transgender',
+            'genderqueer',
+            'man',
+            'woman',
+            'demi_boy',
+            'demi_girl',
+            'trans_masculine',
+            'trans_feminine',
+            'non_binary',
+            'demi_non_binary',
+            'genderflux',
+            'genderfluid',
+            'demi_genderfluid',
+            'demi_gender',
+            'bi_gender',
+            'tri_gender',
+            'multigender',
+            'pangender',
+            'maxigender',
+            'aporagender',
+            'intergender',
+            'mavrique',
+            'gender_confusion',
+            'gender_indifferent',
+            'graygender',
+            'agender',
+            'genderless',
+            'gender_neutral',
+            'neutrois',
+            'androgynous',
+            'androgyne',
+            'prefer_not_to_say',
+            )
+
+    identities = models.BigIntegerField(default=0, editable=False)
+
+    @classmethod
+    def identity_mask(cls, *fields, exclude=()):
+        """
+        Returns the bits in `identities` for the given fields, or for every
+        field except those in `exclude` if no fields are given.
+        """
+        if not fields:
+            fields = [f for f in cls.IDENTITY_FIELDS if f not in exclude]
+        mask = 0
+        for field in fields:
+            mask |= 1 << cls.IDENTITY_FIELDS.index(field)
+        return mask
+
+    def get_identities(self):
+        identities = 0
+        for bit, field in enumerate(self.IDENTITY_FIELDS):
+            if getattr(self, field):
+                identities |= 1 << bit
+        return identities
+
+    def is_non_binary(self):
+        return bool(self.get_identities() & NON_BINARY_IDENTITIES)
+
+    def save(self, *args, **kwargs):
+        self.identities = self.get_identities()
+        if kwargs.get('update_fields') is not None:
+            kwargs['update_fields'] = set(kwargs['update_fields']) | {'identities'}
+        super(ApplicantGenderIdentity, self).save(*args, **kwargs)
+
     # Iterate over the fields in self
     # if they're true, return a comma separated list of gender identities,
     # e.g. 'non-binary, agender and self-identify as ⚨'
@@ -3104,6 +3666,25 @@ class ApplicantGenderIdentity(models.Model):
             ({ 'verbose_name': 'What is your gender identity?' }, str(self)),
         ]
 
+# Applicants are counted as non-binary if they chose any gender identity
+# besides these.
+NON_BINARY_IDENTITIES = ApplicantGenderIdentity.identity_mask(exclude=(
+    'transgender',
+    'genderqueer',
+    'man',
+    'woman',
+    'trans_masculine',
+    'trans_feminine',
+    'prefer_not_to_say',
+))
+
+# Applicants are counted as cisgender if they chose none of these.
+NOT_CISGENDER_IDENTITIES = ApplicantGenderIdentity.identity_mask(exclude=(
+    'man',
+    'woman',
+    'prefer_not_to_say',
+))
+
 
 class ApplicantRaceEthnicityInformation(models.Model):
     applicant = models.OneToOneField(ApplicantApproval, on_delete=models.CASCADE, primary_key=True)
@@ -3622,6 +4203,27 @@ class InitialApplicationReview(models.Model):
             verbose_name="Reviewer comments",
             help_text="Please provide any comments on the status of this initial application, or questions you have while reviewing it.")
 
+    # Names for each rating, as used in URLs and the batch review API
+    RATING_NAMES = {
+        'STRONG': STRONG,
+        'GOOD': GOOD,
+        'MAYBE': MAYBE,
+        'UNCLEAR': UNCLEAR,
+        'UNRATED': UNRATED,
+        'NOTCOMPELLING': NOTCOMPELLING,
+        'NOTUNDERSTOOD': NOTUNDERSTOOD,
+        'SPAM': SPAM,
+    }
+
+    # Time commitment red flags which reviewers can set or unset
+    RED_FLAGS = (
+        'review_school',
+        'missing_school',
+        'review_work',
+        'missing_work',
+        'incorrect_dates',
+    )
+
     def get_essay_rating(self):
         if self.essay_rating == self.UNRATED:
             return ''
@@ -3862,6 +4464,10 @@ class FinalApplication(ApprovalStatus):
     def submission_and_approval_deadline(self):
         return self.project.round().contributions_close
 
+    @classmethod
+    def submission_and_approval_deadline_expression(cls):
+        return models.F('project__project_round__participating_round__contributions_close')
+
     def number_contributions(self):
         return Contribution.objects.filter(
                 project=self.project,
@@ -5100,6 +5706,299 @@ class InformalChatContact(models.Model):
         if self.comrade:
             return self.comrade.account.email
 
+class OutboundEmail(models.Model):
+    """
+    An email message which the web site has generated but not yet handed to
+    the mail server. In production, the email backend (home.email.OutboxBackend)
+    just saves messages here, as part of the same transaction as whatever
+    caused them to be sent, and the deliver_outbox management command sends
+    them later.
+    """
+    QUEUED = 'Q'
+    SENT = 'S'
+    FAILED = 'F'
+    STATUS_CHOICES = (
+        (QUEUED, 'Queued'),
+        (SENT, 'Sent'),
+        (FAILED, 'Failed'),
+    )
+
+    # A message which fails to send is retried after RETRY_DELAY, then after
+    # twice that, and so on, until it has been tried MAX_ATTEMPTS times.
+    MAX_ATTEMPTS = 8
+    RETRY_DELAY = datetime.timedelta(minutes=1)
+
+    # If a worker claims a message but dies before recording whether it was
+    # sent, another worker may try it again after this long.
+    CLAIM_TIMEOUT = datetime.timedelta(minutes=10)
+
+    # Sent messages are kept this long, in case anyone asks what we sent them.
+    SENT_RETENTION = datetime.timedelta(days=30)
+
+    status = models.CharField(max_length=1, choices=STATUS_CHOICES, default=QUEUED)
+    created = models.DateTimeField(auto_now_add=True)
+    next_attempt = models.DateTimeField(auto_now_add=True)
+    attempts = models.PositiveSmallIntegerField(default=0)
+    sent = models.DateTimeField(null=True, blank=True)
+    last_error = models.TextField(blank=True)
+
+    from_email = models.TextField()
+    to = models.JSONField(default=list)
+    cc = models.JSONField(default=list)
+    bcc = models.JSONField(default=list)
+    reply_to = models.JSONField(default=list)
+    subject = models.TextField()
+    body = models.TextField()
+    content_subtype = models.CharField(max_length=SENTENCE_LENGTH, default='plain')
+    headers = models.JSONField(default=dict)
+    # Other versions of the body, like HTML, as [content, mimetype] pairs
+    alternatives = models.JSONField(default=list)
+    # Attached files, as objects with the filename, mimetype, and content
+    # encoded in base64; 'text' is set if the content was a string.
+    attachments = models.JSONField(default=list)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['status', 'next_attempt']),
+        ]
+
+    def __str__(self):
+        return '{} to {}'.format(self.subject, ', '.join(self.to))
+
+    @classmethod
+    def from_message(cls, message):
+        """
+        Make an unsaved OutboundEmail from a Django EmailMessage. Addresses
+        may be email.headerregistry.Address objects, so store their string
+        forms instead.
+
+        Raises ValueError for anything which can't be stored, rather than
+        quietly sending a different message later.
+        """
+        if type(message) not in (EmailMessage, EmailMultiAlternatives):
+            raise ValueError("Can't queue a {} in the outbox".format(type(message).__name__))
+
+        attachments = []
+        for attachment in message.attachments:
+            if not isinstance(attachment, tuple):
+                raise ValueError("Can't queue an attachment which is already a MIME object")
+            filename, content, mimetype = attachment
+            text = isinstance(content, str)
+            if text:
+                content = content.encode()
+            attachments.append({
+                'filename': filename,
+                'mimetype': mimetype,
+                'content': b64encode(content).decode('ascii'),
+                'text': text,
+            })
+
+        return cls(
+            from_email=str(message.from_email),
+            to=[str(a) for a in message.to],
+            cc=[str(a) for a in message.cc],
+            bcc=[str(a) for a in message.bcc],
+            reply_to=[str(a) for a in message.reply_to],
+            subject=str(message.subject),
+            body=message.body,
+            content_subtype=message.content_subtype,
+            headers={str(k): str(v) for k, v in message.extra_headers.items()},
+            alternatives=[[content, mimetype] for content, mimetype in getattr(message, 'alternatives', [])],
+            attachments=attachments,
+        )
+
+    def to_message(self, connection=None):
+        message = EmailMultiAlternatives(
+            subject=self.subject,
+            body=self.body,
+            from_email=self.from_email,
+            to=self.to,
+            cc=self.cc,
+            bcc=self.bcc,
+            reply_to=self.reply_to,
+            headers=self.headers,
+            alternatives=[tuple(alternative) for alternative in self.alternatives],
+            connection=connection,
+        )
+        message.content_subtype = self.content_subtype
+        for attachment in self.attachments:
+            content = b64decode(attachment['content'])
+            if attachment['text']:
+                content = content.decode()
+            message.attach(attachment['filename'], content, attachment['mimetype'])
+        return message
+
+    @classmethod
+    def claim(cls, limit, now):
+        """
+        Pick up to `limit` queued messages which are due to be sent, and
+        push their next attempt back so other workers leave them alone while
+        this one sends them. Returns the claimed messages, oldest first.
+        """
+        with transaction.atomic():
+            due = cls.objects.select_for_update(skip_locked=True).filter(
+                status=cls.QUEUED,
+                next_attempt__lte=now,
+            ).order_by('next_attempt', 'pk')
+            claimed = list(due[:limit])
+            cls.objects.filter(pk__in=[m.pk for m in claimed]).update(
+                next_attempt=now + cls.CLAIM_TIMEOUT,
+            )
+        return claimed
+
+    @classmethod
+    def deliver(cls, connection, limit=100):
+        """
+        Send one batch of due messages through `connection`, which should
+        already be open so every message in the batch reuses it. Each message
+        is sent and recorded on its own, so one bad address doesn't hold up
+        the rest. Returns how many messages were sent and how many failed.
+        """
+        now = datetime.datetime.now(datetime.timezone.utc)
+        sent = failed = 0
+        for outbound in cls.claim(limit, now):
+            outbound.attempts += 1
+            try:
+                # Reconnect if an earlier failure closed the connection.
+                started = time.monotonic()
+                connection.open()
+                connection.send_messages([outbound.to_message()])
+                email.record_email_delivery(1, time.monotonic() - started)
+            except Exception as e:
+                # Don't trust the connection after an error.
+                connection.close()
+                failed += 1
+                outbound.last_error = '{}: {}'.format(type(e).__name__, e)
+                if outbound.attempts >= cls.MAX_ATTEMPTS:
+                    outbound.status = cls.FAILED
+                else:
+                    outbound.next_attempt = now + cls.RETRY_DELAY * 2 ** (outbound.attempts - 1)
+            else:
+                sent += 1
+                outbound.status = cls.SENT
+                outbound.sent = datetime.datetime.now(datetime.timezone.utc)
+                outbound.last_error = ''
+            outbound.save(update_fields=['status', 'attempts', 'next_attempt', 'sent', 'last_error'])
+        return sent, failed
+
+    @classmethod
+    def purge_sent(cls):
+        now = datetime.datetime.now(datetime.timezone.utc)
+        return cls.objects.filter(status=cls.SENT, sent__lt=now - cls.SENT_RETENTION).delete()[0]
+
+class BulkEmailCheckpoint(models.Model):
+    """
+    How far an unfinished run of home.email.send_bulk_template_mail got, so
+    it can resume there instead of emailing the same people twice.
+    """
+    name = models.CharField(max_length=SENTENCE_LENGTH, primary_key=True)
+    last_pk = models.BigIntegerField()
+    sent = models.PositiveIntegerField(default=0)
+    updated = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return '{} ({} sent)'.format(self.name, self.sent)
+
+class EmailSendMetrics(models.Model):
+    """
+    Measurements from one send of a staff email reminder (a SendEmailView in
+    home/dashboard.py), collected by home.email.EmailMetrics. Previews are
+    only logged, not recorded here.
+
+    In production the reminders are only queued in the outbox, so
+    `transactions` and `delivery_seconds` stay zero; the deliver_outbox
+    command logs how long the mail server took to accept them.
+    """
+    internship_round = models.ForeignKey(RoundPage, on_delete=models.CASCADE)
+    # The RoundEvent's slug, as used in its "email-<slug>" URL name
+    event = models.SlugField(max_length=SENTENCE_LENGTH)
+    recorded = models.DateTimeField(auto_now_add=True)
+
+    messages = models.PositiveIntegerField(default=0)
+    transactions = models.PositiveIntegerField(default=0)
+    render_seconds = models.FloatField(default=0)
+    render_queries = models.PositiveIntegerField(default=0)
+    delivery_seconds = models.FloatField(default=0)
+    total_seconds = models.FloatField(default=0)
+    # Renders, seconds, and queries for each template, by template name
+    templates = models.JSONField(default=dict)
+
+    class Meta:
+        ordering = ['-recorded']
+        indexes = [
+            models.Index(fields=['internship_round', 'event', 'recorded']),
+        ]
+
+    def __str__(self):
+        return '{} - {} - {}'.format(self.recorded, self.event, self.internship_round)
+
+    @classmethod
+    def record(cls, metrics, internship_round, event):
+        return cls.objects.create(
+            internship_round=internship_round,
+            event=event,
+            messages=metrics.messages,
+            transactions=metrics.transactions,
+            render_seconds=metrics.render_seconds,
+            render_queries=metrics.render_queries,
+            delivery_seconds=metrics.delivery_seconds,
+            total_seconds=metrics.total_seconds,
+            templates=metrics.templates,
+        )
+
+class WizardProgress(models.Model):
+    """
+    Where a person is in a multi-page form wizard, kept by
+    home.wizard_storage.DatabaseStorage instead of in their session. The
+    answers to each page are in WizardStepData.
+    """
+    user = models.ForeignKey(User, on_delete=models.CASCADE)
+    # The wizard's storage prefix, which is derived from the view's name
+    prefix = models.CharField(max_length=SENTENCE_LENGTH)
+    current_step = models.CharField(max_length=SENTENCE_LENGTH, blank=True)
+    extra_data = models.JSONField(default=dict)
+    updated = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        unique_together = (
+                ('user', 'prefix'),
+                )
+
+    def __str__(self):
+        return '{} - {} - {}'.format(self.user, self.prefix, self.current_step)
+
+    @staticmethod
+    def expiry_cutoff():
+        """
+        Progress which hasn't been touched since this time is thrown away,
+        as if the session it would otherwise have been kept in had expired.
+        """
+        max_age = datetime.timedelta(seconds=settings.SESSION_COOKIE_AGE)
+        return datetime.datetime.now(datetime.timezone.utc) - max_age
+
+    @classmethod
+    def purge_expired(cls):
+        """
+        Delete abandoned progress, which may include sensitive answers from
+        the eligibility wizard. Returns how many wizards were deleted.
+        """
+        count, _ = cls.objects.filter(updated__lt=cls.expiry_cutoff()).delete()
+        return count
+
+class WizardStepData(models.Model):
+    progress = models.ForeignKey(WizardProgress, on_delete=models.CASCADE, related_name='steps')
+    step = models.CharField(max_length=SENTENCE_LENGTH)
+    # The submitted form data, as lists of values keyed by field name
+    data = models.JSONField(default=dict)
+
+    class Meta:
+        unique_together = (
+                ('progress', 'step'),
+                )
+
+    def __str__(self):
+        return '{} - {}'.format(self.progress, self.step)
+
 class Role(object):
     """
     Compute the role which the current visitor most likely is interested in for
@@ -5301,6 +6200,109 @@ class Role(object):
     def projects_not_applied_to(self):
         return [ p for p in self.projects_contributed_to if not p.did_apply ]
 
+class RoundTimeline(object):
+    """
+    Answer "which round is in this phase today?" without going back to the
+    database every time somebody asks.
+
+    Views and dashboard sections used to each run their own
+    ``RoundPage.objects.filter(...).latest(...)`` query to find the round
+    they care about. A timeline loads every RoundPage once, binds ``today``
+    on each of them for the ``AugmentDeadlines`` machinery, and then
+    answers those questions in memory. The query methods mirror the subset
+    of the QuerySet API that those call sites used, including raising
+    ``RoundPage.DoesNotExist``, so callers don't need to change their error
+    handling::
+
+        timeline = RoundTimeline(today)
+        timeline.get(pingnew__lte=today, internannounce__gt=today)
+        timeline.filter(internannounce__lte=today).latest('internstarts')
+
+    Only date comparisons (``lt``, ``lte``, ``gt``, ``gte``) and exact
+    matches are supported. Like SQL, a comparison against a field that is
+    NULL never matches.
+
+    There are only a few dozen rounds, so loading all of them is cheaper
+    than a dozen separate queries. Use ``for_request`` to share one
+    timeline between everything that renders a single page.
+
+    This is not a Django model and does not have a database representation.
+    """
+
+    OPERATORS = {
+        'lt': lambda value, other: value < other,
+        'lte': lambda value, other: value <= other,
+        'gt': lambda value, other: value > other,
+        'gte': lambda value, other: value >= other,
+        'exact': lambda value, other: value == other,
+    }
+
+    def __init__(self, today, rounds=None):
+        self.today = today
+        self._rounds = rounds
+
+    @classmethod
+    def for_request(cls, request, today):
+        """
+        Return the timeline attached to this request, loading it on first
+        use. A new timeline is loaded if a caller asks about a different
+        ``today``, so the bound dates are always consistent.
+        """
+        timeline = getattr(request, '_round_timeline', None)
+        if timeline is None or timeline.today != today:
+            timeline = cls(today)
+            request._round_timeline = timeline
+        return timeline
+
+    @property
+    def rounds(self):
+        if self._rounds is None:
+            self._rounds = list(RoundPage.objects.order_by('internstarts'))
+            for r in self._rounds:
+                r.today = self.today
+        return self._rounds
+
+    def __iter__(self):
+        return iter(self.rounds)
+
+    def __len__(self):
+        return len(self.rounds)
+
+    def filter(self, **conditions):
+        checks = []
+        for lookup, other in conditions.items():
+            field, _, operator = lookup.partition('__')
+            checks.append((field, self.OPERATORS[operator or 'exact'], other))
+
+        def matches(r):
+            for field, operator, other in checks:
+                value = getattr(r, field)
+                if value is None or not operator(value, other):
+                    return False
+            return True
+
+        return RoundTimeline(self.today, [r for r in self.rounds if matches(r)])
+
+    def get(self, **conditions):
+        matches = self.filter(**conditions).rounds
+        if not matches:
+            raise RoundPage.DoesNotExist('No round matches {!r}'.format(conditions))
+        if len(matches) > 1:
+            raise RoundPage.MultipleObjectsReturned('{} rounds match {!r}'.format(len(matches), conditions))
+        return matches[0]
+
+    def latest(self, field):
+        return self._extreme(max, field)
+
+    def earliest(self, field):
+        return self._extreme(min, field)
+
+    def _extreme(self, pick, field):
+        candidates = [r for r in self.rounds if getattr(r, field) is not None]
+        if not candidates:
+            raise RoundPage.DoesNotExist('No round has a {}'.format(field))
+        return pick(candidates, key=lambda r: getattr(r, field))
+
 # --- Deprecated models ---
 #
 # These models are ones we historically used to collect internship feedback.
@@ -5915,3 +6917,176 @@ DASHBOARD_MODELS = (
         Project,
         MentorApproval,
         )
+
+# Several cached results below can't be found and deleted when the data they
+# came from changes. Instead, each cache key includes a generation number,
+# and the signal handlers start a new generation. Stale keys just expire on
+# their own.
+def cache_generation(key):
+    """
+    Current generation number stored under `key`, to include in cache keys.
+    """
+    return cache.get_or_set(key, 0, None)
+
+def bump_cache_generation(key):
+    """
+    Start a new generation under `key`, so everything cached with the old
+    generation number is ignored.
+    """
+    try:
+        cache.incr(key)
+    except ValueError:
+        # Nobody has used this generation since the cache was last cleared.
+        cache.set(key, 1, None)
+
+# The site header shows everyone how many dashboard items are waiting on
+# them, and that count is cached (see home/context_processors.py). Any change
+# to one of these models may change somebody's count, so start a new
+# generation of cache keys whenever one is saved or deleted.
+PENDING_APPROVALS_GENERATION_KEY = 'pending-approvals-generation'
+
+def invalidate_pending_approvals(sender, **kwargs):
+    bump_cache_generation(PENDING_APPROVALS_GENERATION_KEY)
+
+for dashboard_model in DASHBOARD_MODELS:
+    signals.post_save.connect(invalidate_pending_approvals, sender=dashboard_model)
+    signals.post_delete.connect(invalidate_pending_approvals, sender=dashboard_model)
+
+# Summaries of the skills projects need are cached for each round (see
+# RoundPage.get_common_skills). Start a new generation of cache keys whenever
+# a project or project skill changes. Other processes may have their own local
+# cache which doesn't see this, so don't let them get too far behind either.
+COMMON_SKILLS_GENERATION_KEY = 'common-skills-generation'
+COMMON_SKILLS_TIMEOUT = 15 * 60
+
+def invalidate_common_skills(sender, **kwargs):
+    bump_cache_generation(COMMON_SKILLS_GENERATION_KEY)
+
+# ProjectSkill.save() invalidates the cache itself once it has updated the
+# skill's categories.
+signals.post_delete.connect(invalidate_common_skills, sender=ProjectSkill)
+signals.post_save.connect(invalidate_common_skills, sender=Project)
+signals.post_delete.connect(invalidate_common_skills, sender=Project)
+
+def update_application_review_state(sender, instance, **kwargs):
+    try:
+        application = instance.application if sender is InitialApplicationReview else instance.applicant
+    except ApplicantApproval.DoesNotExist:
+        # The application itself is being deleted.
+        return
+    application.update_review_state()
+
+for review_model in (InitialApplicationReview, SchoolInformation):
+    signals.post_save.connect(update_application_review_state, sender=review_model)
+    signals.post_delete.connect(update_application_review_state, sender=review_model)
+
+# The dashboard's application summary counts are cached for each round (see
+# RoundPage.get_initial_application_counts), and shared by every reviewer.
+# Start a new generation of cache keys whenever anything they count changes,
+# and keep the timeout short for processes with their own local cache.
+INITIAL_APPLICATION_COUNTS_GENERATION_KEY = 'initial-application-counts-generation'
+INITIAL_APPLICATION_COUNTS_TIMEOUT = 60
+
+def invalidate_initial_application_counts(sender, **kwargs):
+    bump_cache_generation(INITIAL_APPLICATION_COUNTS_GENERATION_KEY)
+
+for counted_model in (ApplicantApproval, InitialApplicationReview, SchoolInformation):
+    signals.post_save.connect(invalidate_initial_application_counts, sender=counted_model)
+    signals.post_delete.connect(invalidate_initial_application_counts, sender=counted_model)
+
+# The list of communities and projects on the project selection page (see
+# views.current_round_page) is cached for each round and each kind of
+# visitor. Start a new generation of cache keys whenever anything shown in
+# that list changes, including a participation or project being approved.
+PROJECT_SELECTION_GENERATION_KEY = 'project-selection-generation'
+PROJECT_SELECTION_TIMEOUT = 5 * 60
+
+def invalidate_project_selection(sender, **kwargs):
+    bump_cache_generation(PROJECT_SELECTION_GENERATION_KEY)
+
+for listed_model in (Community, Participation, Project, ProjectSkill):
+    signals.post_save.connect(invalidate_project_selection, sender=listed_model)
+    signals.post_delete.connect(invalidate_project_selection, sender=listed_model)
+
+# Pages which look the same to everyone who isn't logged in are cached whole
+# (see home.page_cache.cache_anonymous_page). Each of these models has its own
+# generation of cache keys, and each cached page names the models it shows,
+# so approving a project doesn't throw away the cached documentation.
+ANONYMOUS_PAGE_MODELS = (
+        RoundPage,
+        Participation,
+        Project,
+        RoundStatisticsSnapshot,
+        )
+ANONYMOUS_PAGE_TIMEOUT = 10 * 60
+
+def anonymous_page_generation_key(model):
+    return 'anonymous-page-generation:{}'.format(model._meta.label_lower)
+
+def invalidate_anonymous_pages(sender, **kwargs):
+    bump_cache_generation(anonymous_page_generation_key(sender))
+
+for page_model in ANONYMOUS_PAGE_MODELS:
+    signals.post_save.connect(invalidate_anonymous_pages, sender=page_model)
+    signals.post_delete.connect(invalidate_anonymous_pages, sender=page_model)
+
+# The alums pages (see views.alums_page) cache the list of cohorts, and each
+# cohort's list of interns. The list of cohorts changes when a RoundPage or
+# CohortPage is saved. Each cohort's interns have their own generation, so
+# past cohorts stay cached while the current one is changing.
+#
+# Interns' profiles, projects, and communities can also change, but those
+# changes only show up once the cache times out.
+ALUMS_INDEX_GENERATION_KEY = 'alums-index-generation'
+ALUMS_TIMEOUT = 60 * 60
+
+def invalidate_alums_index(sender, **kwargs):
+    bump_cache_generation(ALUMS_INDEX_GENERATION_KEY)
+
+for cohort_model in (RoundPage, CohortPage):
+    signals.post_save.connect(invalidate_alums_index, sender=cohort_model)
+    signals.post_delete.connect(invalidate_alums_index, sender=cohort_model)
+
+def alums_cohort_generation_key(page):
+    """
+    `page` is the RoundPage or CohortPage which lists the cohort's interns.
+    """
+    return 'alums-cohort-generation:{}:{}'.format(page._meta.label_lower, page.pk)
+
+def invalidate_alums_cohort(page):
+    bump_cache_generation(alums_cohort_generation_key(page))
+
+# Look up the round by ID, rather than following foreign keys from the
+# instance, because some of them may already be deleted.
+def invalidate_alums_intern_selection(sender, instance, **kwargs):
+    for round_id in Project.objects.filter(pk=instance.project_id).values_list('project_round__participating_round_id', flat=True):
+        invalidate_alums_cohort(RoundPage(pk=round_id))
+
+def invalidate_alums_mentor_relationship(sender, instance, **kwargs):
+    for round_id in InternSelection.objects.filter(pk=instance.intern_selection_id).values_list('project__project_round__participating_round_id', flat=True):
+        invalidate_alums_cohort(RoundPage(pk=round_id))
+
+def invalidate_alums_alum_info(sender, instance, **kwargs):
+    invalidate_alums_cohort(CohortPage(pk=instance.page_id))
+
+for receiver, intern_model in (
+        (invalidate_alums_intern_selection, InternSelection),
+        (invalidate_alums_mentor_relationship, MentorRelationship),
+        (invalidate_alums_alum_info, AlumInfo),
+        ):
+    signals.post_save.connect(receiver, sender=intern_model)
+    signals.post_delete.connect(receiver, sender=intern_model)
+
+# The blog feed and index page (see home.feeds.WagtailFeed) list every live
+# child of the blog index, so start a new generation of cache keys whenever
+# any Wagtail page is published or unpublished. Wagtail also unpublishes live
+# pages before deleting them. Changes to the blog posts in home/blog.py are
+# picked up by home.feeds.BLOG_POSTS_VERSION instead.
+BLOG_FEED_GENERATION_KEY = 'blog-feed-generation'
+BLOG_FEED_TIMEOUT = 10 * 60
+
+def invalidate_blog_feed(sender, **kwargs):
+    bump_cache_generation(BLOG_FEED_GENERATION_KEY)
+
+page_published.connect(invalidate_blog_feed)
+page_unpublished.connect(invalidate_blog_feed)
@@ -0,0 +1,69 @@
+from django.core.cache import cache
+from functools import wraps
+import datetime
+import hashlib
+
+from .models import ANONYMOUS_PAGE_MODELS
+from .models import ANONYMOUS_PAGE_TIMEOUT
+from .models import anonymous_page_generation_key
+from .models import cache_generation
+from .models import get_deadline_date_for
+
+def anonymous_page_cache_key(request, models):
+    """
+    Pages change when the models they show change, and when a deadline
+    passes, which happens at most once a day.
+    """
+    now = datetime.datetime.now(datetime.timezone.utc)
+    generations = [
+        cache_generation(anonymous_page_generation_key(model))
+        for model in models
+    ]
+    return 'anonymous-page:{}:{}:{}'.format(
+        hashlib.md5(request.get_full_path().encode()).hexdigest(),
+        get_deadline_date_for(now),
+        ':'.join(str(generation) for generation in generations),
+    )
+
+def is_shareable(request, response):
+    # A response which sets a cookie, such as a CSRF token, belongs to the
+    # person who asked for it.
+    return (
+        response.status_code == 200
+        and not response.streaming
+        and not response.cookies
+        and not response.has_header('Vary')
+        and not request.META.get('CSRF_COOKIE_NEEDS_UPDATE')
+    )
+
+def cache_anonymous_page(*models, timeout=ANONYMOUS_PAGE_TIMEOUT):
+    """
+    Decorate a view to cache its whole response for people who aren't
+    logged in, and share it between all of them. Logged in people see
+    things like their name and their dashboard in every page, so they
+    always get a freshly rendered page.
+
+    List the models which the page shows. The page is rendered again after
+    any of them is saved or deleted, or after the next deadline passes.
+    Each model must be listed in home.models.ANONYMOUS_PAGE_MODELS.
+    """
+    for model in models:
+        if model not in ANONYMOUS_PAGE_MODELS:
+            raise ValueError('{} is not in ANONYMOUS_PAGE_MODELS'.format(model.__name__))
+
+    def decorator(view):
+        @wraps(view)
+        def wrapper(request, *args, **kwargs):
+            if request.method not in ('GET', 'HEAD') or request.user.is_authenticated:
+                return view(request, *args, **kwargs)
+
+            key = anonymous_page_cache_key(request, models)
+            response = cache.get(key)
+            if response is None:
+                response = view(request, *args, **kwargs)
+                if is_shareable(request, response):
+                    cache.set(key, response, timeout)
+            return response
+        wrapper.anonymous_page_models = models
+        return wrapper
+    return decorator
@@ -0,0 +1,65 @@
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from .factories import InternSelectionFactory
+
+
+def cohort_url(intern_selection):
+    starts = intern_selection.round().internstarts
+    return reverse('cohort', kwargs={
+        'year': starts.year,
+        'month': str(starts.month).rjust(2, '0'),
+    })
+
+
+# don't try to use the static files manifest during tests
+@override_settings(STATICFILES_STORAGE='django.contrib.staticfiles.storage.StaticFilesStorage')
+class AlumsPageTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.past_intern = InternSelectionFactory(
+            active=True,
+            round__start_from='internstarts',
+            round__days_after_today=-400,
+        )
+        self.recent_intern = InternSelectionFactory(
+            active=True,
+            round__start_from='internstarts',
+            round__days_after_today=-30,
+        )
+
+    def test_index_redirects_to_newest_cohort(self):
+        response = self.client.get(reverse('alums'))
+        self.assertRedirects(response, cohort_url(self.recent_intern))
+
+    def test_cohort_page_cached(self):
+        url = cohort_url(self.past_intern)
+        name = self.past_intern.applicant.applicant.public_name
+        self.assertContains(self.client.get(url), name)
+
+        with self.assertNumQueries(0):
+            response = self.client.get(url)
+        self.assertContains(response, name)
+
+    def test_cache_kept_when_other_cohort_changes(self):
+        url = cohort_url(self.past_intern)
+        self.client.get(url)
+
+        self.recent_intern.in_good_standing = False
+        self.recent_intern.save()
+        with self.assertNumQueries(0):
+            self.client.get(url)
+
+    def test_cache_invalidated_when_cohort_changes(self):
+        url = cohort_url(self.past_intern)
+        name = self.past_intern.applicant.applicant.public_name
+        self.client.get(url)
+
+        self.past_intern.in_good_standing = False
+        self.past_intern.save()
+        self.assertNotContains(self.client.get(url), name)
+
+    def test_unknown_cohort_not_found(self):
+        response = self.client.get(reverse('cohort', kwargs={'year': 1999, 'month': '01'}))
+        self.assertEqual(response.status_code, 404)
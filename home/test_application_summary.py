@@ -0,0 +1,134 @@
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from . import models
+from .factories import ApplicantApprovalFactory
+from .factories import ApplicationReviewerFactory
+from .factories import ComradeFactory
+from .factories import RoundPageFactory
+
+
+class InitialApplicationTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.current_round = RoundPageFactory(start_from='initial_applications_open')
+        self.reviewer = ApplicationReviewerFactory(reviewing_round=self.current_round)
+
+    def apply(self, approval_status=models.ApprovalStatus.PENDING, **kwargs):
+        return ApplicantApprovalFactory(application_round=self.current_round, approval_status=approval_status, **kwargs)
+
+    def review(self, application, rating, reviewer=None):
+        return models.InitialApplicationReview.objects.create(
+            application=application,
+            reviewer=reviewer or self.reviewer,
+            essay_rating=rating,
+        )
+
+
+class InitialApplicationCountsTestCase(InitialApplicationTestCase):
+    def test_counts(self):
+        self.apply()
+        models.SchoolInformation.objects.create(applicant=self.apply())
+
+        strong = self.apply()
+        self.review(strong, models.InitialApplicationReview.STRONG)
+        # Applications are counted under their best rating only.
+        self.review(strong, models.InitialApplicationReview.GOOD, reviewer=ApplicationReviewerFactory(reviewing_round=self.current_round))
+
+        self.review(self.apply(review_owner=self.reviewer), models.InitialApplicationReview.MAYBE)
+        self.apply(approval_status=models.ApprovalStatus.REJECTED)
+        self.apply(approval_status=models.ApprovalStatus.APPROVED)
+        self.apply(approval_status=models.ApprovalStatus.APPROVED)
+
+        with self.assertNumQueries(1):
+            counts = self.current_round.count_initial_applications()
+
+        self.assertEqual(counts, {
+            'pending_applications_count': 4,
+            'pending_unreviewed_unowned_count': 2,
+            'pending_unreviewed_unowned_non_student_count': 1,
+            'pending_reviewed_unowned_count': 1,
+            'reviewed_strong_count': 1,
+            'reviewed_good_count': 0,
+            'reviewed_maybe_count': 0,
+            'reviewed_unclear_count': 0,
+            'rejected_applications_count': 1,
+            'approved_applications_count': 2,
+        })
+
+    def test_cache_invalidated_by_review(self):
+        application = self.apply()
+        self.assertEqual(self.current_round.get_initial_application_counts()['pending_unreviewed_unowned_count'], 1)
+
+        with self.assertNumQueries(0):
+            self.current_round.get_initial_application_counts()
+
+        self.review(application, models.InitialApplicationReview.UNCLEAR)
+        counts = self.current_round.get_initial_application_counts()
+        self.assertEqual(counts['pending_unreviewed_unowned_count'], 0)
+        self.assertEqual(counts['reviewed_unclear_count'], 1)
+
+
+class ReviewStateTestCase(InitialApplicationTestCase):
+    def test_review_state_follows_reviews(self):
+        application = self.apply()
+        self.assertFalse(application.has_review)
+
+        maybe = self.review(application, models.InitialApplicationReview.MAYBE)
+        strong = self.review(application, models.InitialApplicationReview.STRONG, reviewer=ApplicationReviewerFactory(reviewing_round=self.current_round))
+        application.refresh_from_db()
+        self.assertTrue(application.has_review)
+        self.assertEqual(application.best_rating, models.InitialApplicationReview.STRONG)
+
+        strong.delete()
+        application.refresh_from_db()
+        self.assertEqual(application.best_rating, models.InitialApplicationReview.MAYBE)
+
+        maybe.delete()
+        application.refresh_from_db()
+        self.assertFalse(application.has_review)
+        self.assertEqual(application.best_rating, '')
+
+    def test_review_state_follows_school_information(self):
+        application = self.apply()
+        school = models.SchoolInformation.objects.create(applicant=application)
+        application.refresh_from_db()
+        self.assertTrue(application.is_student)
+
+        school.delete()
+        application.refresh_from_db()
+        self.assertFalse(application.is_student)
+
+
+# don't try to use the static files manifest during tests
+@override_settings(STATICFILES_STORAGE='django.contrib.staticfiles.storage.StaticFilesStorage')
+class ApplicantReviewSummaryTestCase(InitialApplicationTestCase):
+    def test_keyset_pages(self):
+        applications = [self.apply() for i in range(30)]
+        self.client.force_login(ComradeFactory(account__is_staff=True).account)
+        url = reverse('pending-applicants-summary')
+
+        first = self.client.get(url).context['applications']
+        self.assertEqual(list(first), applications[:25])
+        self.assertFalse(first.has_previous)
+        self.assertTrue(first.has_next)
+
+        second = self.client.get(url, {'after': first.next_after()}).context['applications']
+        self.assertEqual(list(second), applications[25:])
+        self.assertTrue(second.has_previous)
+        self.assertFalse(second.has_next)
+
+        back = self.client.get(url, {'before': second.previous_before()}).context['applications']
+        self.assertEqual(list(back), applications[:25])
+        self.assertFalse(back.has_previous)
+        self.assertTrue(back.has_next)
+
+    def test_rating_filter(self):
+        strong = self.apply()
+        self.review(strong, models.InitialApplicationReview.STRONG)
+        self.review(self.apply(), models.InitialApplicationReview.GOOD)
+        self.client.force_login(ComradeFactory(account__is_staff=True).account)
+
+        response = self.client.get(reverse('strong-reviewed-applicants'))
+        self.assertEqual(list(response.context['applications']), [strong])
@@ -0,0 +1,76 @@
+import datetime
+from django.test import TestCase, RequestFactory
+
+from . import models
+from .dashboard import approval_status
+from .factories import ComradeFactory
+from .factories import CoordinatorApprovalFactory
+from .factories import FinalApplicationFactory
+from .factories import MentorApprovalFactory
+from .factories import ParticipationFactory
+from .factories import ProjectFactory
+from .factories import RoundPageFactory
+
+
+class DeadlineExpressionTestCase(TestCase):
+    def setUp(self):
+        self.today = models.get_deadline_date_for(datetime.datetime.now(datetime.timezone.utc))
+
+        # Each round is in a different phase, so each model's deadline has
+        # passed in some of them but not all.
+        rounds = [
+            RoundPageFactory(start_from='pingnew'),
+            RoundPageFactory(start_from='contributions_close', days_after_today=-1),
+            RoundPageFactory(start_from='internends', days_after_today=-30),
+            RoundPageFactory(start_from='internends', days_after_today=-200),
+        ]
+        for r in rounds:
+            for status, label in models.ApprovalStatus.APPROVAL_STATUS_CHOICES:
+                participation = ParticipationFactory(participating_round=r, approval_status=status)
+                project = ProjectFactory(project_round=participation, approval_status=status)
+                MentorApprovalFactory(project=project, approval_status=status)
+                FinalApplicationFactory(round=r, project=project, approval_status=status)
+
+    def assertMatchesDeadlineMethod(self, model):
+        expected = set()
+        for obj in model.objects.all():
+            if obj.is_approved() or not obj.submission_and_approval_deadline().has_passed():
+                expected.add(obj.pk)
+
+        found = set(model.objects.approved_or_before_deadline(self.today).values_list('pk', flat=True))
+        self.assertEqual(found, expected)
+        # Make sure this test actually excludes something.
+        self.assertLess(len(found), model.objects.count())
+
+    def test_participation_deadline(self):
+        self.assertMatchesDeadlineMethod(models.Participation)
+
+    def test_project_deadline(self):
+        self.assertMatchesDeadlineMethod(models.Project)
+
+    def test_mentor_approval_deadline(self):
+        self.assertMatchesDeadlineMethod(models.MentorApproval)
+
+    def test_final_application_deadline(self):
+        self.assertMatchesDeadlineMethod(models.FinalApplication)
+
+    def test_no_deadline(self):
+        CoordinatorApprovalFactory(approval_status=models.ApprovalStatus.PENDING)
+        self.assertEqual(models.CoordinatorApproval.objects.approved_or_before_deadline(self.today).count(), 1)
+
+
+class ApprovalStatusSectionTestCase(TestCase):
+    def test_expired_requests_hidden(self):
+        today = models.get_deadline_date_for(datetime.datetime.now(datetime.timezone.utc))
+        old_round = RoundPageFactory(start_from='internends', days_after_today=-60)
+        ParticipationFactory(participating_round=old_round, approval_status=models.ApprovalStatus.PENDING)
+        approved = ParticipationFactory(participating_round=old_round, approval_status=models.ApprovalStatus.APPROVED)
+        current_round = RoundPageFactory(start_from='pingnew')
+        pending = ParticipationFactory(participating_round=current_round, approval_status=models.ApprovalStatus.PENDING)
+
+        request = RequestFactory().get('/dashboard/')
+        request.user = ComradeFactory(account__is_staff=True).account
+
+        groups = dict(approval_status(request, today))
+        self.assertEqual(groups['Pending'], [('participation', [pending])])
+        self.assertEqual(groups['Approved'], [('participation', [approved])])
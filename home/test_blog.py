@@ -0,0 +1,113 @@
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import RequestFactory, TestCase, override_settings
+from io import StringIO
+from wagtail.models import Page, Site
+import os
+import tempfile
+
+from . import blog
+from . import models
+from .factories import ComradeFactory
+
+
+# don't try to use the static files manifest during tests
+@override_settings(STATICFILES_STORAGE='django.contrib.staticfiles.storage.StaticFilesStorage')
+class BlogPostTestCase(TestCase):
+    def test_all_posts_render(self):
+        for post in blog.POSTS:
+            with self.subTest(post=post.name):
+                response = self.client.get(post.get_absolute_url())
+                self.assertEqual(response.status_code, 200)
+                self.assertTemplateUsed(response, post.template)
+
+    def test_post_urls_unique(self):
+        self.assertEqual(len(set(post.path for post in blog.POSTS)), len(blog.POSTS))
+        self.assertEqual(len(set(post.name for post in blog.POSTS)), len(blog.POSTS))
+
+
+@override_settings(STATICFILES_STORAGE='django.contrib.staticfiles.storage.StaticFilesStorage')
+class PrerenderBlogTestCase(TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.root = os.path.join(tmp.name, 'prerendered')
+        self.post = blog.POSTS[-1]
+
+    def prerender(self):
+        call_command('prerender_blog', output=self.root, scheme='http', server='testserver', stdout=StringIO())
+
+    def test_command_writes_every_post(self):
+        self.prerender()
+        for post in blog.POSTS:
+            path = os.path.join(self.root, post.path, 'index.html')
+            self.assertTrue(os.path.isfile(path), path)
+            self.assertTrue(os.path.isfile(path + '.gz'), path)
+
+    def test_command_removes_old_pages(self):
+        stale = os.path.join(self.root, 'blog', 'removed-post', 'index.html')
+        os.makedirs(os.path.dirname(stale))
+        open(stale, 'w').close()
+
+        self.prerender()
+        self.assertFalse(os.path.exists(stale))
+
+    def test_anonymous_visitor_gets_prerendered_page(self):
+        self.prerender()
+        with open(os.path.join(self.root, self.post.path, 'index.html'), 'rb') as f:
+            expected = f.read()
+
+        with override_settings(PRERENDERED_ROOT=self.root):
+            with self.assertNumQueries(0):
+                response = self.client.get(self.post.get_absolute_url())
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(b''.join(response.streaming_content), expected)
+        self.assertIn('Cookie', response['Vary'])
+
+    def test_logged_in_visitor_gets_live_page(self):
+        self.prerender()
+        self.client.force_login(ComradeFactory().account)
+
+        with override_settings(PRERENDERED_ROOT=self.root):
+            response = self.client.get(self.post.get_absolute_url())
+        self.assertEqual(response.status_code, 200)
+        self.assertTemplateUsed(response, self.post.template)
+
+
+class BlogFeedTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.author = ComradeFactory(account__is_staff=True).account
+        root = Site.objects.get(is_default_site=True).root_page
+        self.index = root.add_child(
+            instance=models.BlogIndex(title='Blog', slug='test-blog'))
+
+    def get_feed(self, **headers):
+        request = RequestFactory().get('/test-blog/feed/', **headers)
+        return self.index.feed(request)
+
+    def test_unchanged_feed_not_modified(self):
+        response = self.get_feed()
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, blog.POSTS[-1].title)
+        etag = response['ETag']
+
+        with self.assertNumQueries(0):
+            response = self.get_feed(HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response['ETag'], etag)
+
+    def test_last_modified_is_newest_post(self):
+        response = self.get_feed()
+        response = self.get_feed(HTTP_IF_MODIFIED_SINCE=response['Last-Modified'])
+        self.assertEqual(response.status_code, 304)
+
+    def test_publishing_page_changes_feed(self):
+        etag = self.get_feed()['ETag']
+
+        post = self.index.add_child(instance=Page(title='A brand new post', slug='new-post', owner=self.author, live=False))
+        post.save_revision().publish()
+
+        response = self.get_feed(HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, 'A brand new post')
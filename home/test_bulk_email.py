@@ -0,0 +1,227 @@
+from email.headerregistry import Address
+from django.core import mail
+from django.core.mail.backends.locmem import EmailBackend as LocmemBackend
+from django.db import connection as db_connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from . import models
+from .dashboard import ContributorsDeadlinesReminder
+from .email import BatchingBackend
+from .email import send_bulk_template_mail
+from .factories import ApplicantApprovalFactory
+from .factories import ComradeFactory
+from .factories import ContributionFactory
+from .factories import RoundPageFactory
+
+
+class SMTPDropsAfter(LocmemBackend):
+    """
+    Email backend which fails once it has been asked to send `batches`
+    batches of messages.
+    """
+    def __init__(self, batches, **kwargs):
+        super(SMTPDropsAfter, self).__init__(**kwargs)
+        self.batches = batches
+
+    def send_messages(self, messages):
+        if self.batches == 0:
+            raise ConnectionError('connection dropped')
+        self.batches -= 1
+        return super(SMTPDropsAfter, self).send_messages(messages)
+
+
+class BulkEmailTestCase(TestCase):
+    request = {'scheme': 'https', 'get_host': 'www.outreachy.org'}
+
+    def setUp(self):
+        self.current_round = RoundPageFactory(start_from='contributions_open')
+        self.applications = [
+            ApplicantApprovalFactory(application_round=self.current_round, approval_status=models.ApprovalStatus.APPROVED)
+            for i in range(5)
+        ]
+
+    def send(self, connection, checkpoint='test', chunk_size=2):
+        return send_bulk_template_mail(
+            'home/email/applicantapproval-approved.txt',
+            self.current_round.applicantapproval_set.select_related('applicant__account', 'application_round'),
+            lambda application: {
+                'application': application,
+                'recipient': application.applicant.email_address(),
+            },
+            request=self.request,
+            checkpoint=checkpoint,
+            chunk_size=chunk_size,
+            connection=connection,
+        )
+
+    def test_resumes_after_failure(self):
+        with self.assertRaises(ConnectionError):
+            self.send(SMTPDropsAfter(batches=2))
+        self.assertEqual(len(mail.outbox), 4)
+
+        progress = models.BulkEmailCheckpoint.objects.get(name='test')
+        self.assertEqual(progress.last_pk, self.applications[3].pk)
+        self.assertEqual(progress.sent, 4)
+
+        self.assertEqual(self.send(mail.get_connection()), 5)
+        self.assertEqual(
+            sorted(str(m.to[0]) for m in mail.outbox),
+            sorted(str(a.applicant.email_address()) for a in self.applications),
+        )
+        self.assertFalse(models.BulkEmailCheckpoint.objects.exists())
+
+        # A finished send can be done again from the start.
+        self.assertEqual(self.send(mail.get_connection()), 5)
+        self.assertEqual(len(mail.outbox), 10)
+
+    def test_queries_per_chunk(self):
+        with CaptureQueriesContext(db_connection) as five:
+            self.send(mail.get_connection(), checkpoint=None, chunk_size=10)
+
+        for i in range(5):
+            ApplicantApprovalFactory(application_round=self.current_round, approval_status=models.ApprovalStatus.APPROVED)
+        with CaptureQueriesContext(db_connection) as ten:
+            self.send(mail.get_connection(), checkpoint=None, chunk_size=10)
+
+        self.assertEqual(len(five), len(ten))
+
+    def test_skips_missing_recipients(self):
+        account = self.applications[0].applicant.account
+        account.email = ''
+        account.save()
+        self.assertEqual(self.send(mail.get_connection()), 4)
+
+
+# don't try to use the static files manifest during tests
+@override_settings(STATICFILES_STORAGE='django.contrib.staticfiles.storage.StaticFilesStorage')
+class ContributorsReminderTestCase(TestCase):
+    def test_preview_and_send(self):
+        current_round = RoundPageFactory(start_from='contributions_open')
+        contributors = [ContributionFactory(round=current_round).applicant for i in range(3)]
+        ApplicantApprovalFactory(application_round=current_round, approval_status=models.ApprovalStatus.PENDING)
+
+        self.client.force_login(ComradeFactory(account__is_staff=True).account)
+        url = reverse('email-application-period-ended', kwargs={'round_slug': current_round.slug})
+
+        response = self.client.get(url)
+        self.assertEqual(response.context['message_count'], 3)
+        self.assertEqual(len(mail.outbox), 0)
+
+        self.client.post(url)
+        self.assertEqual(
+            sorted(str(m.to[0]) for m in mail.outbox),
+            sorted(str(c.applicant.email_address()) for c in contributors),
+        )
+        for message in mail.outbox:
+            self.assertIn('Outreachy application period closed', message.subject)
+        self.assertFalse(models.BulkEmailCheckpoint.objects.exists())
+
+    def test_send_merges_identical_messages(self):
+        current_round = RoundPageFactory(start_from='contributions_open')
+        first = ContributionFactory(round=current_round)
+        contributors = [first.applicant] + [
+            ContributionFactory(round=current_round, project=first.project).applicant
+            for i in range(2)
+        ]
+
+        self.client.force_login(ComradeFactory(account__is_staff=True).account)
+        self.client.post(reverse('email-application-period-ended', kwargs={'round_slug': current_round.slug}))
+
+        # Everyone contributed to the same project and nothing else, so they
+        # all get the same message.
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(mail.outbox[0].to, [])
+        self.assertEqual(
+            sorted(str(a) for a in mail.outbox[0].bcc),
+            sorted(str(c.applicant.email_address()) for c in contributors),
+        )
+
+    def test_send_keeps_per_recipient_messages_separate(self):
+        current_round = RoundPageFactory(start_from='contributions_open')
+        applications = [
+            ApplicantApprovalFactory(application_round=current_round, approval_status=models.ApprovalStatus.APPROVED)
+            for i in range(2)
+        ]
+        with BatchingBackend(LocmemBackend(), merge=True) as connection:
+            send_bulk_template_mail(
+                'home/email/applicantapproval-approved.txt',
+                models.ApplicantApproval.objects.filter(pk__in=[a.pk for a in applications]),
+                # Both messages come out the same, but only because the
+                # recipients happen to share a name.
+                lambda application: {
+                    'application': applications[0],
+                    'recipient': Address('Sam', addr_spec='sam{}@example.com'.format(application.pk)),
+                },
+                request=BulkEmailTestCase.request,
+                connection=connection,
+            )
+        self.assertEqual(len(mail.outbox), 2)
+        self.assertTrue(all(len(m.to) == 1 for m in mail.outbox))
+
+
+@override_settings(STATICFILES_STORAGE='django.contrib.staticfiles.storage.StaticFilesStorage')
+class ContributorsDeadlineCheckpointTestCase(TestCase):
+    def setUp(self):
+        # The first of the two reminders is due, but not the second.
+        self.current_round = RoundPageFactory(start_from='contributions_close', days_after_today=3)
+        self.applications = [
+            ApplicantApprovalFactory(application_round=self.current_round, approval_status=models.ApprovalStatus.APPROVED)
+            for i in range(3)
+        ]
+        self.client.force_login(ComradeFactory(account__is_staff=True).account)
+        self.url = reverse('email-contributor-deadline-reminder', kwargs={'round_slug': self.current_round.slug})
+        self.current_round = models.RoundPage.objects.get(pk=self.current_round.pk)
+
+    def checkpoint(self, name):
+        return models.BulkEmailCheckpoint.objects.create(
+            name=name,
+            last_pk=max(a.pk for a in self.applications),
+            sent=3,
+        )
+
+    def recipients(self):
+        return sorted(str(a) for m in mail.outbox for a in m.to + m.bcc)
+
+    def everyone(self):
+        return sorted(str(a.applicant.email_address()) for a in self.applications)
+
+    def test_names_each_reminder(self):
+        view = ContributorsDeadlinesReminder()
+        self.assertEqual(
+            view.checkpoint_name(self.current_round),
+            'contributor-deadline-reminder:{}:{}'.format(
+                self.current_round.slug,
+                ContributorsDeadlinesReminder.first_reminder(self.current_round),
+            ),
+        )
+
+    def test_earlier_reminder_not_resumed(self):
+        # An interrupted send of some earlier reminder in this round.
+        stale = 'contributor-deadline-reminder:{}:2000-01-01'.format(self.current_round.slug)
+        self.checkpoint(stale)
+
+        response = self.client.get(self.url)
+        self.assertIsNone(response.context['interrupted_send'])
+
+        self.client.post(self.url)
+        self.assertEqual(self.recipients(), self.everyone())
+        self.assertFalse(models.BulkEmailCheckpoint.objects.exists())
+
+    def test_restart(self):
+        name = ContributorsDeadlinesReminder().checkpoint_name(self.current_round)
+        self.checkpoint(name)
+
+        response = self.client.get(self.url)
+        self.assertEqual(response.context['interrupted_send'].name, name)
+        self.assertContains(response, 'Start over, and email everyone again')
+
+        # Without restarting, everyone was already emailed.
+        self.client.post(self.url)
+        self.assertEqual(len(mail.outbox), 0)
+
+        self.checkpoint(name)
+        self.client.post(self.url, {'restart': '1'})
+        self.assertEqual(self.recipients(), self.everyone())
+        self.assertFalse(models.BulkEmailCheckpoint.objects.exists())
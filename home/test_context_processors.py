@@ -0,0 +1,54 @@
+from django.core.cache import cache
+from django.test import TestCase
+
+from . import models
+from .context_processors import count_pending_approvals
+from .factories import ComradeFactory, ParticipationFactory
+
+
+class PendingApprovalsTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_staff_share_cached_count(self):
+        ParticipationFactory(approval_status=models.ApprovalStatus.PENDING)
+        organizer1 = ComradeFactory(account__is_staff=True).account
+        organizer2 = ComradeFactory(account__is_staff=True).account
+
+        first = count_pending_approvals(organizer1)
+        self.assertEqual(first, 1)
+
+        # The second organizer re-uses the first organizer's Participation
+        # count, but still needs their own Project and MentorApproval counts.
+        with self.assertNumQueries(2):
+            self.assertEqual(count_pending_approvals(organizer2), first)
+
+        # Now everything is cached for both of them.
+        with self.assertNumQueries(0):
+            self.assertEqual(count_pending_approvals(organizer1), first)
+            self.assertEqual(count_pending_approvals(organizer2), first)
+
+    def test_approval_status_change_invalidates_count(self):
+        participation = ParticipationFactory(approval_status=models.ApprovalStatus.PENDING)
+        organizer = ComradeFactory(account__is_staff=True).account
+        self.assertEqual(count_pending_approvals(organizer), 1)
+
+        participation.approval_status = models.ApprovalStatus.APPROVED
+        participation.save()
+        self.assertEqual(count_pending_approvals(organizer), 0)
+
+        ParticipationFactory(
+            participating_round=participation.participating_round,
+            approval_status=models.ApprovalStatus.PENDING,
+        )
+        self.assertEqual(count_pending_approvals(organizer), 1)
+
+    def test_approval_action_invalidates_count(self):
+        participation = ParticipationFactory(approval_status=models.ApprovalStatus.PENDING)
+        organizer = ComradeFactory(account__is_staff=True).account
+        self.assertEqual(count_pending_approvals(organizer), 1)
+
+        self.client.force_login(organizer)
+        response = self.client.post(participation.get_action_url('approve'))
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(count_pending_approvals(organizer), 0)
@@ -1,9 +1,12 @@
 from datetime import date, timedelta
-from django.test import TestCase, override_settings
+from io import StringIO
+from django.core.management import call_command
+from django.test import RequestFactory, TestCase, override_settings
 
 from .factories import ApplicantFactory, RoundPageFactory
-from .models import ApplicantApproval, ApprovalStatus, RoundPage, PromotionTracking
+from .models import ApplicantApproval, ApprovalStatus, RoundPage, PromotionTracking, WizardProgress
 from .views import determine_eligibility, EligibilityUpdateView
+from .wizard_storage import DatabaseStorage
 
 @override_settings(STATICFILES_STORAGE='django.contrib.staticfiles.storage.StaticFilesStorage')
 class EligibilityTests(TestCase):
@@ -215,9 +218,18 @@ class EligibilityTests(TestCase):
 
             response = self.client.post("/eligibility/", answers)
 
+            # Each page's answers are stored once, outside the session.
+            if response.status_code == 200:
+                progress = WizardProgress.objects.get(user=applicant.account)
+                self.assertEqual(progress.steps.count(), len(completed_steps))
+
         self.assertRedirects(response, "/account/professional-skills/")
         self.assertEqual(set(data.keys()), set(completed_steps))
 
+        # Everything is cleaned up once the wizard is done.
+        self.assertFalse(WizardProgress.objects.exists())
+        self.assertNotIn(f"wizard_{prefix}", self.client.session)
+
         result = applicant.applicantapproval_set.get()
         self.assertEqual(result.approval_status, expected_status)
         self.assertEqual(result.reason_denied, expected_reason)
@@ -531,3 +543,52 @@ class EligibilityTests(TestCase):
                 'quit_on_acceptance': False,
             }],
         )
+
+    def test_application_saved_with_related_objects(self):
+        self.assertTimeEligible(
+            ApprovalStatus.PENDING,
+            'ESSAY',
+            school=self.vacation(days=42),
+        )
+        application = ApplicantApproval.objects.get()
+        self.assertTrue(application.is_student)
+        self.assertFalse(application.has_review)
+        self.assertEqual(application.schooltimecommitment_set.count(), 2)
+        self.assertEqual(application.applicantgenderidentity.identities, application.applicantgenderidentity.get_identities())
+        self.assertEqual(application.get_time_commitments()['longest_period_free'], 42)
+
+
+class WizardStorageTests(TestCase):
+    def setUp(self):
+        self.request = RequestFactory().post('/eligibility/')
+        self.request.user = ApplicantFactory().account
+
+    def test_unchanged_page_not_rewritten(self):
+        storage = DatabaseStorage('eligibility', self.request)
+        answers = {'Applicant Info-us_national_or_permanent_resident': ['False']}
+        storage.set_step_data('Applicant Info', dict(answers, **{
+            'csrfmiddlewaretoken': ['first'],
+            'eligibility-current_step': ['Applicant Info'],
+        }))
+        self.assertEqual(storage.get_step_data('Applicant Info').dict(), {
+            'Applicant Info-us_national_or_permanent_resident': 'False',
+        })
+
+        # A new page load brings a new CSRF token, but the same answers.
+        storage = DatabaseStorage('eligibility', self.request)
+        storage.get_step_data('Applicant Info')
+        with self.assertNumQueries(0):
+            storage.set_step_data('Applicant Info', dict(answers, **{
+                'csrfmiddlewaretoken': ['second'],
+                'eligibility-current_step': ['Applicant Info'],
+            }))
+
+    def test_purge_expired(self):
+        abandoned = WizardProgress.objects.create(user=self.request.user, prefix='wizard_eligibility')
+        WizardProgress.objects.filter(pk=abandoned.pk).update(updated=WizardProgress.expiry_cutoff() - timedelta(minutes=1))
+        recent = WizardProgress.objects.create(user=ApplicantFactory().account, prefix='wizard_eligibility')
+
+        out = StringIO()
+        call_command('purge_wizard_progress', stdout=out)
+        self.assertIn('Deleted 1 abandoned wizards', out.getvalue())
+        self.assertEqual(list(WizardProgress.objects.all()), [recent])
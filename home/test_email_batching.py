@@ -0,0 +1,66 @@
+from django.core import mail
+from django.core.mail import EmailMessage
+from django.core.mail.backends.locmem import EmailBackend as LocmemBackend
+from django.template.loader import get_template
+from django.test import TestCase
+
+from . import email
+from .factories import RoundPageFactory
+
+
+class BatchingBackendTestCase(TestCase):
+    def test_merges_identical_messages(self):
+        recipients = ['person{}@example.com'.format(i) for i in range(5)]
+        with email.BatchingBackend(LocmemBackend(), max_recipients=2, merge=True) as connection:
+            for recipient in recipients:
+                EmailMessage('Hello', 'Same for everyone', email.organizers, [recipient], connection=connection).send()
+            EmailMessage('Hello', 'Just for you', email.organizers, ['other@example.com'], connection=connection).send()
+
+        self.assertEqual(connection.messages_received, 6)
+        self.assertEqual(connection.messages_sent, 4)
+
+        batched = [m for m in mail.outbox if m.bcc]
+        self.assertEqual([len(m.bcc) for m in batched], [2, 2, 1])
+        self.assertEqual(sorted(a for m in batched for a in m.bcc), recipients)
+        for message in batched:
+            self.assertEqual(message.to, [])
+            self.assertEqual(message.message()['To'], 'undisclosed-recipients:;')
+
+        single = [m for m in mail.outbox if not m.bcc]
+        self.assertEqual(len(single), 1)
+        self.assertEqual(single[0].to, ['other@example.com'])
+
+    def test_not_merged_by_default(self):
+        with email.BatchingBackend(LocmemBackend()) as connection:
+            for recipient in ('a@example.com', 'b@example.com'):
+                EmailMessage('Hello', 'Same', email.organizers, [recipient], connection=connection).send()
+        self.assertEqual([m.to for m in mail.outbox], [['a@example.com'], ['b@example.com']])
+        self.assertEqual(connection.messages_sent, 2)
+
+    def test_group_messages_are_not_merged(self):
+        with email.BatchingBackend(LocmemBackend(), merge=True) as connection:
+            for i in range(2):
+                EmailMessage('Hello', 'Same', email.organizers, ['a@example.com', 'b@example.com'], connection=connection).send()
+        self.assertEqual(len(mail.outbox), 2)
+        self.assertEqual(connection.messages_sent, 2)
+
+    def test_renders_once_when_recipient_unused(self):
+        current_round = RoundPageFactory(start_from='pingnew')
+        recipients = ['person{}@example.com'.format(i) for i in range(3)]
+        with email.BatchingBackend(LocmemBackend(), merge=True) as connection:
+            email.send_template_mail('home/email/cfp-open.txt', {
+                'current_round': current_round,
+            }, recipient_list=recipients, request={'scheme': 'https', 'get_host': 'www.outreachy.org'}, connection=connection)
+
+        self.assertEqual(connection.renders, 1)
+        self.assertEqual(connection.renders_skipped, 2)
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(sorted(mail.outbox[0].bcc), recipients)
+
+    def test_follows_included_templates(self):
+        def uses_recipient(name):
+            return email.template_uses_recipient(get_template(name, using='plaintext'))
+
+        # Only includes the applicant footer, which doesn't use it.
+        self.assertFalse(uses_recipient('home/email/contributors_application_period_ended.txt'))
+        self.assertTrue(uses_recipient('home/email/participation-approved.txt'))
@@ -0,0 +1,76 @@
+from django.core import mail
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from . import models
+from .email import EmailMetrics, send_group_template_mail
+from .factories import ApplicantApprovalFactory
+from .factories import ComradeFactory
+from .factories import RoundPageFactory
+
+
+class EmailMetricsTestCase(TestCase):
+    def test_records_renders(self):
+        current_round = RoundPageFactory(start_from='pingnew')
+        with EmailMetrics('test') as metrics:
+            send_group_template_mail('home/email/cfp-open.txt', {
+                'current_round': current_round,
+            }, recipient_list=['mentors@example.com'], request={'scheme': 'https', 'get_host': 'www.outreachy.org'})
+
+        self.assertEqual(list(metrics.templates), ['home/email/cfp-open.txt'])
+        self.assertEqual(metrics.templates['home/email/cfp-open.txt']['renders'], 1)
+        self.assertGreater(metrics.total_seconds, 0)
+        self.assertEqual(len(mail.outbox), 1)
+
+    def test_inactive_outside_block(self):
+        current_round = RoundPageFactory(start_from='pingnew')
+        with EmailMetrics('test') as metrics:
+            pass
+        send_group_template_mail('home/email/cfp-open.txt', {
+            'current_round': current_round,
+        }, recipient_list=['mentors@example.com'], request={'scheme': 'https', 'get_host': 'www.outreachy.org'})
+        self.assertEqual(metrics.templates, {})
+
+
+# don't try to use the static files manifest during tests
+@override_settings(STATICFILES_STORAGE='django.contrib.staticfiles.storage.StaticFilesStorage')
+class SendEmailViewMetricsTestCase(TestCase):
+    def setUp(self):
+        self.current_round = RoundPageFactory(start_from='contributions_open')
+        for i in range(3):
+            ApplicantApprovalFactory(application_round=self.current_round, approval_status=models.ApprovalStatus.APPROVED)
+        self.client.force_login(ComradeFactory(account__is_staff=True).account)
+        self.url = reverse('email-contributor-deadline-reminder', kwargs={'round_slug': self.current_round.slug})
+
+    def test_preview_not_recorded(self):
+        with self.assertLogs('home.email', level='INFO') as logs:
+            self.client.get(self.url)
+        self.assertTrue(any('"messages": 3' in line for line in logs.output))
+        self.assertFalse(models.EmailSendMetrics.objects.exists())
+
+    def test_send(self):
+        self.client.post(self.url)
+        sent = models.EmailSendMetrics.objects.get()
+        self.assertEqual(sent.event, 'contributor-deadline-reminder')
+        self.assertEqual(sent.messages, 3)
+        # Nobody has contributed yet, so everyone gets the same reminder,
+        # which is sent as one Bcc'd message.
+        self.assertEqual(sent.transactions, 1)
+        self.assertEqual(sum(t['renders'] for t in sent.templates.values()), 3)
+
+        response = self.client.get(reverse('email-metrics'))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(list(response.context['metrics']), [sent])
+
+    @override_settings(EMAIL_BACKEND='home.email.OutboxBackend')
+    def test_queueing_is_not_delivery(self):
+        self.client.post(self.url)
+        sent = models.EmailSendMetrics.objects.get()
+        self.assertEqual(sent.messages, 3)
+        self.assertEqual(sent.transactions, 0)
+        self.assertEqual(models.OutboundEmail.objects.count(), 1)
+
+    def test_metrics_page_is_staff_only(self):
+        self.client.force_login(ComradeFactory().account)
+        response = self.client.get(reverse('email-metrics'))
+        self.assertNotEqual(response.status_code, 200)
@@ -0,0 +1,108 @@
+import re
+from unittest.mock import patch
+from django.core import mail
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils.html import urlize
+
+from . import email
+from . import models
+from .dashboard import SendEmailView
+from .factories import ApplicantApprovalFactory
+from .factories import ComradeFactory
+from .factories import RoundPageFactory
+
+
+# don't try to use the static files manifest during tests
+@override_settings(STATICFILES_STORAGE='django.contrib.staticfiles.storage.StaticFilesStorage')
+@patch.object(SendEmailView, 'preview_page_size', 2)
+@patch.object(SendEmailView, 'preview_sample_rate', 2)
+class SendEmailPreviewTestCase(TestCase):
+    def setUp(self):
+        self.current_round = RoundPageFactory(start_from='contributions_open')
+        for i in range(5):
+            ApplicantApprovalFactory(application_round=self.current_round, approval_status=models.ApprovalStatus.APPROVED)
+        self.client.force_login(ComradeFactory(account__is_staff=True).account)
+        self.url = reverse('email-contributor-deadline-reminder', kwargs={'round_slug': self.current_round.slug})
+
+    def test_pages(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.context['message_count'], 5)
+        page_obj = response.context['page_obj']
+        self.assertEqual(page_obj.paginator.num_pages, 3)
+        self.assertTrue(all('message' in summary for summary in page_obj))
+        self.assertFalse(any('message' in summary for summary in page_obj.paginator.object_list[2:]))
+
+        response = self.client.get(self.url + '?page=3')
+        page_obj = response.context['page_obj']
+        self.assertEqual(page_obj.number, 3)
+        self.assertEqual(len(page_obj), 1)
+        self.assertIn('message', page_obj[0])
+        self.assertNotIn('message', page_obj.paginator.object_list[0])
+
+        # Nothing is sent, and nothing is left behind.
+        self.assertEqual(len(mail.outbox), 0)
+        self.assertFalse(models.BulkEmailCheckpoint.objects.exists())
+
+    def test_page_past_end_shows_last_page(self):
+        response = self.client.get(self.url + '?page=9')
+        page_obj = response.context['page_obj']
+        self.assertEqual(page_obj.number, 3)
+        self.assertIn('message', page_obj[0])
+
+    @patch.object(SendEmailView, 'preview_sample_size', 1)
+    def test_only_renders_shown_messages(self):
+        with patch.object(email, 'render_template_mail', wraps=email.render_template_mail) as render:
+            response = self.client.get(self.url + '?page=2')
+        self.assertEqual(response.context['message_count'], 5)
+        # The two messages on the page, plus the first message as the sample.
+        self.assertEqual(render.call_count, 3)
+        summaries = response.context['page_obj'].paginator.object_list
+        self.assertEqual([bool(summary.get('subject')) for summary in summaries], [True, False, True, True, False])
+
+    def test_sample_is_stable(self):
+        first = self.client.get(self.url).context['sample']
+        second = self.client.get(self.url + '?page=2').context['sample']
+        self.assertTrue(1 <= len(first) <= SendEmailView.preview_sample_size)
+        self.assertEqual([m.to for m in first], [m.to for m in second])
+
+    def test_urls_match_urlize(self):
+        urls = self.client.get(self.url).context['urls']
+
+        # Send them for real to check what urlize would have found.
+        self.client.post(self.url)
+        # Everyone gets the same reminder, so it's sent as one Bcc'd message.
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(len(mail.outbox[0].bcc), 5)
+        expected = set()
+        for message in mail.outbox:
+            expected.update(re.findall(r'<a href="(.*?)"', urlize(message.body)))
+        self.assertEqual(urls, sorted(expected))
+
+    def test_urls_labeled_as_partial(self):
+        response = self.client.get(self.url)
+        self.assertLess(response.context['rendered_count'], response.context['message_count'])
+        self.assertContains(response, "may include links that aren't listed here")
+
+    def test_urls_from_every_message(self):
+        # The class's page size patch is applied after a method's, so it
+        # has to be overridden in here instead.
+        with patch.object(SendEmailView, 'preview_page_size', 5):
+            response = self.client.get(self.url)
+        self.assertEqual(response.context['rendered_count'], 5)
+        self.assertNotContains(response, "may include links that aren't listed here")
+
+    def test_message_without_recipients(self):
+        view = SendEmailView()
+        view.start_preview()
+        for recipients in ([], ['bob@example.com']):
+            email.send_group_template_mail('home/email/cfp-open.txt', {
+                'current_round': self.current_round,
+            }, recipient_list=recipients, request={'scheme': 'https', 'get_host': 'www.outreachy.org'}, connection=view)
+
+        # Django never sends the first message, so it isn't counted, and
+        # doesn't throw off which summary goes with the next one.
+        self.assertEqual(view.message_count, 1)
+        self.assertFalse(view.planned)
+        self.assertEqual(view.message_summaries[0]['to'], 'bob@example.com')
+        self.assertIn('subject', view.message_summaries[0])
@@ -0,0 +1,75 @@
+import random
+from django.test import TestCase
+
+from . import models
+from .factories import ApplicantApprovalFactory
+from .factories import ContributionFactory
+from .factories import RoundPageFactory
+
+
+def boolean_fields():
+    return [f.name for f in models.ApplicantGenderIdentity._meta.get_fields() if f.get_internal_type() == 'BooleanField']
+
+
+class GenderIdentityBitsTestCase(TestCase):
+    def create_gender_identity(self, applicant, **identities):
+        fields = dict.fromkeys(boolean_fields(), False)
+        fields.update(identities)
+        return models.ApplicantGenderIdentity.objects.create(applicant=applicant, **fields)
+
+    def test_every_identity_has_a_bit(self):
+        self.assertEqual(sorted(models.ApplicantGenderIdentity.IDENTITY_FIELDS), sorted(boolean_fields()))
+
+    def test_identities_kept_in_sync(self):
+        gender_identity = self.create_gender_identity(ApplicantApprovalFactory(), woman=True)
+        self.assertEqual(gender_identity.identities, models.ApplicantGenderIdentity.identity_mask('woman'))
+
+        gender_identity.agender = True
+        gender_identity.save(update_fields=['agender'])
+        gender_identity.refresh_from_db()
+        self.assertEqual(gender_identity.identities, models.ApplicantGenderIdentity.identity_mask('woman', 'agender'))
+
+    def test_non_binary(self):
+        binary = ('man', 'woman', 'trans_masculine', 'trans_feminine', 'transgender', 'genderqueer', 'prefer_not_to_say')
+        for field in boolean_fields():
+            with self.subTest(gender=field):
+                gender_identity = models.ApplicantGenderIdentity(**{field: True})
+                self.assertEqual(gender_identity.is_non_binary(), field not in binary)
+
+    def test_contributor_gender_counts(self):
+        random.seed(0)
+        current_round = RoundPageFactory(start_from='contributions_close')
+        fields = boolean_fields()
+        for i in range(30):
+            applicant = ContributionFactory(round=current_round).applicant
+            if i % 10 == 0:
+                # Some applicants' gender identity was already purged.
+                continue
+            identities = random.sample(fields, random.choice((1, 1, 2)))
+            self.create_gender_identity(
+                applicant,
+                self_identify='girl' if i % 7 == 0 else '',
+                **dict.fromkeys(identities, True)
+            )
+        # Applicants who didn't contribute aren't counted.
+        self.create_gender_identity(
+            ApplicantApprovalFactory(application_round=current_round, approval_status=models.ApprovalStatus.APPROVED),
+            transgender=True,
+        )
+
+        with self.assertNumQueries(1):
+            counts = current_round.get_contributor_gender_counts()
+
+        identities = models.ApplicantGenderIdentity.objects.filter(
+            applicant__application_round=current_round,
+            applicant__contribution__isnull=False,
+        ).distinct()
+        not_cisgender = [f for f in fields if f not in ('man', 'woman', 'prefer_not_to_say')]
+        self.assertEqual(counts['total'], 30)
+        self.assertEqual(counts['cisgender'], identities.filter(**dict.fromkeys(not_cisgender, False)).count())
+        self.assertEqual(counts['transgender'], identities.filter(transgender=True).count())
+        self.assertEqual(counts['genderqueer'], identities.filter(genderqueer=True).count())
+        self.assertEqual(counts['men'], identities.filter(man=True).count())
+        self.assertEqual(counts['women'], identities.filter(woman=True).count())
+        self.assertEqual(counts['non_binary'], len([i for i in identities if i.is_non_binary()]))
+        self.assertEqual(counts['self_identified'], identities.exclude(self_identify='').count())
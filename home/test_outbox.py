@@ -0,0 +1,155 @@
+import datetime
+from io import StringIO
+from django.core import mail
+from django.core.mail.backends.locmem import EmailBackend as LocmemBackend
+from django.core.management import call_command
+from django.db import transaction
+from django.test import TestCase, override_settings
+from email.headerregistry import Address
+from email.mime.text import MIMEText
+
+from . import models
+from .email import send_group_template_mail
+from .factories import RoundPageFactory
+
+
+class FlakyBackend(LocmemBackend):
+    """
+    Email backend which refuses to send to anyone at broken.example.
+    """
+    def send_messages(self, messages):
+        for message in messages:
+            if any(r.endswith('@broken.example>') for r in message.recipients()):
+                raise ConnectionError('relay unavailable')
+        return super(FlakyBackend, self).send_messages(messages)
+
+
+@override_settings(
+    EMAIL_BACKEND='home.email.OutboxBackend',
+    OUTBOX_EMAIL_BACKEND='django.core.mail.backends.locmem.EmailBackend',
+)
+class OutboxTestCase(TestCase):
+    def setUp(self):
+        self.current_round = RoundPageFactory(start_from='pingnew')
+
+    def queue(self, recipient):
+        send_group_template_mail('home/email/cfp-open.txt', {
+            'current_round': self.current_round,
+        }, [recipient], request={'scheme': 'https', 'get_host': 'www.outreachy.org'})
+
+    def test_queued_until_delivered(self):
+        recipient = Address("Mentors", "mentors", "lists.outreachy.org")
+        self.queue(recipient)
+        self.assertEqual(len(mail.outbox), 0)
+
+        queued = models.OutboundEmail.objects.get()
+        self.assertEqual(queued.status, models.OutboundEmail.QUEUED)
+        self.assertEqual(queued.to, [str(recipient)])
+
+        out = StringIO()
+        call_command('deliver_outbox', stdout=out)
+        self.assertIn('Sent 1 messages, 0 failed', out.getvalue())
+
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(mail.outbox[0].subject, queued.subject)
+        self.assertEqual(mail.outbox[0].body, queued.body)
+        self.assertEqual(mail.outbox[0].from_email, 'Outreachy Organizers <organizers@outreachy.org>')
+        self.assertEqual(mail.outbox[0].to, [str(recipient)])
+
+        queued.refresh_from_db()
+        self.assertEqual(queued.status, models.OutboundEmail.SENT)
+        self.assertEqual(queued.attempts, 1)
+
+        # Nothing is sent twice.
+        call_command('deliver_outbox', stdout=StringIO())
+        self.assertEqual(len(mail.outbox), 1)
+
+    def test_keeps_alternatives_and_attachments(self):
+        message = mail.EmailMultiAlternatives('Hello', 'Plain text', 'organizers@outreachy.org', ['person@example.com'])
+        message.attach_alternative('<p>HTML</p>', 'text/html')
+        message.attach('notes.txt', 'Some notes', 'text/plain')
+        message.attach('data.bin', b'\x00\xff', 'application/octet-stream')
+        message.send()
+
+        call_command('deliver_outbox', stdout=StringIO())
+        sent = mail.outbox[0]
+        self.assertEqual(sent.alternatives, [('<p>HTML</p>', 'text/html')])
+        self.assertEqual(sent.attachments, [
+            ('notes.txt', 'Some notes', 'text/plain'),
+            ('data.bin', b'\x00\xff', 'application/octet-stream'),
+        ])
+
+    def test_refuses_what_it_cannot_store(self):
+        message = mail.EmailMessage('Hello', 'Plain text', 'organizers@outreachy.org', ['person@example.com'])
+        message.attach(MIMEText('Already encoded'))
+        with self.assertRaises(ValueError):
+            message.send()
+        self.assertFalse(models.OutboundEmail.objects.exists())
+
+    def test_rolled_back_with_request(self):
+        try:
+            with transaction.atomic():
+                self.queue('someone@example.com')
+                raise RuntimeError
+        except RuntimeError:
+            pass
+        self.assertFalse(models.OutboundEmail.objects.exists())
+
+    def test_batches_share_connection(self):
+        for i in range(5):
+            self.queue('person{}@example.com'.format(i))
+
+        connection = mail.get_connection('django.core.mail.backends.locmem.EmailBackend')
+        with connection:
+            self.assertEqual(models.OutboundEmail.deliver(connection, limit=3), (3, 0))
+            self.assertEqual(models.OutboundEmail.deliver(connection, limit=3), (2, 0))
+            self.assertEqual(models.OutboundEmail.deliver(connection, limit=3), (0, 0))
+        self.assertEqual(len(mail.outbox), 5)
+
+    @override_settings(OUTBOX_EMAIL_BACKEND='home.test_outbox.FlakyBackend')
+    def test_retry_with_backoff(self):
+        self.queue('Broken <someone@broken.example>')
+        self.queue('fine@example.com')
+
+        before = datetime.datetime.now(datetime.timezone.utc)
+        call_command('deliver_outbox', stdout=StringIO())
+        self.assertEqual(len(mail.outbox), 1)
+
+        broken = models.OutboundEmail.objects.get(status=models.OutboundEmail.QUEUED)
+        self.assertEqual(broken.attempts, 1)
+        self.assertEqual(broken.last_error, 'ConnectionError: relay unavailable')
+        self.assertGreaterEqual(broken.next_attempt, before + models.OutboundEmail.RETRY_DELAY)
+
+        # Not due again yet.
+        call_command('deliver_outbox', stdout=StringIO())
+        broken.refresh_from_db()
+        self.assertEqual(broken.attempts, 1)
+
+        # Each retry waits twice as long as the last, then gives up.
+        for attempt in range(2, models.OutboundEmail.MAX_ATTEMPTS + 1):
+            models.OutboundEmail.objects.filter(pk=broken.pk).update(next_attempt=before)
+            call_command('deliver_outbox', stdout=StringIO())
+            broken.refresh_from_db()
+            self.assertEqual(broken.attempts, attempt)
+            if attempt < models.OutboundEmail.MAX_ATTEMPTS:
+                self.assertEqual(broken.status, models.OutboundEmail.QUEUED)
+                self.assertGreaterEqual(broken.next_attempt, before + models.OutboundEmail.RETRY_DELAY * 2 ** (attempt - 1))
+        self.assertEqual(broken.status, models.OutboundEmail.FAILED)
+        self.assertEqual(len(mail.outbox), 1)
+
+    def test_delivery_is_measured(self):
+        self.queue('someone@example.com')
+        self.queue('someone-else@example.com')
+        with self.assertLogs('home.email', level='INFO') as logs:
+            call_command('deliver_outbox', stdout=StringIO())
+        self.assertTrue(any('"name": "deliver_outbox"' in line and '"transactions": 2' in line for line in logs.output))
+
+    def test_purges_old_sent_messages(self):
+        self.queue('someone@example.com')
+        call_command('deliver_outbox', stdout=StringIO())
+        models.OutboundEmail.objects.update(sent=datetime.datetime(2020, 1, 1, tzinfo=datetime.timezone.utc))
+
+        out = StringIO()
+        call_command('deliver_outbox', stdout=out)
+        self.assertIn('purged 1 old messages', out.getvalue())
+        self.assertFalse(models.OutboundEmail.objects.exists())
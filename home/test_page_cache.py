@@ -0,0 +1,107 @@
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import get_resolver, reverse
+from django.urls.resolvers import URLResolver
+
+from . import models
+from .factories import ComradeFactory
+from .factories import ParticipationFactory
+from .factories import ProjectFactory
+from .factories import RoundPageFactory
+
+
+# don't try to use the static files manifest during tests
+@override_settings(STATICFILES_STORAGE='django.contrib.staticfiles.storage.StaticFilesStorage')
+class AnonymousPageCacheTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.current_round = RoundPageFactory(start_from='initial_applications_open')
+        self.url = reverse('eligibility-information')
+
+    def test_anonymous_page_cached(self):
+        first = self.client.get(self.url)
+        self.assertEqual(first.status_code, 200)
+
+        with self.assertNumQueries(0):
+            second = self.client.get(self.url)
+        self.assertEqual(second.content, first.content)
+
+    def test_cache_invalidated_by_round_change(self):
+        self.client.get(self.url)
+
+        self.current_round.save()
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(queries)
+
+    def test_cache_kept_when_unrelated_model_changes(self):
+        project = ProjectFactory(project_round__participating_round=self.current_round)
+        self.client.get(self.url)
+
+        project.approval_status = models.ApprovalStatus.APPROVED
+        project.save()
+        with self.assertNumQueries(0):
+            self.client.get(self.url)
+
+    def test_logged_in_pages_not_cached(self):
+        self.client.force_login(ComradeFactory().account)
+        self.client.get(self.url)
+
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get(self.url)
+        self.assertTrue(queries)
+
+    def test_cache_invalidated_by_participation_change(self):
+        url = reverse('blog-application-period-statistics', kwargs={'round_slug': self.current_round.slug})
+        participation = ParticipationFactory(participating_round=self.current_round)
+        self.client.get(url)
+
+        participation.approval_status = models.ApprovalStatus.APPROVED
+        participation.save()
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get(url)
+        self.assertTrue(queries)
+
+
+def cached_url_names(patterns):
+    """
+    Names of every URL whose view is wrapped by cache_anonymous_page.
+    """
+    for pattern in patterns:
+        if isinstance(pattern, URLResolver):
+            yield from cached_url_names(pattern.url_patterns)
+        elif hasattr(pattern.callback, 'anonymous_page_models'):
+            yield pattern.name
+
+
+@override_settings(STATICFILES_STORAGE='django.contrib.staticfiles.storage.StaticFilesStorage')
+class CachedViewsTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.current_round = RoundPageFactory(start_from='contributions_close', days_after_today=-1)
+
+    def test_every_cached_view_is_cacheable(self):
+        # A page which sets a cookie, such as a CSRF token, is never stored,
+        # so check that every decorated view's anonymous response really is.
+        urls = {
+            'past-rounds': reverse('past-rounds'),
+            'eligibility-information': reverse('eligibility-information'),
+            'blog-application-period-statistics': reverse('blog-application-period-statistics', kwargs={'round_slug': self.current_round.slug}),
+            'docs-applicant': reverse('docs-applicant'),
+            'docs-community': reverse('docs-community'),
+            'docs-internship': reverse('docs-internship'),
+            'sponsor': reverse('sponsor'),
+        }
+        self.assertEqual(set(cached_url_names(get_resolver().url_patterns)), set(urls))
+
+        for name, url in urls.items():
+            with self.subTest(name):
+                first = self.client.get(url)
+                self.assertEqual(first.status_code, 200)
+                self.assertFalse(first.cookies)
+                with self.assertNumQueries(0):
+                    second = self.client.get(url)
+                self.assertEqual(second.content, first.content)
@@ -0,0 +1,108 @@
+import datetime
+from django.db import IntegrityError
+from django.test import TestCase
+
+from . import models
+from .factories import ApplicantApprovalFactory
+from .factories import ContributionFactory
+from .factories import FinalApplicationFactory
+from .factories import ProjectFactory
+from .factories import RoundPageFactory
+
+
+class ApplicantsAndContributionsTestCase(TestCase):
+    def setUp(self):
+        self.current_round = RoundPageFactory(start_from='contributions_close')
+        self.project = ProjectFactory(
+            project_round__participating_round=self.current_round,
+            approval_status=models.ApprovalStatus.APPROVED,
+            project_round__approval_status=models.ApprovalStatus.APPROVED,
+        )
+
+    def contribute(self, count=1, approval_status=models.ApprovalStatus.APPROVED):
+        applicant = ApplicantApprovalFactory(
+            application_round=self.current_round,
+            approval_status=approval_status,
+        )
+        for i in range(count):
+            models.Contribution.objects.create(
+                applicant=applicant,
+                project=self.project,
+                date_started=datetime.date.today(),
+                url='https://example.com/{}'.format(i),
+                description='Contribution {}'.format(i),
+            )
+        return applicant
+
+    def apply(self, applicant, **kwargs):
+        return FinalApplicationFactory(
+            round=self.current_round,
+            applicant=applicant,
+            project=self.project,
+            contributions=0,
+            **kwargs
+        )
+
+    def expected(self, a):
+        """
+        How this list was originally built, with several queries for each
+        applicant.
+        """
+        result = {'submitted_application': False, 'incorrect_time_commitments': False}
+        try:
+            fa = a.finalapplication_set.get(project=self.project)
+        except models.FinalApplication.DoesNotExist:
+            return result
+        result['submitted_application'] = True
+        result['rating'] = "Unrated" if fa.rating == fa.UNRATED else fa.rating
+        result['rating_tip'] = fa.get_rating_display()
+        result['withdrew_application'] = fa.approval_status == models.ApprovalStatus.WITHDRAWN
+        result['applying_to_gsoc'] = fa.applying_to_gsoc != ""
+        result['incorrect_time_commitments'] = not fa.time_correct or fa.time_updates != ""
+        return result
+
+    def test_matches_per_applicant_queries(self):
+        self.contribute(3)
+        self.apply(self.contribute(2), rating=models.FinalApplication.STRONG)
+        self.apply(self.contribute(), applying_to_gsoc='Another project', time_correct=False)
+        self.apply(self.contribute(), approval_status=models.ApprovalStatus.WITHDRAWN, time_updates='New job')
+        self.contribute(approval_status=models.ApprovalStatus.PENDING)
+
+        # A contribution and final application for another project shouldn't
+        # be counted.
+        applicant = self.contribute()
+        other = ContributionFactory(
+            round=self.current_round,
+            applicant=applicant,
+            project__project_round__participating_round=self.current_round,
+        )
+        FinalApplicationFactory(round=self.current_round, applicant=applicant, project=other.project, contributions=0)
+
+        with self.assertNumQueries(1):
+            applicants = self.project.get_applicants_and_contributions_list()
+
+        self.assertEqual(len(applicants), 5)
+        for a in applicants:
+            self.assertEqual(a.number_contributions, a.contribution_set.filter(project=self.project).count())
+            for key, value in self.expected(a).items():
+                self.assertEqual(getattr(a, key), value, key)
+
+    def test_cached_on_project(self):
+        self.contribute()
+        applicants = self.project.get_applicants_and_contributions_list()
+        with self.assertNumQueries(0):
+            self.assertIs(self.project.get_applicants_and_contributions_list(), applicants)
+
+    def test_one_final_application_per_project(self):
+        # The contribution count joins in the final application, so a second
+        # final application for the same project would double it.
+        applicant = self.contribute(2)
+        fa = self.apply(applicant)
+        with self.assertRaises(IntegrityError):
+            models.FinalApplication.objects.create(
+                applicant=applicant,
+                project=self.project,
+                experience=fa.experience,
+                foss_experience=fa.foss_experience,
+                relevant_projects=fa.relevant_projects,
+            )
@@ -0,0 +1,136 @@
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from . import models
+from .factories import ComradeFactory
+from .factories import ProjectFactory
+from .factories import RoundPageFactory
+
+
+def original_categories(skill):
+    """
+    How RoundPage.get_common_skills_counter used to sort skills.
+    """
+    skills = []
+    if 'python' in skill.lower():
+        skills.append('Python')
+    elif 'javascript' in skill.lower() or 'JS' in skill:
+        skills.append('JavaScript')
+    elif 'html' in skill.lower() or 'css' in skill.lower():
+        skills.append('HTML/CSS')
+    elif 'java' in skill.lower():
+        skills.append('Java')
+    elif 'django' in skill.lower():
+        skills.append('Django')
+    elif 'c program' in skill.lower() or 'c language' in skill.lower() or 'c code' in skill.lower() or 'programming in c' in skill.lower() or skill == 'C':
+        skills.append('C programming')
+    elif 'c++' in skill.lower():
+        skills.append('C++')
+    elif 'rust' in skill.lower():
+        skills.append('Rust')
+    elif 'ruby on rails' in skill.lower():
+        skills.append('Ruby on Rails')
+    elif 'ruby' in skill.lower():
+        skills.append('Ruby')
+    elif 'operating systems' in skill.lower() or 'kernel' in skill.lower():
+        skills.append('Operating Systems knowledge')
+    elif 'linux' in skill.lower():
+        skills.append('Linux')
+    elif 'web development' in skill.lower():
+        skills.append('Web development')
+    elif 'gtk' in skill.lower() or 'gobject' in skill.lower():
+        skills.append('GTK programming')
+    elif 'git' in skill.lower():
+        skills.append('Git')
+    elif 'writing' in skill.lower() or 'documentation' in skill.lower():
+        skills.append('Documentation')
+    else:
+        skills.append(skill)
+
+    if 'android' in skill.lower():
+        skills.append('Android')
+    if 'mercurial' in skill.lower():
+        skills.append('Mercurial')
+    if 'node.js' in skill.lower():
+        skills.append('node.js')
+    return skills
+
+
+@override_settings(STATICFILES_STORAGE='django.contrib.staticfiles.storage.StaticFilesStorage')
+class SkillCategoryTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def add_skill(self, project, skill):
+        return models.ProjectSkill.objects.create(project=project, skill=skill)
+
+    def test_matches_original_categories(self):
+        skills = [
+            'Python', 'python 3', 'JavaScript', 'JS', 'js', 'Vue.js', 'node.js', 'HTML', 'CSS',
+            'Java', 'Android Java', 'Django', 'C', 'c', 'C programming', 'Programming in C',
+            'C code', 'C++', 'Rust', 'Ruby on Rails', 'Ruby', 'Linux kernel', 'Operating Systems',
+            'Linux', 'Web development', 'GTK', 'GObject', 'Git', 'Mercurial', 'Technical writing',
+            'Documentation', 'Android', 'Go', 'Kotlin', 'Figma',
+        ]
+        for skill in skills:
+            self.assertEqual(models.categorize_skill(skill), original_categories(skill), skill)
+
+    def test_categories_follow_skill(self):
+        skill = self.add_skill(ProjectFactory(), 'py')
+        self.assertEqual(list(skill.projectskillcategory_set.values_list('category', flat=True)), ['py'])
+
+        skill.skill = 'Python on Android'
+        skill.save()
+        self.assertEqual(
+            sorted(skill.projectskillcategory_set.values_list('category', flat=True)),
+            ['Android', 'Python'],
+        )
+
+    def test_common_skills(self):
+        current_round = RoundPageFactory(start_from='pingnew')
+
+        def project(**kwargs):
+            return ProjectFactory(project_round__participating_round=current_round, **kwargs)
+
+        approved = project(approval_status=models.ApprovalStatus.APPROVED)
+        self.add_skill(approved, 'Python 3')
+        self.add_skill(approved, 'Kotlin')
+        other = project(approval_status=models.ApprovalStatus.APPROVED)
+        self.add_skill(other, 'python')
+        self.add_skill(other, 'Java for Android')
+        pending = project(approval_status=models.ApprovalStatus.PENDING)
+        self.add_skill(pending, 'Rust')
+
+        expected = [('Python', 2), ('Android', 1), ('Java', 1), ('Kotlin', 1)]
+        self.assertEqual(current_round.get_common_skills(), expected)
+        with self.assertNumQueries(0):
+            self.assertEqual(current_round.get_common_skills(), expected)
+
+        # Approving a project changes the counts.
+        pending.approval_status = models.ApprovalStatus.APPROVED
+        pending.save()
+        self.assertIn(('Rust', 1), current_round.get_common_skills())
+
+        # So does adding or removing a skill.
+        self.add_skill(pending, 'Python')
+        self.assertIn(('Python', 3), current_round.get_common_skills())
+        models.ProjectSkill.objects.filter(skill='Kotlin').delete()
+        self.assertNotIn(('Kotlin', 1), current_round.get_common_skills())
+
+    def test_rename_suggests_category(self):
+        project = ProjectFactory()
+        skills = [self.add_skill(project, 'python3'), self.add_skill(project, 'Python programming')]
+        ids = ','.join(str(s.pk) for s in skills)
+
+        self.client.force_login(ComradeFactory(account__is_staff=True).account)
+        url = reverse('rename-project-skills') + '?ids=' + ids
+        response = self.client.get(url)
+        self.assertEqual(response.context['form'].initial.get('new_name'), 'Python')
+
+        response = self.client.post(url, {'new_name': 'Python'})
+        self.assertEqual(response.status_code, 302)
+        for skill in skills:
+            skill.refresh_from_db()
+            self.assertEqual(skill.skill, 'Python')
+            self.assertEqual(list(skill.projectskillcategory_set.values_list('category', flat=True)), ['Python'])
@@ -0,0 +1,102 @@
+import json
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from . import models
+from .factories import ApplicantApprovalFactory
+from .factories import ApplicationReviewerFactory
+from .factories import RoundPageFactory
+
+
+# don't try to use the static files manifest during tests
+@override_settings(STATICFILES_STORAGE='django.contrib.staticfiles.storage.StaticFilesStorage')
+class ReviewBatchTestCase(TestCase):
+    def setUp(self):
+        self.url = reverse('review-applications-batch')
+        self.current_round = RoundPageFactory(start_from='initial_applications_open')
+        self.reviewer = ApplicationReviewerFactory(
+            reviewing_round=self.current_round,
+            approval_status=models.ApprovalStatus.APPROVED,
+        )
+        self.other_reviewer = ApplicationReviewerFactory(
+            reviewing_round=self.current_round,
+            approval_status=models.ApprovalStatus.APPROVED,
+        )
+        self.applications = [
+            ApplicantApprovalFactory(application_round=self.current_round, approval_status=models.ApprovalStatus.PENDING)
+            for i in range(3)
+        ]
+        self.client.force_login(self.reviewer.comrade.account)
+
+    def post(self, operations):
+        return self.client.post(self.url, json.dumps({'operations': operations}), content_type='application/json')
+
+    def username(self, application):
+        return application.applicant.account.username
+
+    def test_applies_operations(self):
+        first, second, third = self.applications
+        models.InitialApplicationReview.objects.create(application=second, reviewer=self.reviewer, comments='old')
+
+        response = self.post([
+            {'application': self.username(first), 'rating': 'STRONG', 'flags': {'review_school': True}},
+            {'application': self.username(second), 'comment': 'new', 'owner': self.other_reviewer.comrade.account.username},
+            {'application': self.username(third), 'owner': self.reviewer.comrade.account.username},
+        ])
+        self.assertEqual(response.status_code, 200)
+        state = {a['application']: a for a in response.json()['applications']}
+
+        review = models.InitialApplicationReview.objects.get(application=first, reviewer=self.reviewer)
+        self.assertEqual(review.essay_rating, models.InitialApplicationReview.STRONG)
+        self.assertTrue(review.review_school)
+        self.assertFalse(review.missing_school)
+        self.assertEqual(state[self.username(first)]['best_rating'], models.InitialApplicationReview.STRONG)
+        self.assertTrue(state[self.username(first)]['review']['flags']['review_school'])
+
+        second.refresh_from_db()
+        self.assertEqual(second.initialapplicationreview_set.get().comments, 'new')
+        self.assertEqual(second.review_owner, self.other_reviewer)
+        self.assertEqual(state[self.username(second)]['owner'], self.other_reviewer.comrade.account.username)
+
+        third.refresh_from_db()
+        self.assertEqual(third.review_owner, self.reviewer)
+        self.assertFalse(third.has_review)
+        self.assertIsNone(state[self.username(third)]['review'])
+
+    def test_invalid_operation_changes_nothing(self):
+        first, second, third = self.applications
+        response = self.post([
+            {'application': self.username(first), 'rating': 'STRONG'},
+            {'application': self.username(second), 'flags': {'not_a_flag': True}},
+        ])
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(models.InitialApplicationReview.objects.exists())
+
+    def test_values_of_the_wrong_type(self):
+        username = self.username(self.applications[0])
+        for op in (
+            {'application': [username]},
+            {'application': {'username': username}},
+            {'application': username, 'owner': [username]},
+            {'application': username, 'rating': ['STRONG']},
+            {'application': username, 'comment': {'text': 'hi'}},
+        ):
+            with self.subTest(op=op):
+                self.assertEqual(self.post([op]).status_code, 400)
+        self.assertFalse(models.InitialApplicationReview.objects.exists())
+
+    def test_null_comment_is_empty(self):
+        application = self.applications[0]
+        models.InitialApplicationReview.objects.create(application=application, reviewer=self.reviewer, comments='old')
+        response = self.post([{'application': self.username(application), 'comment': None}])
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(models.InitialApplicationReview.objects.get().comments, '')
+
+    def test_requires_approved_reviewer(self):
+        self.reviewer.approval_status = models.ApprovalStatus.PENDING
+        self.reviewer.save()
+        response = self.post([
+            {'application': self.username(self.applications[0]), 'rating': 'STRONG'},
+        ])
+        self.assertEqual(response.status_code, 403)
+        self.assertFalse(models.InitialApplicationReview.objects.exists())
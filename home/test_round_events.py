@@ -0,0 +1,81 @@
+import datetime
+from io import StringIO
+from django.core import mail
+from django.core.management import call_command
+from django.test import TestCase
+
+from . import models
+from .dashboard import all_round_events, get_due_round_events
+from .factories import ComradeFactory
+from .factories import RoundPageFactory
+
+
+class RoundEventCalendarTestCase(TestCase):
+    def setUp(self):
+        self.today = models.get_deadline_date_for(datetime.datetime.now(datetime.timezone.utc))
+
+    def brute_force_due_events(self, today):
+        """
+        This is how the dashboard used to find due events, by checking every
+        event for every round.
+        """
+        early = datetime.timedelta(weeks=2)
+        late = datetime.timedelta(weeks=1)
+        events = []
+        for current_round in models.RoundPage.objects.all():
+            for event in all_round_events:
+                due = min(
+                    (due(current_round) for due in event.instances()),
+                    key=lambda due: abs(today - due),
+                )
+                if due - early <= today <= due + late:
+                    events.append((current_round.pk, event.slug, due))
+        return sorted(events, key=lambda e: (e[2], e[0], e[1]))
+
+    def test_event_slugs_are_unique(self):
+        slugs = [event.slug for event in all_round_events]
+        self.assertEqual(len(slugs), len(set(slugs)))
+
+    def test_calendar_built_on_save(self):
+        current_round = RoundPageFactory(start_from='pingnew')
+        expected = sum(len(event.instances()) for event in all_round_events)
+        self.assertEqual(current_round.roundeventdate_set.count(), expected)
+        self.assertTrue(current_round.roundeventdate_set.filter(event='cfp-open', due=current_round.pingnew).exists())
+
+    def test_calendar_rebuilt_when_dates_change(self):
+        current_round = RoundPageFactory(start_from='pingnew')
+        current_round.pingnew = current_round.pingnew + datetime.timedelta(days=3)
+        current_round.save()
+        self.assertEqual(current_round.roundeventdate_set.get(event='cfp-open').due, current_round.pingnew)
+
+    def test_matches_brute_force(self):
+        RoundPageFactory(start_from='pingnew', days_after_today=-20)
+        RoundPageFactory(start_from='contributions_close', days_after_today=3)
+        RoundPageFactory(start_from='internstarts', days_after_today=-40)
+
+        for days in range(-30, 30, 3):
+            today = self.today + datetime.timedelta(days=days)
+            found = sorted(
+                ((e['current_round'].pk, e['kind'].slug, e['due']) for e in get_due_round_events(today)),
+                key=lambda e: (e[2], e[0], e[1]),
+            )
+            self.assertEqual(found, self.brute_force_due_events(today))
+
+    def test_command_lists_due_events(self):
+        current_round = RoundPageFactory(start_from='pingnew')
+        out = StringIO()
+        call_command('round_events', stdout=out)
+        self.assertIn('{} {} cfp-open'.format(current_round.pingnew, current_round.slug), out.getvalue())
+
+    def test_command_sends_due_event(self):
+        RoundPageFactory(start_from='pingnew')
+        organizer = ComradeFactory(account__is_staff=True).account
+
+        out = StringIO()
+        call_command('round_events', send='cfp-open', user=organizer.username, stdout=out)
+        self.assertIn('Would send 1 messages', out.getvalue())
+        self.assertEqual(len(mail.outbox), 0)
+
+        call_command('round_events', send='cfp-open', user=organizer.username, force=True, stdout=out)
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertIn('https://www.outreachy.org/', mail.outbox[0].body)
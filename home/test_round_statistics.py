@@ -0,0 +1,120 @@
+from io import StringIO
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from . import models
+from .factories import ApplicantApprovalFactory
+from .factories import ComradeFactory
+from .factories import ContributionFactory
+from .factories import FinalApplicationFactory
+from .factories import RoundPageFactory
+
+
+# don't try to use the static files manifest during tests
+@override_settings(STATICFILES_STORAGE='django.contrib.staticfiles.storage.StaticFilesStorage')
+class RoundStatisticsSnapshotTestCase(TestCase):
+    def populate(self, current_round):
+        for country in ('Kenya', 'Kenya', 'India', ''):
+            ApplicantApprovalFactory(
+                application_round=current_round,
+                approval_status=models.ApprovalStatus.APPROVED,
+                initial_application_country_living_in_during_internship=country,
+            )
+        ApplicantApprovalFactory(
+            application_round=current_round,
+            approval_status=models.ApprovalStatus.REJECTED,
+            reason_denied='TIME',
+        )
+        contribution = ContributionFactory(round=current_round)
+        FinalApplicationFactory(
+            round=current_round,
+            applicant=contribution.applicant,
+            project=contribution.project,
+            contributions=0,
+        )
+
+    def test_snapshot_matches_round(self):
+        current_round = RoundPageFactory(start_from='contributions_close', days_after_today=-1)
+        self.populate(current_round)
+
+        snapshot = models.RoundStatisticsSnapshot.for_round(current_round)
+        self.assertFalse(snapshot.frozen)
+
+        self.assertEqual(
+            (snapshot.total_eligibility_checks, snapshot.total_eligible, snapshot.percentage_rejected_essay,
+                snapshot.percentage_rejected_time, snapshot.percentage_rejected_general),
+            current_round.get_statistics_on_eligibility_check(),
+        )
+        self.assertEqual(snapshot.countries, [['', 2], ['Kenya', 2], ['India', 1]])
+        self.assertEqual(
+            (snapshot.total_contributors, snapshot.percentage_us_contributors_not_bipoc, snapshot.percentage_us_contributors_bipoc),
+            current_round.get_contributor_demographics(),
+        )
+        self.assertEqual(
+            (snapshot.percentage_contributors_cisgender, snapshot.percentage_contributors_transgender,
+                snapshot.percentage_contributors_genderqueer),
+            current_round.get_contributor_gender_stats(),
+        )
+        self.assertEqual(
+            (snapshot.total_eligible, snapshot.total_contributors, snapshot.total_final_applicants, snapshot.total_interns_funded),
+            current_round.get_contributor_applicant_funding_status(),
+        )
+
+    def test_page_reads_snapshot(self):
+        current_round = RoundPageFactory(start_from='contributions_close', days_after_today=-1)
+        self.populate(current_round)
+        url = reverse('blog-application-period-statistics', kwargs={'round_slug': current_round.slug})
+
+        # Until the round_statistics command runs, visitors see live
+        # numbers, and nothing is saved.
+        response = self.client.get(url)
+        self.assertContains(response, 'we had 6 people filled out an eligibility check')
+        self.assertFalse(models.RoundStatisticsSnapshot.objects.exists())
+
+        call_command('round_statistics', stdout=StringIO())
+        ApplicantApprovalFactory(application_round=current_round)
+
+        # Once it has, visits don't count anything.
+        with self.assertNumQueries(2):
+            response = self.client.get(url)
+        self.assertContains(response, 'we had 6 people filled out an eligibility check')
+
+    def test_page_before_application_period_closes(self):
+        current_round = RoundPageFactory(start_from='pingnew')
+        response = self.client.get(reverse('blog-application-period-statistics', kwargs={'round_slug': current_round.slug}))
+        self.assertContains(response, 'will be available the day after the application period closes')
+        self.assertFalse(models.RoundStatisticsSnapshot.objects.exists())
+
+    def test_command_freezes_closed_rounds(self):
+        open_round = RoundPageFactory(start_from='contributions_close', days_after_today=-1)
+        closed_round = RoundPageFactory(start_from='internends', days_after_today=-60)
+        future_round = RoundPageFactory(start_from='pingnew', days_after_today=30)
+        self.populate(open_round)
+
+        out = StringIO()
+        call_command('round_statistics', stdout=out)
+        self.assertIn('{}: updated'.format(open_round.slug), out.getvalue())
+        self.assertIn('{}: frozen'.format(closed_round.slug), out.getvalue())
+        self.assertNotIn(future_round.slug, out.getvalue())
+
+        # Frozen rounds are left alone, but open ones keep updating.
+        ApplicantApprovalFactory(application_round=closed_round)
+        ApplicantApprovalFactory(application_round=open_round)
+        out = StringIO()
+        call_command('round_statistics', stdout=out)
+        self.assertNotIn(closed_round.slug, out.getvalue())
+        self.assertEqual(models.RoundStatisticsSnapshot.objects.get(pk=open_round.pk).total_eligibility_checks, 7)
+        self.assertEqual(models.RoundStatisticsSnapshot.objects.get(pk=closed_round.pk).total_eligibility_checks, 0)
+
+        call_command('round_statistics', round=closed_round.slug, refreeze=True, stdout=out)
+        self.assertEqual(models.RoundStatisticsSnapshot.objects.get(pk=closed_round.pk).total_eligibility_checks, 1)
+
+    def test_staff_cohort_statistics(self):
+        current_round = RoundPageFactory(start_from='contributions_close', days_after_today=-1)
+        self.populate(current_round)
+        call_command('round_statistics', stdout=StringIO())
+
+        self.client.force_login(ComradeFactory(account__is_staff=True).account)
+        response = self.client.get(reverse('internship-cohort-statistics'))
+        self.assertContains(response, '<td>6</td>')
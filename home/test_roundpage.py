@@ -1,5 +1,8 @@
 from datetime import datetime, timedelta, timezone
+from django.core.cache import cache
+from django.db import connection
 from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 import unittest
 
@@ -151,3 +154,54 @@ class RoundPageTestCase(TestCase):
         self.assertContains(response, 'Outreachy is seeking experienced open source contributors to act as mentors for Outreachy interns', status_code=200)
         # Make sure the page shows the community
         self.assertContains(response, community_name, status_code=200)
+
+
+# don't try to use the static files manifest during tests
+@override_settings(STATICFILES_STORAGE='django.contrib.staticfiles.storage.StaticFilesStorage')
+class ProjectSelectionTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.open_project = ProjectFactory(
+                approval_status=models.ApprovalStatus.APPROVED,
+                project_round__approval_status=models.ApprovalStatus.APPROVED,
+                project_round__participating_round__start_from='initial_applications_open',
+                project_round__participating_round__days_after_today=-10,
+                new_contributors_welcome=True)
+        self.participation = self.open_project.project_round
+        self.closed_project = ProjectFactory(
+                approval_status=models.ApprovalStatus.APPROVED,
+                project_round=self.participation,
+                new_contributors_welcome=False)
+        self.empty_participation = ParticipationFactory(
+                approval_status=models.ApprovalStatus.APPROVED,
+                participating_round=self.participation.participating_round)
+
+    def test_projects_split_by_status(self):
+        response = self.client.get(reverse('project-selection'))
+        self.assertEqual(dict(response.context['ontime_projects']), {
+            self.participation: [self.open_project],
+            self.empty_participation: None,
+        })
+        self.assertEqual(list(response.context['closed_projects']), [
+            (self.participation, [self.closed_project]),
+        ])
+
+    def test_project_list_cached_until_projects_change(self):
+        self.client.get(reverse('project-selection'))
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse('project-selection'))
+        self.assertContains(response, self.open_project.short_title)
+        self.assertContains(response, self.closed_project.short_title)
+        self.assertFalse([q for q in queries if 'home_projectskill' in q['sql']])
+
+        new_project = ProjectFactory(
+                approval_status=models.ApprovalStatus.PENDING,
+                project_round=self.participation)
+        response = self.client.get(reverse('project-selection'))
+        self.assertNotContains(response, new_project.short_title)
+
+        new_project.approval_status = models.ApprovalStatus.APPROVED
+        new_project.save()
+        response = self.client.get(reverse('project-selection'))
+        self.assertContains(response, new_project.short_title)
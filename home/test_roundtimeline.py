@@ -0,0 +1,61 @@
+import datetime
+from django.test import TestCase, RequestFactory
+
+from . import models
+from .factories import RoundPageFactory
+
+
+class RoundTimelineTestCase(TestCase):
+    def setUp(self):
+        self.today = models.get_deadline_date_for(datetime.datetime.now(datetime.timezone.utc))
+        # A round whose interns started a month ago...
+        self.previous_round = RoundPageFactory(start_from='internstarts', days_after_today=-30)
+        # ...and a round that started pinging communities today.
+        self.current_round = RoundPageFactory(start_from='pingnew')
+
+    def test_get_matches_queryset(self):
+        timeline = models.RoundTimeline(self.today)
+        current_round = timeline.get(
+            pingnew__lte=self.today,
+            internannounce__gt=self.today,
+        )
+        self.assertEqual(current_round, self.current_round)
+        self.assertEqual(current_round, models.RoundPage.objects.get(
+            pingnew__lte=self.today,
+            internannounce__gt=self.today,
+        ))
+
+    def test_get_does_not_exist(self):
+        timeline = models.RoundTimeline(self.today)
+        with self.assertRaises(models.RoundPage.DoesNotExist):
+            timeline.get(internstarts__gt=self.today + datetime.timedelta(days=365))
+
+    def test_get_multiple_objects_returned(self):
+        timeline = models.RoundTimeline(self.today)
+        with self.assertRaises(models.RoundPage.MultipleObjectsReturned):
+            timeline.get(finalfeedback__gt=self.today - datetime.timedelta(days=365))
+
+    def test_latest_and_earliest(self):
+        timeline = models.RoundTimeline(self.today)
+        self.assertEqual(timeline.latest('internstarts'), self.current_round)
+        self.assertEqual(timeline.earliest('internstarts'), self.previous_round)
+        self.assertEqual(timeline.filter(internannounce__lte=self.today).latest('internstarts'), self.previous_round)
+        with self.assertRaises(models.RoundPage.DoesNotExist):
+            timeline.filter(pingnew__gt=self.today).latest('internstarts')
+
+    def test_today_is_bound(self):
+        yesterday = self.today - datetime.timedelta(days=1)
+        timeline = models.RoundTimeline(yesterday)
+        current_round = timeline.latest('internstarts')
+        self.assertEqual(current_round.today, yesterday)
+        # pingnew is today, so it hasn't passed yet as of yesterday.
+        self.assertFalse(current_round.pingnew.has_passed())
+
+    def test_for_request_loads_rounds_once(self):
+        request = RequestFactory().get('/')
+        with self.assertNumQueries(1):
+            timeline = models.RoundTimeline.for_request(request, self.today)
+            timeline.get(pingnew__lte=self.today, internannounce__gt=self.today)
+            timeline = models.RoundTimeline.for_request(request, self.today)
+            timeline.filter(internannounce__lte=self.today).latest('internstarts')
+            self.assertEqual(len(timeline), 2)
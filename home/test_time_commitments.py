@@ -0,0 +1,151 @@
+import datetime
+import random
+from io import StringIO
+from django.core.management import call_command
+from django.test import TestCase
+
+from . import models
+from .factories import ApplicantApprovalFactory
+from .factories import RoundPageFactory
+from .management.commands.time_commitment_benchmark import create_time_commitment_calendar_by_day
+from .management.commands.time_commitment_benchmark import find_longest_free_period_by_groupby
+from .management.commands.time_commitment_benchmark import random_time_commitments
+
+
+class TimeCommitmentCalendarTestCase(TestCase):
+    def setUp(self):
+        self.current_round = RoundPageFactory(start_from='internstarts')
+
+    def test_matches_day_by_day_calendar(self):
+        random.seed(0)
+        for i in range(200):
+            tcs = random_time_commitments(self.current_round, random.randrange(6))
+            calendar = models.create_time_commitment_calendar(tcs, self.current_round)
+            self.assertEqual(calendar, create_time_commitment_calendar_by_day(tcs, self.current_round))
+            self.assertEqual(models.find_longest_free_period(calendar), find_longest_free_period_by_groupby(calendar))
+
+    def test_longest_free_period(self):
+        self.assertEqual(models.find_longest_free_period([0, 40, 0, 20, 0, 40, 10]), (2, 3))
+        # Ties go to the earliest period.
+        self.assertEqual(models.find_longest_free_period([0, 0, 40, 0, 0]), (0, 2))
+        self.assertEqual(models.find_longest_free_period([40, 40]), (0, 0))
+        self.assertEqual(models.find_longest_free_period([]), (0, 0))
+
+    def test_never_free(self):
+        calendar = models.create_time_commitment_calendar([{
+            'start_date': self.current_round.internstarts - datetime.timedelta(days=10),
+            'end_date': self.current_round.internends + datetime.timedelta(days=10),
+            'hours': 40,
+        }], self.current_round)
+        summary = models.summarize_time_commitment_calendar(calendar, self.current_round)
+        self.assertIsNone(summary['longest_period_free'])
+        self.assertEqual(summary['percentage_free'], 0)
+
+    def test_batch_matches_get_time_commitments(self):
+        start = self.current_round.internstarts
+        busy = ApplicantApprovalFactory(application_round=self.current_round)
+        models.SchoolTimeCommitment.objects.create(
+            applicant=busy,
+            term_name='Spring',
+            start_date=start - datetime.timedelta(days=30),
+            end_date=start + datetime.timedelta(days=20),
+        )
+        models.EmploymentTimeCommitment.objects.create(
+            applicant=busy,
+            start_date=start + datetime.timedelta(days=50),
+            end_date=start + datetime.timedelta(days=60),
+            hours_per_week=30,
+            job_title='Barista',
+            job_description='Coffee',
+            quit_on_acceptance=False,
+        )
+        models.VolunteerTimeCommitment.objects.create(
+            applicant=busy,
+            start_date=start,
+            end_date=start + datetime.timedelta(days=70),
+            hours_per_week=10,
+        )
+        quitting = ApplicantApprovalFactory(application_round=self.current_round)
+        models.NonCollegeSchoolTimeCommitment.objects.create(
+            applicant=quitting,
+            start_date=start,
+            end_date=start + datetime.timedelta(days=90),
+            hours_per_week=30,
+            quit_on_acceptance=True,
+        )
+        free = ApplicantApprovalFactory(application_round=self.current_round)
+        applicants = [busy, quitting, free]
+
+        with self.assertNumQueries(5):
+            free_periods = models.ApplicantApproval.get_free_periods(applicants)
+
+        for applicant in applicants:
+            expected = applicant.get_time_commitments()
+            for key, value in free_periods[applicant.pk].items():
+                self.assertEqual(value, expected[key])
+
+        self.assertEqual(free_periods[busy.pk]['free_period_start_date'], start + datetime.timedelta(days=21))
+        self.assertEqual(free_periods[quitting.pk]['longest_period_free'], free_periods[free.pk]['longest_period_free'])
+
+    def test_benchmark_command(self):
+        ApplicantApprovalFactory(application_round=self.current_round)
+        out = StringIO()
+        call_command('time_commitment_benchmark', synthetic=5, repeat=1, stdout=out)
+        self.assertIn('5 random applicants', out.getvalue())
+        self.assertIn('1 applicants in', out.getvalue())
+
+
+class TimeCommitmentMemoTestCase(TestCase):
+    def setUp(self):
+        self.current_round = RoundPageFactory(start_from='internstarts')
+
+    def add_volunteering(self, applicant, days):
+        start = self.current_round.internstarts
+        return models.VolunteerTimeCommitment.objects.create(
+            applicant=applicant,
+            start_date=start,
+            end_date=start + datetime.timedelta(days=days),
+            hours_per_week=30,
+        )
+
+    def test_get_time_commitments_remembered(self):
+        applicant = ApplicantApprovalFactory(application_round=self.current_round)
+        self.add_volunteering(applicant, 10)
+
+        tcs = applicant.get_time_commitments()
+        with self.assertNumQueries(0):
+            self.assertIs(applicant.get_time_commitments(), tcs)
+
+        # Different filters get their own results.
+        relevant = applicant.get_relevant_time_commitments()
+        self.assertIsNot(relevant, tcs)
+        with self.assertNumQueries(0):
+            self.assertIs(applicant.get_relevant_time_commitments(), relevant)
+
+    def test_prefetch(self):
+        applicants = [
+            ApplicantApprovalFactory(application_round=self.current_round)
+            for i in range(3)
+        ]
+        self.add_volunteering(applicants[0], 10)
+        self.add_volunteering(applicants[2], 20)
+        self.add_volunteering(applicants[2], 30)
+        models.ContractorInformation.objects.create(
+            applicant=applicants[1],
+            typical_hours=10,
+            continuing_contract_work=False,
+        )
+        expected = [ models.ApplicantApproval.objects.get(pk=a.pk).get_time_commitments() for a in applicants ]
+
+        # Load fresh copies, with a duplicate like the ones regroup produces.
+        fresh = [ models.ApplicantApproval.objects.get(pk=a.pk) for a in applicants + applicants[:1] ]
+        with self.assertNumQueries(6):
+            models.ApplicantApproval.prefetch_time_commitments(fresh)
+
+        with self.assertNumQueries(0):
+            for applicant, tcs in zip(fresh, expected + expected[:1]):
+                found = applicant.get_time_commitments()
+                self.assertEqual(found['longest_period_free'], tcs['longest_period_free'])
+                self.assertEqual(found['free_period_start_date'], tcs['free_period_start_date'])
+                self.assertEqual(found['contractor_time_commitment'], tcs['contractor_time_commitment'])
+                self.assertEqual(found['volunteer_time_commitments'], list(tcs['volunteer_time_commitments']))
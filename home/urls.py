@@ -1,4 +1,4 @@
-from . import dashboard, views
+from . import blog, dashboard, views
 from .models import ApprovalStatus
 from .models import InitialApplicationReview
 
@@ -103,6 +103,7 @@ urlpatterns = [
     re_path(r'^dashboard/process-good-applications/$', views.applicant_review_summary, name='process-good-applications', kwargs={'review_status': 'reviewed', 'status': ApprovalStatus.PENDING, 'rating': InitialApplicationReview.GOOD, 'process': True }),
     re_path(r'^dashboard/process-maybe-applications/$', views.applicant_review_summary, name='process-maybe-applications', kwargs={'review_status': 'reviewed', 'status': ApprovalStatus.PENDING, 'rating': InitialApplicationReview.MAYBE, 'process': True }),
     re_path(r'^dashboard/process-unclear-applications/$', views.applicant_review_summary, name='process-unclear-applications', kwargs={'review_status': 'reviewed', 'status': ApprovalStatus.PENDING, 'rating': InitialApplicationReview.UNCLEAR, 'process': True }),
+    re_path(r'^dashboard/review-applications/batch/$', views.ReviewBatch.as_view(), name='review-applications-batch'),
     re_path(r'^dashboard/review-applications/(?P<applicant_username>[^/]+)/$', views.ViewInitialApplication.as_view(), name='applicant-review-detail'),
     re_path(r'^dashboard/review-applications/update-comment/(?P<applicant_username>[^/]+)/$', views.ReviewCommentUpdate.as_view(), name='update-comment'),
     re_path(r'^dashboard/review-applications/review-essay/(?P<applicant_username>[^/]+)/$', views.ReviewEssay.as_view(), name='review-essay'),
@@ -121,6 +122,7 @@ urlpatterns = [
     re_path(r'^dashboard/trusted-volunteers/$', views.TrustedVolunteersListView.as_view(), name='trusted-volunteers-list'),
     re_path(r'^dashboard/active-trusted-volunteers/$', views.ActiveTrustedVolunteersListView.as_view(), name='active-trusted-volunteers-list'),
     re_path(r'^dashboard/active-internship-contacts/$', views.ActiveInternshipContactsView.as_view(), name='active-internship-contacts'),
+    re_path(r'^dashboard/email-metrics/$', views.email_metrics, name='email-metrics'),
     re_path(r'^docs/$', views.docs_toc, name='docs'),
     re_path(r'^docs/applicant/$', views.docs_applicant, name='docs-applicant'),
     re_path(r'^docs/internship/$', views.docs_internship, name='docs-internship'),
@@ -148,40 +150,9 @@ urlpatterns = [
     re_path(r'^sponsor/$', views.sponsor, name='sponsor'),
     re_path(r'^edit-sponsorship/(?P<pk>[^/]+)/$', views.SponsorshipUpdate.as_view(), name='edit-sponsorship'),
     re_path(r'^blog/(?P<round_slug>[^/]+)/application-period-statistics/$', views.round_statistics, name='blog-application-period-statistics'),
-    re_path(r'^blog/2019-07-23/outreachy-schedule-changes/$', views.blog_schedule_changes, name='blog-schedule-changes'),
-    re_path(r'^blog/2019-10-01/pick-a-project/$', views.blog_2019_pick_projects, name='2019-12-pick-a-project'),
-    re_path(r'^blog/2019-10-18/open-projects/$', views.blog_2019_10_18_open_projects, name='2019-12-project-promotion'),
-    re_path(r'^blog/2020-03-27/outreachy-response-to-covid-19/$', views.blog_2020_03_covid, name='2020-03-covid'),
-    re_path(r'^blog/2020-08-28/december-2020-internship-applications-open/$', views.blog_2020_08_23_initial_applications_open, name='2020-08-initial-apps-open'),
-    re_path(r'^blog/2021-01-15/may-2021-community-cfp-open/$', views.blog_2021_01_15_community_cfp_open, name='2021-01-community-cfp-open'),
-    re_path(r'^blog/2021-02-01/may-2021-initial-applications-open/$', views.blog_2021_02_01_initial_applications_open, name='2021-01-initial-applications-open'),
-    re_path(r'^blog/2021-03-23/fsf-participation-barred/$', views.blog_2021_03_23_fsf_participation_barred, name='2021-03-fsf-participation-barred'),
-    re_path(r'^blog/2021-03-30/contribution-period-open/$', views.blog_2021_03_30_contribution_period_open, name='2021-03-contribution-period-open'),
-    re_path(r'^blog/2021-08-13/december-2021-initial-applications-open/$', views.blog_2021_08_13_initial_applications_open, name='2021-08-initial-applications-open'),
-    re_path(r'^blog/2021-08-18/december-2021-call-for-mentoring-communities/$', views.blog_2021_08_18_cfp_open, name='2021-08-cfp-open'),
-    re_path(r'^blog/2021-10-14/hiring-for-an-outreachy-community-manager/$', views.blog_2021_10_outreachy_hiring, name='2021-10-outreachy-hiring'),
-    re_path(r'^blog/2022-01-10/may-2022-call-for-mentoring-communities/$', views.blog_2022_01_10_cfp_open, name='2022-01-cfp-open'),
-    re_path(r'^blog/2022-02-04/may-2022-initial-applications-open/$', views.blog_2022_02_04_initial_applications_open, name='2022-02-initial-applications-open'),
-    re_path(r'^blog/2022-04-15/outreachy-welcomes-new-community-manager/$', views.blog_2022_04_15_new_community_manager, name='2022-04-new-community-manager'),
-    re_path(r'^blog/2022-06-14/remembering-and-honoring-marina-zhurakhinskaya-founder-of-outreachy/$', views.blog_2022_06_14_remembering_marina, name='2022-06-remembering-marina'),
-    re_path(r'^blog/2022-08-09/december-2022-initial-applications-open/$', views.blog_2022_08_09_initial_applications_open, name='2022-08-initial-applications-open'),
-    re_path(r'^blog/2022-12-05/thank-you-december-2022-mentors-and-coordinators/$', views.blog_2022_12_05_thank_you, name='2022-12-thank-you'),
-    re_path(r'^blog/2023-01-05/may-2023-call-for-mentoring-organizations/$', views.blog_2023_01_05_cfp_open, name='2023-01-cfp-open'),
-    re_path(r'^blog/2023-01-16/may-2023-initial-applications-open/$', views.blog_2023_01_16_initial_applications_open, name='2023-01-initial-applications-open'),
-    re_path(r'^blog/2023-08-01/december-2023-call-for-mentoring-organizations/$', views.blog_2023_08_01_cfp_open, name='2023-08-cfp-open'),
-    re_path(r'^blog/2023-08-08/december-2023-initial-applications-open/$', views.blog_2023_08_08_initial_applications_open, name='2023-08-initial-applications-open'),
-    re_path(r'^blog/2023-08-24/outreachy-welcomes-mentor-advocate/$', views.blog_2023_08_24_tilda, name='2023-08-tilda'),
-    re_path(r'^blog/2024-01-08/may-2024-call-for-mentoring-organizations/$', views.blog_2024_01_08_cfp_open, name='2024-01-cfp-open'),
-    re_path(r'^blog/2024-01-11/outreachy-2023-in-review/$', views.blog_outreachy_2023_year_in_review, name='outreachy-2023-year-in-review'),
-    re_path(r'^blog/2024-01-15/may-2024-initial-applications-open/$', views.blog_2024_01_15_initial_applications_open, name='2024-01-initial-applications-open'),
-    re_path(r'^blog/2024-04-03/mentor-spotlight-agien-petra/$', views.blog_2024_04_mentor_spotlight_agien_petra, name='2024-04-mentor-spotlight-agien-petra'),
-    re_path(r'^blog/2024-07-19/outreachy-impact-ahmed-rafiat/$', views.blog_2024_07_19_mentor_outreachy_impact_ahmed_rafiat, name='2024-07-outreachy-impact-ahmed-rafiat'),
-    re_path(r'^blog/2024-08-14/outreachy-needs-your-help/$', views.blog_2024_08_14_outreachy_needs_your_help, name='2024-08-outreachy-needs-your-help'),
-    re_path(r'^blog/2025-01-20/june-2025-call-for-mentoring-organizations/$', views.blog_2025_01_20_cfp_open, name='2025-01-cfp-open'),
-    re_path(r'^blog/2025-01-27/june-2025-initial-applications-open/$', views.blog_2025_01_27_initial_applications_open, name='2025-01-initial-applications-open'),
-    re_path(r'^blog/2025-08-14/december-2025-call-for-mentoring-organizations/$', views.blog_2025_08_cfp_open, name='2025-08-cfp-open'),
-    re_path(r'^blog/2025-08-25/december-2025-initial-applications-open/$', views.blog_2025_08_25_initial_applications_open, name='2025-08-25-initial-applications-open'),
-    re_path(r'^blog/2026-02-06/may-2026-call-for-mentoring-organizations/$', views.blog_2026_02_06_cfp_open, name='2026-02-cfp-open'),
-    re_path(r'^blog/2026-02-06/may-2026-initial-applications-open/$', views.blog_2026_02_06_initial_applications_open, name='2026-02-initial-applications-open'),
+] + [
+    re_path(r'^{}$'.format(post.path), views.blog_post, {'post': post}, name=post.name)
+    for post in blog.POSTS
+] + [
     re_path(r'^privacy-policy/$', views.privacy_policy, name='privacy-policy'),
 ]
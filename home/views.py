@@ -6,9 +6,9 @@ from django.contrib.auth.decorators import login_required
 from django.contrib.admin.views.decorators import staff_member_required
 from django.contrib.auth.mixins import LoginRequiredMixin, UserPassesTestMixin
 from django.core import mail
+from django.core.cache import cache
 from django.core.exceptions import PermissionDenied
-from django.core.paginator import Paginator
-from django.db import models
+from django.db import models, transaction
 from django.forms import inlineformset_factory, ModelForm, modelform_factory, modelformset_factory, ValidationError
 from django.forms import widgets
 from django.forms.models import BaseInlineFormSet, BaseModelFormSet
@@ -18,6 +18,7 @@ from django.shortcuts import get_object_or_404
 from django.shortcuts import redirect
 from django.shortcuts import render
 from django.urls import reverse
+from django.utils.functional import SimpleLazyObject
 from django.utils.http import urlencode
 from django.utils.safestring import mark_safe
 from django.utils.text import slugify
@@ -49,6 +50,11 @@ from .mixins import ComradeRequiredMixin
 from .mixins import EligibleApplicantRequiredMixin
 from .mixins import Preview
 
+from .page_cache import cache_anonymous_page
+
+from .models import ALUMS_INDEX_GENERATION_KEY
+from .models import ALUMS_TIMEOUT
+from .models import alums_cohort_generation_key
 from .models import AlumInfo
 from .models import ApplicantApproval
 from .models import ApplicantGenderIdentity
@@ -56,6 +62,8 @@ from .models import ApplicantRaceEthnicityInformation
 from .models import ApplicationReviewer
 from .models import ApprovalStatus
 from .models import BarriersToParticipation
+from .models import cache_generation
+from .models import categorize_skill
 from .models import CohortPage
 from .models import CommunicationChannel
 from .models import Community
@@ -63,9 +71,11 @@ from .models import Comrade
 from .models import ContractorInformation
 from .models import Contribution
 from .models import CoordinatorApproval
+from .models import EmailSendMetrics
 from .models import EmploymentTimeCommitment
 from .models import FinalApplication
 from .models import get_deadline_date_for
+from .models import invalidate_initial_application_counts
 from .models import InformalChatContact
 from .models import InternSelection
 from .models import InitialApplicationReview
@@ -90,13 +100,18 @@ from .models import PaymentEligibility
 from .models import PriorFOSSExperience
 from .models import ProfessionalSkill
 from .models import Project
+from .models import PROJECT_SELECTION_GENERATION_KEY
+from .models import PROJECT_SELECTION_TIMEOUT
 from .models import ProjectSkill
 from .models import PromotionTracking
 from .models import Role
 from .models import RoundPage
+from .models import RoundStatisticsSnapshot
+from .models import RoundTimeline
 from .models import skill_is_valid
 from .models import SchoolInformation
 from .models import SchoolTimeCommitment
+from .models import SKILL_CATEGORIES
 from .models import TimeCommitmentSummary
 from .models import SignedContract
 from .models import Sponsorship
@@ -388,11 +403,10 @@ def get_current_round_for_initial_application():
     today = get_deadline_date_for(now)
 
     try:
-        current_round = RoundPage.objects.get(
+        current_round = RoundTimeline(today).get(
             initial_applications_open__lte=today,
             initial_applications_close__gt=today,
         )
-        current_round.today = today
     except RoundPage.DoesNotExist:
         raise PermissionDenied('The Outreachy application period is closed. If you are an applicant who has submitted an application for an internship project and your time commitments have increased, please contact the Outreachy organizers (see contact link above). Eligibility checking will become available when the next application period opens. Please sign up for the announcements mailing list for an email when the next application period opens: https://lists.outreachy.org/cgi-bin/mailman/listinfo/announce')
 
@@ -409,11 +423,10 @@ def get_current_round_for_initial_application_review():
     today = get_deadline_date_for(now)
 
     try:
-        current_round = RoundPage.objects.get(
+        current_round = RoundTimeline(today).get(
             initial_applications_open__lte=today,
             internstarts__gt=today,
         )
-        current_round.today = today
     except RoundPage.DoesNotExist:
         raise PermissionDenied('It is too late to review applications.')
 
@@ -430,10 +443,9 @@ def get_current_round_for_sponsors():
     today = get_deadline_date_for(now)
 
     try:
-        current_round = RoundPage.objects.get(
+        current_round = RoundTimeline(today).get(
             internannounce__gt=today,
         )
-        current_round.today = today
     except RoundPage.DoesNotExist:
         return None
 
@@ -448,10 +460,9 @@ def get_current_round_for_community_signup():
     today = get_deadline_date_for(now)
 
     try:
-        current_round = RoundPage.objects.get(
+        current_round = RoundTimeline(today).get(
             contributions_open__gt=today,
         )
-        current_round.today = today
     except RoundPage.DoesNotExist:
         return None
 
@@ -459,6 +470,7 @@ def get_current_round_for_community_signup():
 
 class EligibilityUpdateView(LoginRequiredMixin, ComradeRequiredMixin, SessionWizardView):
     template_name = 'home/wizard_form.html'
+    storage_name = 'home.wizard_storage.DatabaseStorage'
     condition_dict = {
             'Payment Eligibility': work_eligibility_is_approved,
             'Prior FOSS Experience': work_eligibility_is_approved,
@@ -727,16 +739,13 @@ class EligibilityUpdateView(LoginRequiredMixin, ComradeRequiredMixin, SessionWiz
         return context
 
     def done(self, form_list, **kwargs):
-
-        # Make sure to commit the object to the database before saving
-        # any of the related objects, so they can set their foreign keys
-        # to point to this ApplicantApproval object.
-        self.object = ApplicantApproval.objects.create(
+        self.object = ApplicantApproval(
             applicant=self.request.user.comrade,
             application_round=self.current_round,
             ip_address=self.request.META.get('REMOTE_ADDR'),
         )
 
+        related_objects = []
         for form in form_list:
             results = form.save(commit=False)
 
@@ -747,18 +756,13 @@ class EligibilityUpdateView(LoginRequiredMixin, ComradeRequiredMixin, SessionWiz
             # Make it into a list if it isn't one already.
             if not isinstance(results, list):
                 results = [ results ]
+            related_objects.extend(results)
 
-            # For each object which contains data from the modelform
-            # or modelformsets, we save that database object,
-            # after setting the parent pointer.
-            for r in results:
-                r.applicant = self.object
-                r.save()
-
-        # Now that all the related objects are saved, we can determine
-        # eligibility from them, which avoids duplicating some code that's
-        # already on the models. The cost is reading back some of the objects
-        # we just wrote and then re-saving an object, but that isn't a big hit.
+        # Determine eligibility from the objects we're about to save, so the
+        # ApplicantApproval can be written once with its final status and
+        # nothing needs to be read back.
+        self.object.is_student = any(isinstance(r, SchoolInformation) for r in related_objects)
+        self.object.remember_time_commitments(related_objects)
         self.object.approval_status, self.object.reason_denied = determine_eligibility(self, self.object)
 
         # Save the country and country code
@@ -768,7 +772,24 @@ class EligibilityUpdateView(LoginRequiredMixin, ComradeRequiredMixin, SessionWiz
             self.object.initial_application_country_living_in_during_internship = cleaned_data['country_living_in_during_internship']
             self.object.initial_application_country_living_in_during_internship_code = cleaned_data['country_living_in_during_internship_code']
 
-        self.object.save()
+        with transaction.atomic():
+            # The ApplicantApproval has to be in the database before the
+            # related objects can point their foreign keys at it.
+            self.object.save()
+
+            by_model = {}
+            for r in related_objects:
+                r.applicant = self.object
+                by_model.setdefault(type(r), []).append(r)
+
+            for model, objects in by_model.items():
+                if model.save is not models.Model.save:
+                    # This model does extra work when it's saved, which
+                    # bulk_create would skip.
+                    for obj in objects:
+                        obj.save()
+                else:
+                    model.objects.bulk_create(objects)
 
         return redirect(self.request.GET.get('next', reverse('professional-skills')))
 
@@ -879,11 +900,10 @@ def promote_page(request):
     # initial application period ends. After that, there's
     # no point in getting people to apply to that round.
     try:
-        current_round = RoundPage.objects.get(
+        current_round = RoundTimeline.for_request(request, today).get(
             pingnew__lte=today,
             initial_applications_close__gt=today,
         )
-        current_round.today = today
     except RoundPage.DoesNotExist:
         current_round = None
 
@@ -893,6 +913,7 @@ def promote_page(request):
             },
             )
 
+@cache_anonymous_page(RoundPage)
 def past_rounds_page(request):
     return render(request, 'home/past_rounds.html',
             {
@@ -900,9 +921,78 @@ def past_rounds_page(request):
             },
             )
 
+def split_approved_projects(participations):
+    """
+    Find the approved projects for each participation, sorted into those
+    which are closed to new contributors and those which are still open.
+    Participations without any approved projects are listed as open, with
+    no projects.
+
+    This takes one query for the projects and one for all of their skills,
+    no matter how many communities are participating.
+    """
+    participations = list(participations.select_related('community'))
+    projects = Project.objects.approved().filter(
+        project_round__in=participations,
+    ).prefetch_related(
+        models.Prefetch('projectskill_set', to_attr='prefetched_skills'),
+    )
+
+    by_participation = {p.pk: ([], []) for p in participations}
+    for project in projects:
+        closed, ontime = by_participation[project.project_round_id]
+        if project.new_contributors_welcome:
+            ontime.append(project)
+        else:
+            closed.append(project)
+
+    closed_approved_projects = []
+    ontime_approved_projects = []
+    for p in participations:
+        closed, ontime = by_participation[p.pk]
+        for project in chain(closed, ontime):
+            project.project_round = p
+        if closed:
+            closed_approved_projects.append((p, closed))
+        if ontime:
+            ontime_approved_projects.append((p, ontime))
+        # List communities that are approved but don't have any projects yet
+        if not closed and not ontime:
+            ontime_approved_projects.append((p, None))
+
+    return closed_approved_projects, ontime_approved_projects
+
+def project_list_visibility(request, role):
+    """
+    Everyone who gets the same answer here sees the same list of
+    communities and projects on the project selection page, so the rendered
+    list is cached under this name.
+    """
+    if role.is_volunteer:
+        if role.is_approved_applicant:
+            return 'volunteer-applicant'
+        return 'volunteer'
+    if role.is_approved_applicant:
+        return 'applicant'
+
+    # Project details are hidden, with a note explaining why; see
+    # home/snippet/project_hidden.html.
+    if not hasattr(request.user, 'comrade'):
+        return 'anonymous'
+    if role.is_potential_applicant:
+        return 'potential-applicant'
+    if role.is_pending_applicant:
+        return 'pending-applicant'
+    if role.is_rejected_applicant:
+        return 'rejected-applicant'
+    if role.pending_mentored_projects.exists():
+        return 'pending-mentor'
+    return 'hidden'
+
 def current_round_page(request):
     closed_approved_projects = []
     ontime_approved_projects = []
+    project_list_key = None
     example_skill = ProjectSkill
 
     now = datetime.now(timezone.utc)
@@ -911,22 +1001,21 @@ def current_round_page(request):
     # For the purposes of this view, a round is current until its
     # intern selections are announced, and then it becomes one of
     # the "previous" rounds.
+    timeline = RoundTimeline.for_request(request, today)
 
     try:
-        previous_round = RoundPage.objects.filter(
+        previous_round = timeline.filter(
             internannounce__lte=today,
         ).latest('internstarts')
-        previous_round.today = today
     except RoundPage.DoesNotExist:
         previous_round = None
 
     try:
         # Keep RoundPage.serve() in sync with this.
-        current_round = RoundPage.objects.get(
+        current_round = timeline.get(
             pingnew__lte=today,
             internannounce__gt=today,
         )
-        current_round.today = today
     except RoundPage.DoesNotExist:
         current_round = None
 
@@ -934,6 +1023,7 @@ def current_round_page(request):
     if current_round is not None:
         all_participations = current_round.participation_set.approved().order_by('community__name')
         apps_open = current_round.initial_applications_open.has_passed()
+        visibility = project_list_visibility(request, role)
 
         if apps_open or role.is_volunteer:
             # Anyone should be able to see all projects if the initial
@@ -950,21 +1040,25 @@ def current_round_page(request):
                 community__coordinatorapproval__approval_status=ApprovalStatus.APPROVED,
                 community__coordinatorapproval__coordinator__account=request.user,
             )
+            # This list is different for each person.
+            visibility = '{}-{}'.format(visibility, request.user.pk)
 
         else:
             # Otherwise, no communities should be visible.
             approved_participations = all_participations.none()
 
-        for p in approved_participations:
-            projects = p.project_set.approved().filter(new_contributors_welcome=False)
-            if projects:
-                closed_approved_projects.append((p, projects))
-            projects = p.project_set.approved().filter(new_contributors_welcome=True)
-            if projects:
-                ontime_approved_projects.append((p, projects))
-            # List communities that are approved but don't have any projects yet
-            if not p.project_set.approved():
-                ontime_approved_projects.append((p, None))
+        # The template caches the rendered list of communities and projects,
+        # so only look them up if it actually needs them. The list also
+        # changes as the round's deadlines pass, so it's cached per day.
+        project_lists = SimpleLazyObject(lambda: split_approved_projects(approved_participations))
+        closed_approved_projects = SimpleLazyObject(lambda: project_lists[0])
+        ontime_approved_projects = SimpleLazyObject(lambda: project_lists[1])
+        project_list_key = (
+            current_round.pk,
+            visibility,
+            today,
+            cache_generation(PROJECT_SELECTION_GENERATION_KEY),
+        )
 
     return render(request, 'home/round_page_with_communities.html',
             {
@@ -972,6 +1066,8 @@ def current_round_page(request):
             'previous_round' : previous_round,
             'closed_projects': closed_approved_projects,
             'ontime_projects': ontime_approved_projects,
+            'project_list_key': project_list_key,
+            'project_list_timeout': PROJECT_SELECTION_TIMEOUT,
             'example_skill': example_skill,
             'role': role,
             },
@@ -1874,8 +1970,19 @@ class ProjectSkillsRename(LoginRequiredMixin, FormView):
 
         return super(ProjectSkillsRename, self).get_form(*args, **kwargs)
 
+    def get_initial(self):
+        # If the selected skills are all variations on one of the common skill
+        # categories, suggest renaming them to that category's name.
+        initial = super(ProjectSkillsRename, self).get_initial()
+        categories = set(categorize_skill(ps.skill)[0] for ps in self.project_skills)
+        if len(categories) == 1 and categories & set(category for category, pattern in SKILL_CATEGORIES):
+            initial['new_name'] = categories.pop()
+        return initial
+
     def get_context_data(self, **kwargs):
         context = super(ProjectSkillsRename, self).get_context_data(**kwargs)
+        for ps in self.project_skills:
+            ps.categories = categorize_skill(ps.skill)
         context.update({
             'project_skills' : self.project_skills,
             })
@@ -2098,9 +2205,11 @@ class ProjectApplicants(LoginRequiredMixin, ComradeRequiredMixin, TemplateView):
         if not self.request.user.is_staff and not project.project_round.community.is_coordinator(self.request.user) and not project.round().is_mentor(self.request.user):
             raise PermissionDenied("You are not an approved mentor for this project.")
 
-        contributions = project.contribution_set.filter(
+        contributions = list(project.contribution_set.filter(
                 applicant__approval_status=ApprovalStatus.APPROVED).order_by(
-                "applicant__applicant__public_name", "date_started")
+                "applicant__applicant__public_name", "date_started").select_related(
+                "applicant__application_round"))
+        ApplicantApproval.prefetch_time_commitments(c.applicant for c in contributions)
         internship_total_days = current_round.internends - current_round.internstarts
         try:
             mentor_approval = project.mentorapproval_set.approved().get(
@@ -2148,14 +2257,17 @@ def community_applicants(request, round_slug, community_slug):
         'is_staff': user_is_staff,
         })
 
+@cache_anonymous_page(RoundPage)
 def eligibility_information(request):
     now = datetime.now(timezone.utc)
     today = get_deadline_date_for(now)
 
+    timeline = RoundTimeline.for_request(request, today)
+
     try:
         # The most relevant dates come from the soonest round where internships
         # haven't started yet...
-        current_round = RoundPage.objects.filter(
+        current_round = timeline.filter(
             internstarts__gt=today,
         ).earliest('internstarts')
     except RoundPage.DoesNotExist:
@@ -2163,12 +2275,10 @@ def eligibility_information(request):
             # ...but if there aren't any, use the round that started most
             # recently, so people get some idea of what the timeline looks like
             # even when the next round isn't announced yet.
-            current_round = RoundPage.objects.latest('internstarts')
+            current_round = timeline.latest('internstarts')
         except RoundPage.DoesNotExist:
             raise Http404("No internship rounds configured yet!")
 
-    current_round.today = today
-
     return render(request, 'home/eligibility.html', {
         'current_round': current_round,
         })
@@ -2233,6 +2343,17 @@ class ActiveTrustedVolunteersListView(UserPassesTestMixin, ListView):
     def test_func(self):
         return self.request.user.is_staff
 
+@login_required
+@staff_member_required
+def email_metrics(request):
+    """
+    How long recent staff email reminders took to render and send, with a
+    breakdown by template.
+    """
+    return render(request, 'home/email_metrics.html', {
+        'metrics': EmailSendMetrics.objects.select_related('internship_round')[:100],
+    })
+
 class ActiveInternshipContactsView(UserPassesTestMixin, TemplateView):
     template_name = 'home/active_internship_contacts.html'
 
@@ -2828,352 +2949,27 @@ class InternAgreementSign(LoginRequiredMixin, ComradeRequiredMixin, CreateView):
     def get_success_url(self):
         return reverse('dashboard')
 
+# Until a snapshot is stored, the funded intern count comes from each
+# approved Participation.
+@cache_anonymous_page(RoundPage, Participation, RoundStatisticsSnapshot)
 def round_statistics(request, round_slug):
     current_round = get_object_or_404(RoundPage, slug=round_slug)
+    if current_round.contributions_close.has_passed():
+        statistics = RoundStatisticsSnapshot.for_round(current_round)
+    else:
+        statistics = None
     return render(request, 'home/blog/round-statistics.html', {
         'current_round': current_round,
+        'statistics': statistics,
         })
 
-def blog_schedule_changes(request):
-    try:
-        changed_round = RoundPage.objects.get(
-            contributions_open__gte='2019-07-23',
-            contributions_open__lte='2019-12-01',
-        )
-    except RoundPage.DoesNotExist:
-        changed_round = None
-    return render(request, 'home/blog/2019-07-23-outreachy-schedule-changes.html', {
-        'changed_round': changed_round,
-        })
-
-def blog_2019_pick_projects(request):
-    try:
-        changed_round = RoundPage.objects.get(
-            contributions_open__gte='2019-07-23',
-            contributions_open__lte='2019-12-01',
-        )
-    except RoundPage.DoesNotExist:
-        changed_round = None
-    return render(request, 'home/blog/2019-10-01-picking-a-project.html', {
-        'changed_round': changed_round,
-        })
-
-def blog_2019_10_18_open_projects(request):
-    return render(request, 'home/blog/2019-10-18-open-projects.html')
-
-def blog_2020_03_covid(request):
-    return render(request, 'home/blog/2020-03-27-outreachy-response-to-covid-19.html')
-
-def blog_2020_08_23_initial_applications_open(request):
-    try:
-        current_round = RoundPage.objects.get(
-            internstarts__gte='2020-11-01',
-            internends__lte='2021-04-01',
-        )
-    except RoundPage.DoesNotExist:
-        current_round = None
-    return render(request, 'home/blog/2020-08-23-initial-applications-open.html', {
-        'current_round': current_round,
-        })
-
-def blog_2021_01_15_community_cfp_open(request):
-    try:
-        current_round = RoundPage.objects.get(
-            internstarts__gte='2021-05-01',
-            internends__lte='2021-09-01',
-        )
-    except RoundPage.DoesNotExist:
-        current_round = None
-    return render(request, 'home/blog/2021-01-15-community-cfp-open.html', {
-        'current_round': current_round,
-        })
-
-def blog_2021_02_01_initial_applications_open(request):
-    try:
-        current_round = RoundPage.objects.get(
-            internstarts__gte='2021-05-01',
-            internends__lte='2021-09-01',
-        )
-    except RoundPage.DoesNotExist:
-        current_round = None
-    return render(request, 'home/blog/2021-02-01-initial-applications-open.html', {
-        'current_round': current_round,
-        })
-
-def blog_2021_03_23_fsf_participation_barred(request):
-    return render(request, 'home/blog/2021-03-23-fsf-participation-barred.html')
-
-def blog_2021_03_30_contribution_period_open(request):
-    return render(request, 'home/blog/2021-03-30-contribution-period-open.html')
-
-def blog_2021_08_13_initial_applications_open(request):
-    try:
-        current_round = RoundPage.objects.get(
-            internstarts__gte='2021-08-01',
-            internends__lte='2022-04-01',
-        )
-    except RoundPage.DoesNotExist:
-        current_round = None
-    return render(request, 'home/blog/2021-08-13-initial-applications-open.html', {
-        'current_round': current_round,
-        })
-
-def blog_2021_08_18_cfp_open(request):
-    try:
-        current_round = RoundPage.objects.get(
-            internstarts__gte='2021-08-01',
-            internends__lte='2022-04-01',
-        )
-    except RoundPage.DoesNotExist:
-        current_round = None
-    return render(request, 'home/blog/2021-08-18-cfp-open.html', {
-        'current_round': current_round,
-        })
-
-def blog_2021_10_outreachy_hiring(request):
-    return render(request, 'home/blog/2021-10-12-outreachy-is-hiring.html')
-
-def blog_2022_01_10_cfp_open(request):
-    try:
-        current_round = RoundPage.objects.get(
-            internstarts__gte='2022-05-01',
-            internends__lte='2022-09-01',
-        )
-    except RoundPage.DoesNotExist:
-        current_round = None
-    return render(request, 'home/blog/2022-01-10-community-cfp-open.html', {
-        'current_round': current_round,
-        })
-
-def blog_2022_02_04_initial_applications_open(request):
-    try:
-        current_round = RoundPage.objects.get(
-            internstarts__gte='2022-05-01',
-            internends__lte='2022-09-01',
-        )
-    except RoundPage.DoesNotExist:
-        current_round = None
-    return render(request, 'home/blog/2022-02-04-initial-applications-open.html', {
-        'current_round': current_round,
-        })
-
-def blog_2022_04_15_new_community_manager(request):
-    return render(request, 'home/blog/2022-04-15-new-outreachy-community-manager.html')
-
-def blog_2022_06_14_remembering_marina(request):
-    return render(request, 'home/blog/2022-06-14-remembering-and-honoring-marina.html')
-
-def blog_2022_08_09_initial_applications_open(request):
-    try:
-        current_round = RoundPage.objects.get(
-            internstarts__gte='2022-12-01',
-            internends__lte='2023-04-01',
-        )
-    except RoundPage.DoesNotExist:
-        current_round = None
-    return render(request, 'home/blog/2022-08-09-initial-applications-open.html', {
-        'current_round': current_round,
-        })
-
-def blog_2022_12_05_thank_you(request):
-    try:
-        current_round = RoundPage.objects.get(
-            internstarts__gte='2022-12-01',
-            internends__lte='2023-04-01',
-        )
-        # Mentors who were approved, their project was approved, and their community was approved
-        mentors = MentorApproval.objects.filter(
-                approval_status=ApprovalStatus.APPROVED,
-                project__approval_status=ApprovalStatus.APPROVED,
-                project__project_round__approval_status=ApprovalStatus.APPROVED,
-                project__project_round__participating_round=current_round,
-                ).order_by('mentor__public_name')
-        mentor_names = [mentor.mentor.public_name for mentor in mentors]
-        mentor_names = sorted(list(set(mentor_names)))
-        community_names = [mentor.project.project_round.community.name for mentor in mentors]
-        community_names = sorted(list(set(community_names)))
-        coordinators = CoordinatorApproval.objects.filter(
-                approval_status=ApprovalStatus.APPROVED,
-                community__participation__participating_round=current_round,
-                community__participation__approval_status=ApprovalStatus.APPROVED,
-                ).distinct()
-        coordinator_names = [coordinator.coordinator.public_name for coordinator in coordinators]
-        coordinator_names = sorted(list(set(coordinator_names)))
-    except RoundPage.DoesNotExist:
-        current_round = None
-        mentors = None
-        mentor_names = None
-        community_names = None
-        coordinator_names = None
-    return render(request, 'home/blog/2022-12-05-thank-you.html', {
-        'current_round': current_round,
-        'mentors': mentors,
-        'mentor_names': mentor_names,
-        'community_names': community_names,
-        'coordinator_names': coordinator_names,
-        })
-
-def blog_2023_01_05_cfp_open(request):
-    try:
-        current_round = RoundPage.objects.get(
-            internstarts__gte='2023-05-01',
-            internends__lte='2023-09-01',
-        )
-    except RoundPage.DoesNotExist:
-        current_round = None
-    return render(request, 'home/blog/2023-01-05-community-cfp-open.html', {
-        'current_round': current_round,
-        })
-
-def blog_2023_01_16_initial_applications_open(request):
-    try:
-        current_round = RoundPage.objects.get(
-            internstarts__gte='2023-05-01',
-            internends__lte='2023-09-01',
-        )
-    except RoundPage.DoesNotExist:
-        current_round = None
-    return render(request, 'home/blog/2023-01-16-initial-applications-open.html', {
-        'current_round': current_round,
-        })
-
-def blog_2023_08_01_cfp_open(request):
-    try:
-        current_round = RoundPage.objects.get(
-            internstarts__gte='2023-12-01',
-            internends__lte='2024-04-01',
-        )
-    except RoundPage.DoesNotExist:
-        current_round = None
-    return render(request, 'home/blog/2023-08-01-community-cfp-open.html', {
-        'current_round': current_round,
-        })
-
-def blog_2023_08_08_initial_applications_open(request):
-    try:
-        current_round = RoundPage.objects.get(
-            internstarts__gte='2023-12-01',
-            internends__lte='2024-04-01',
-        )
-    except RoundPage.DoesNotExist:
-        current_round = None
-    return render(request, 'home/blog/2023-08-08-initial-applications-open.html', {
-        'current_round': current_round,
-        })
-
-def blog_2023_08_24_tilda(request):
-    return render(request, 'home/blog/2023-08-24-announcing-tilda-a-new-Outreachy-organizer.html')
-
-def blog_2024_01_08_cfp_open(request):
-    try:
-        current_round = RoundPage.objects.get(
-            internstarts__gte='2024-01-01',
-            internends__lte='2024-09-01',
-        )
-    except RoundPage.DoesNotExist:
-        current_round = None
-    return render(request, 'home/blog/2024-01-08-community-cfp-open.html', {
-        'current_round': current_round,
-        })
-
-def blog_outreachy_2023_year_in_review(request):
-    return render(request, 'home/blog/2024-01-10-outreachy-2023-year-in-review.html')
-
-def blog_2024_01_15_initial_applications_open(request):
-    try:
-        current_round = RoundPage.objects.get(
-            internstarts__gte='2024-01-01',
-            internends__lte='2024-09-01',
-        )
-    except RoundPage.DoesNotExist:
-        current_round = None
-    return render(request, 'home/blog/2024-01-15-initial-applications-open.html', {
-        'current_round': current_round,
-        })
-
-def blog_2024_04_mentor_spotlight_agien_petra(request):
-    return render(request, 'home/blog/2024-04-mentor-spotlight-agien-petra.html')
-
-def blog_2024_07_19_mentor_outreachy_impact_ahmed_rafiat(request):
-    return render(request, 'home/blog/2024-07-19-outreachy-impact-ahmed-rafiat.html')
-
-def blog_2024_08_14_outreachy_needs_your_help(request):
-    return render(request, 'home/blog/2024-08-14-outreachy-needs-your-help.html')
-
-def blog_2025_01_27_initial_applications_open(request):
-    try:
-        current_round = RoundPage.objects.get(
-            internstarts__gte='2025-01-01',
-            internends__lte='2025-09-01',
-        )
-    except RoundPage.DoesNotExist:
-        current_round = None
-    return render(request, 'home/blog/2025-01-27-initial-applications-open.html', {
-         'current_round': current_round,
-        })
-
-def blog_2025_01_20_cfp_open(request):
-    try:
-        current_round = RoundPage.objects.get(
-            internstarts__gte='2025-05-01',
-          
-            internends__lte='2025-09-01',
-        )
-    except RoundPage.DoesNotExist:
-        current_round = None
-
-    return render(request, 'home/blog/2025-01-20-community-cfp-open.html', {
-        'current_round': current_round,
-        })
-
-def blog_2025_08_cfp_open(request):
-    try:
-        current_round = RoundPage.objects.get(
-            internstarts__gte='2025-11-01',
-            internends__lte='2026-04-01',
-        )
-    except RoundPage.DoesNotExist:
-        current_round = None
-
-    return render(request, 'home/blog/2025-08-14-community-cfp-open.html', {
-        'current_round': current_round,
-        })
-
-def blog_2025_08_25_initial_applications_open(request):
-    try:
-        current_round = RoundPage.objects.get(
-            internstarts__gte='2025-11-01',
-            internends__lte='2026-04-01',
-        )
-    except RoundPage.DoesNotExist:
-        current_round = None
-    return render(request, 'home/blog/2025-08-25-initial-applications-open.html', {
-         'current_round': current_round,
-        })
-
-def blog_2026_02_06_initial_applications_open(request):
-    try:
-        current_round = RoundPage.objects.get(
-            internstarts__gte='2026-02-01',
-            internends__lte='2026-09-01',
-        )
-    except RoundPage.DoesNotExist:
-        current_round = None
-    return render(request, 'home/blog/2026-02-06-initial-applications-open.html', {
-         'current_round': current_round,
-        })
-
-def blog_2026_02_06_cfp_open(request):
-    try:
-        current_round = RoundPage.objects.get(
-            internstarts__gte='2026-02-01',
-            internends__lte='2026-09-01',
-        )
-    except RoundPage.DoesNotExist:
-        current_round = None
-    return render(request, 'home/blog/2026-02-06-community-cfp-open.html', {
-         'current_round': current_round,
-        })
+def blog_post(request, post):
+    """
+    Render one of the blog posts listed in home.blog.POSTS. Most visitors
+    are served a copy rendered by the prerender_blog management command
+    instead; see outreachyhome.middleware.PrerenderedPageMiddleware.
+    """
+    return render(request, post.template, post.get_context())
 
 class InitialMentorFeedbackUpdate(LoginRequiredMixin, reversion.views.RevisionMixin, UpdateView):
     form_class = modelform_factory(Feedback1FromMentor,
@@ -4124,42 +3920,77 @@ class ReviewInterns(LoginRequiredMixin, ComradeRequiredMixin, TemplateView):
         context['intern_selections'] = InternSelection.objects.filter(applicant__application_round=current_round).order_by('project__project_round__community__name')
         return context
 
+def alums_index(today):
+    """
+    Find the start date of every cohort which has been announced, newest
+    first, and the RoundPage or CohortPage for each year and month.
+    """
+    key = 'alums-index:{}:{}'.format(
+        today,
+        cache_generation(ALUMS_INDEX_GENERATION_KEY),
+    )
+    index = cache.get(key)
+    if index is None:
+        rounds = list(RoundPage.objects.filter(internannounce__lte=today))
+        cohorts = list(CohortPage.objects.all())
+
+        # Sorting the combined list in the database is hard to get right, but this
+        # is a small list so it's fine to sort it in Python instead.
+        start_dates = sorted(
+            set(r.internstarts for r in rounds).union(c.round_start for c in cohorts),
+            reverse=True,
+        )
+
+        # Check the historical records from before we had round pages only if
+        # there's no round page for that month.
+        pages = {(c.round_start.year, c.round_start.month): c for c in cohorts}
+        pages.update({(r.internstarts.year, r.internstarts.month): r for r in rounds})
+
+        index = (start_dates, pages)
+        cache.set(key, index, ALUMS_TIMEOUT)
+    return index
+
 def alums_page(request, year=None, month=None):
     now = datetime.now(timezone.utc)
     today = get_deadline_date_for(now)
-    visible_rounds = RoundPage.objects.filter(internannounce__lte=today)
-
-    # Sorting the combined list in the database is hard to get right, but this
-    # is a small list so it's fine to sort it in Python instead.
-    start_dates = sorted(
-        set(visible_rounds.values_list("internstarts", flat=True).order_by()).union(
-            CohortPage.objects.values_list("round_start", flat=True).order_by()
-        ),
-        reverse=True,
-    )
+    start_dates, pages = alums_index(today)
 
     if year is None or month is None:
         starts = start_dates[0]
         return redirect("cohort", year=starts.year, month=str(starts.month).rjust(2, "0"))
 
-    try:
-        round_page = visible_rounds.get(internstarts__year=year, internstarts__month=month)
-        interns = Role(request.user, round_page).visible_intern_selections
-        return render(request, 'home/alums_roundpage.html', {
-            "start_dates": start_dates,
-            "round": round_page,
-            "interns": interns,
+    page = pages.get((int(year), int(month)))
+    if page is None:
+        raise Http404("No cohort started in that month.")
+
+    # The template caches the rendered list of interns, so only look them up
+    # if it actually needs them.
+    context = {
+        "start_dates": start_dates,
+        "interns_key": (page.pk, cache_generation(alums_cohort_generation_key(page))),
+        "interns_timeout": ALUMS_TIMEOUT,
+    }
+
+    if isinstance(page, RoundPage):
+        interns = Role(request.user, page).visible_intern_selections.select_related(
+            'applicant__applicant__account',
+            'project__project_round__community',
+        ).prefetch_related(
+            models.Prefetch('mentors', queryset=MentorApproval.objects.select_related('mentor')),
+            models.Prefetch('project__projectskill_set', to_attr='prefetched_skills'),
+        )
+        context.update({
+            "round": page,
+            "interns": SimpleLazyObject(lambda: list(interns)),
         })
+        return render(request, 'home/alums_roundpage.html', context)
 
-    except RoundPage.DoesNotExist:
-        # Check the historical records from before we had round pages:
-        cohort_page = get_object_or_404(CohortPage, round_start__year=year, round_start__month=month)
-        interns = cohort_page.participant.order_by('community', 'name')
-        return render(request, 'home/alums_cohortpage.html', {
-            "start_dates": start_dates,
-            "cohort": cohort_page,
-            "interns": interns,
-        })
+    interns = page.participant.select_related('picture').order_by('community', 'name')
+    context.update({
+        "cohort": page,
+        "interns": SimpleLazyObject(lambda: list(interns)),
+    })
+    return render(request, 'home/alums_cohortpage.html', context)
 
 def privacy_policy(request):
     with open(path.join(settings.BASE_DIR, 'docs', 'privacy-policy.md')) as policy_file:
@@ -4168,13 +3999,59 @@ def privacy_policy(request):
         'privacy_policy': markdownify(policy),
         })
 
+class KeysetPage(object):
+    """
+    One page of a queryset, ordered by primary key, which starts just after
+    or just before a given key. Unlike Paginator, this never counts the
+    whole queryset or skips over earlier rows, so every page is as cheap to
+    load as the first. Use the `after` and `before` query parameters to
+    link to the next and previous pages.
+    """
+
+    def __init__(self, queryset, per_page, after=None, before=None):
+        if before is not None:
+            rows = list(queryset.filter(pk__lt=before).order_by('-pk')[:per_page + 1])
+            self.has_previous = len(rows) > per_page
+            self.object_list = rows[:per_page][::-1]
+            self.has_next = queryset.filter(pk__gte=before).exists()
+        else:
+            if after is not None:
+                queryset_after = queryset.filter(pk__gt=after)
+            else:
+                queryset_after = queryset
+            rows = list(queryset_after.order_by('pk')[:per_page + 1])
+            self.has_next = len(rows) > per_page
+            self.object_list = rows[:per_page]
+            self.has_previous = after is not None and queryset.filter(pk__lte=after).exists()
+
+    @classmethod
+    def from_request(cls, queryset, per_page, request):
+        def key(name):
+            try:
+                return int(request.GET[name])
+            except (KeyError, ValueError):
+                return None
+        return cls(queryset, per_page, after=key('after'), before=key('before'))
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def next_after(self):
+        return self.object_list[-1].pk
+
+    def previous_before(self):
+        return self.object_list[0].pk
+
 @login_required
 def applicant_review_summary(request, status, owner_username=None, review_status=None, rating=None, process=False):
     """
     For applicant reviewers and staff, show the status of applications that
     have the specified approval status.
     """
-    # Update dashboard.application_summary too if you change anything here.
+    # Update RoundPage.count_initial_applications too if you change anything here.
 
     current_round = get_current_round_for_initial_application_review()
 
@@ -4190,7 +4067,7 @@ def applicant_review_summary(request, status, owner_username=None, review_status
     applications = ApplicantApproval.objects.filter(
         application_round=current_round,
         approval_status=status,
-    ).order_by('pk').select_related(
+    ).select_related(
         'applicant__account',
         # one-to-one reverse references:
         'workeligibility',
@@ -4204,28 +4081,27 @@ def applicant_review_summary(request, status, owner_username=None, review_status
     )
     # XXX: This will break if anyone has a username of all - not sure how to handle this
     if owner_username and owner_username != 'all':
-        applications = applications.filter(review_owner__comrade__account__username=owner_username)
+        applications = applications.filter(review_owner__comrade=comrade)
     elif not owner_username:
         # look for unowned applications
         applications = applications.filter(review_owner=None)
     # else don't filter on application ownership
 
+    # These filters use the review state stored on each application (see
+    # ApplicantApproval.update_review_state), so they don't need joins, and
+    # each application appears at most once.
     if review_status == 'unreviewed':
-        applications = applications.filter(initialapplicationreview__isnull=True)
+        applications = applications.filter(has_review=False)
     elif review_status == 'unreviewed-non-student':
-        applications = applications.filter(initialapplicationreview__isnull=True).filter(schoolinformation__isnull=True)
+        applications = applications.filter(has_review=False, is_student=False)
     elif review_status == 'reviewed':
-        applications = applications.filter(initialapplicationreview__isnull=False)
+        applications = applications.filter(has_review=True)
     # else don't filter on review status
 
     if rating:
-        applications = applications.filter(initialapplicationreview__essay_rating=rating)
-
-    applications = applications.distinct()
+        applications = applications.filter(best_rating=rating)
 
-    paginator = Paginator(applications, 25)
-    page_number = request.GET.get("page", 1)
-    page_obj = paginator.page(page_number)
+    page_obj = KeysetPage.from_request(applications, 25, request)
 
     if status == ApprovalStatus.PENDING:
         heading = 'Pending Applications'
@@ -4434,22 +4310,8 @@ class EssayRating(LoginRequiredMixin, ComradeRequiredMixin, View):
         application, reviewer, review = get_or_create_application_reviewer_and_review(self)
 
         rating = kwargs['rating']
-        if rating == "STRONG":
-            review.essay_rating = review.STRONG
-        elif rating == "GOOD":
-            review.essay_rating = review.GOOD
-        elif rating == "MAYBE":
-            review.essay_rating = review.MAYBE
-        elif rating == "UNCLEAR":
-            review.essay_rating = review.UNCLEAR
-        elif rating == "UNRATED":
-            review.essay_rating = review.UNRATED
-        elif rating == "NOTCOMPELLING":
-            review.essay_rating = review.NOTCOMPELLING
-        elif rating == "NOTUNDERSTOOD":
-            review.essay_rating = review.NOTUNDERSTOOD
-        elif rating == "SPAM":
-            review.essay_rating = review.SPAM
+        if rating in review.RATING_NAMES:
+            review.essay_rating = review.RATING_NAMES[rating]
         review.save()
 
         return redirect(self.request.GET.get('next', application.get_preview_url()))
@@ -4459,53 +4321,166 @@ class EssayRating(LoginRequiredMixin, ComradeRequiredMixin, View):
 class ChangeRedFlag(LoginRequiredMixin, ComradeRequiredMixin, View):
     def post(self, request, *args, **kwargs):
 
-        flags = [
-                'review_school',
-                'missing_school',
-                'review_work',
-                'missing_work',
-                'incorrect_dates',
-                ]
-
         # validate input
         flag_value = kwargs['flag_value']
         flag = kwargs['flag']
         if flag_value != 'True' and flag_value != 'False':
             raise PermissionDenied('Time commitment review flags must be True or False.')
-        if flag not in flags:
+        if flag not in InitialApplicationReview.RED_FLAGS:
             raise PermissionDenied('Unknown time commitment review flag.')
 
         application, reviewer, review = get_or_create_application_reviewer_and_review(self)
 
-        if flag == "review_school":
-            if flag_value == 'True':
-                review.review_school = True
-            elif flag_value == 'False':
-                review.review_school = False
-        elif flag == "missing_school":
-            if flag_value == 'True':
-                review.missing_school = True
-            elif flag_value == 'False':
-                review.missing_school = False
-        elif flag == "review_work":
-            if flag_value == 'True':
-                review.review_work = True
-            elif flag_value == 'False':
-                review.review_work = False
-        elif flag == "missing_work":
-            if flag_value == 'True':
-                review.missing_work = True
-            elif flag_value == 'False':
-                review.missing_work = False
-        elif flag == "incorrect_dates":
-            if flag_value == 'True':
-                review.incorrect_dates = True
-            elif flag_value == 'False':
-                review.incorrect_dates = False
+        setattr(review, flag, flag_value == 'True')
         review.save()
 
         return redirect(application.get_preview_url())
 
+class ReviewBatch(LoginRequiredMixin, ComradeRequiredMixin, View):
+    """
+    Apply several reviewer actions at once, so the review pages can save
+    changes without reloading. The request body is JSON like:
+
+        {"operations": [
+            {"application": "<applicant username>",
+             "rating": "STRONG",
+             "flags": {"review_school": true},
+             "owner": "<reviewer username>" or null,
+             "comment": "..."},
+            ...
+        ]}
+
+    Every key except "application" is optional. Either all operations are
+    applied, or, if any of them is invalid, none are. The response lists
+    the new review state of each application.
+    """
+
+    def post(self, request, *args, **kwargs):
+        try:
+            operations = json.loads(request.body)['operations']
+            if not isinstance(operations, list) or not all(isinstance(op, dict) for op in operations):
+                raise ValueError
+        except (ValueError, KeyError, TypeError):
+            return JsonResponse({'error': 'Expected a JSON object with a list of operations.'}, status=400)
+
+        # These are used to look things up, so a list or object in any of
+        # them can't be allowed any further.
+        for op in operations:
+            if not isinstance(op.get('application'), str):
+                return JsonResponse({'error': 'Each operation needs an application username.'}, status=400)
+            if 'rating' in op and not isinstance(op['rating'], str):
+                return JsonResponse({'error': 'Essay ratings must be strings.'}, status=400)
+            if op.get('owner') is not None and not isinstance(op['owner'], str):
+                return JsonResponse({'error': 'Owners must be a reviewer username or null.'}, status=400)
+            if op.get('comment') is not None and not isinstance(op['comment'], str):
+                return JsonResponse({'error': 'Comments must be a string or null.'}, status=400)
+
+        # Only allow approved reviewers to review applications for the current round
+        current_round = get_current_round_for_initial_application_review()
+        reviewers = current_round.applicationreviewer_set.approved().select_related('comrade__account')
+        try:
+            reviewer = reviewers.get(comrade__account=request.user)
+        except ApplicationReviewer.DoesNotExist:
+            raise PermissionDenied("You are not currently an approved application reviewer.")
+
+        usernames = set(op['application'] for op in operations)
+        applications = {
+            a.applicant.account.username: a
+            for a in current_round.applicantapproval_set.filter(
+                applicant__account__username__in=usernames,
+            ).select_related('applicant__account', 'review_owner__comrade__account')
+        }
+        owner_names = set(op['owner'] for op in operations if op.get('owner'))
+        owners = {
+            r.comrade.account.username: r
+            for r in reviewers.filter(comrade__account__username__in=owner_names)
+        }
+        reviews = {
+            r.application_id: r
+            for r in InitialApplicationReview.objects.filter(
+                reviewer=reviewer,
+                application__in=applications.values(),
+            )
+        }
+
+        # Check every operation before changing anything.
+        review_fields = set()
+        owned = set()
+        for op in operations:
+            application = applications.get(op.get('application'))
+            if application is None:
+                return JsonResponse({'error': 'No such application: {}'.format(op.get('application'))}, status=400)
+
+            review = reviews.get(application.pk)
+            if review is None and ('rating' in op or 'flags' in op or 'comment' in op):
+                review = reviews[application.pk] = InitialApplicationReview(application=application, reviewer=reviewer)
+
+            if 'rating' in op:
+                if op['rating'] not in InitialApplicationReview.RATING_NAMES:
+                    return JsonResponse({'error': 'Unknown essay rating: {}'.format(op['rating'])}, status=400)
+                review.essay_rating = InitialApplicationReview.RATING_NAMES[op['rating']]
+                review_fields.add('essay_rating')
+
+            flags = op.get('flags', {})
+            if not isinstance(flags, dict):
+                return JsonResponse({'error': 'Flags must be a JSON object.'}, status=400)
+            for flag, value in flags.items():
+                if flag not in InitialApplicationReview.RED_FLAGS:
+                    return JsonResponse({'error': 'Unknown time commitment review flag: {}'.format(flag)}, status=400)
+                if not isinstance(value, bool):
+                    return JsonResponse({'error': 'Time commitment review flags must be true or false.'}, status=400)
+                setattr(review, flag, value)
+                review_fields.add(flag)
+
+            if 'comment' in op:
+                # A null comment clears it.
+                review.comments = op['comment'] or ''
+                review_fields.add('comments')
+
+            if 'owner' in op:
+                if op['owner'] is None:
+                    application.review_owner = None
+                elif op['owner'] in owners:
+                    application.review_owner = owners[op['owner']]
+                else:
+                    return JsonResponse({'error': 'No such application reviewer: {}'.format(op['owner'])}, status=400)
+                owned.add(application.pk)
+
+        with transaction.atomic():
+            new_reviews = [r for r in reviews.values() if r.pk is None]
+            changed_reviews = [r for r in reviews.values() if r.pk is not None]
+            InitialApplicationReview.objects.bulk_create(new_reviews)
+            if changed_reviews and review_fields:
+                InitialApplicationReview.objects.bulk_update(changed_reviews, review_fields)
+            if owned:
+                ApplicantApproval.objects.bulk_update([a for a in applications.values() if a.pk in owned], ['review_owner'])
+
+            # Bulk changes don't send the signals which usually keep these
+            # up to date.
+            ApplicantApproval.update_review_states(list(applications.values()))
+            invalidate_initial_application_counts(sender=ApplicantApproval)
+
+        return JsonResponse({'applications': [
+            {
+                'application': username,
+                'owner': application.review_owner.comrade.account.username if application.review_owner else None,
+                'has_review': application.has_review,
+                'best_rating': application.best_rating,
+                'review': self.review_state(reviews.get(application.pk)),
+            }
+            for username, application in applications.items()
+        ]})
+
+    @staticmethod
+    def review_state(review):
+        if review is None:
+            return None
+        return {
+            'rating': review.essay_rating,
+            'flags': {flag: getattr(review, flag) for flag in InitialApplicationReview.RED_FLAGS},
+            'comment': review.comments,
+        }
+
 class ReviewEssay(LoginRequiredMixin, ComradeRequiredMixin, UpdateView):
     template_name = 'home/review_essay.html'
 
@@ -4557,7 +4532,12 @@ def internship_cohort_statistics(request):
     if not request.user.is_staff:
         raise PermissionDenied("You are not authorized to view internship cohort statistics.")
 
-    rounds = RoundPage.objects.all().order_by('-internstarts')
+    rounds = RoundPage.objects.select_related(
+        'statistictotalapplied',
+        'statisticgenderdemographics',
+        'statisticamericandemographics',
+        'roundstatisticssnapshot',
+    ).order_by('-internstarts')
     return render(request, 'home/internship_cohort_statistics.html', {
         'rounds': rounds,
         })
@@ -4565,15 +4545,16 @@ def internship_cohort_statistics(request):
 def docs_toc(request):
     return render(request, 'home/docs/toc.html')
 
+@cache_anonymous_page(RoundPage, Project)
 def docs_applicant(request):
-    current_round = RoundPage.objects.latest('internannounce')
     now = datetime.now(timezone.utc)
     today = get_deadline_date_for(now)
+    timeline = RoundTimeline.for_request(request, today)
+    current_round = timeline.latest('internannounce')
     try:
-        previous_round = RoundPage.objects.filter(
+        previous_round = timeline.filter(
             contributions_open__lte=today,
         ).latest('internstarts')
-        previous_round.today = today
     except RoundPage.DoesNotExist:
         previous_round = None
 
@@ -4582,16 +4563,17 @@ def docs_applicant(request):
         'previous_round': previous_round,
         })
 
+@cache_anonymous_page(RoundPage)
 def docs_community(request):
-    current_round = RoundPage.objects.latest('internannounce')
     now = datetime.now(timezone.utc)
     today = get_deadline_date_for(now)
     five_weeks_from_now = today + timedelta(weeks=5)
+    timeline = RoundTimeline.for_request(request, today)
+    current_round = timeline.latest('internannounce')
     try:
-        previous_round = RoundPage.objects.filter(
+        previous_round = timeline.filter(
             internends__lte=five_weeks_from_now,
         ).latest('internstarts')
-        previous_round.today = today
     except RoundPage.DoesNotExist:
         previous_round = None
 
@@ -4600,13 +4582,15 @@ def docs_community(request):
         'previous_round': previous_round,
         })
 
+@cache_anonymous_page(RoundPage)
 def docs_internship(request):
     now = datetime.now(timezone.utc)
     today = get_deadline_date_for(now)
     five_weeks_ago = today - timedelta(days=7*5)
+    timeline = RoundTimeline.for_request(request, today)
 
     try:
-        applicant_round = RoundPage.objects.get(
+        applicant_round = timeline.get(
             pingnew__lte=today,
             internannounce__gt=today,
         )
@@ -4614,7 +4598,7 @@ def docs_internship(request):
         applicant_round = None
 
     try:
-        intern_round = RoundPage.objects.get(
+        intern_round = timeline.get(
             internannounce__lte=today,
             internends__gt=five_weeks_ago,
         )
@@ -4686,6 +4670,7 @@ class InformalChatContacts(LoginRequiredMixin, ComradeRequiredMixin, TemplateVie
 def donate(request):
     return render(request, 'home/donate.html')
 
+@cache_anonymous_page(RoundPage)
 def sponsor(request):
     return render(request, 'home/sponsor.html', {
         'current_round': get_current_round_for_sponsors(),
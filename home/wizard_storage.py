@@ -0,0 +1,137 @@
+from django.utils.datastructures import MultiValueDict
+from formtools.wizard.storage.base import BaseStorage
+from formtools.wizard.storage.exceptions import NoFileStorageConfigured
+
+from .models import WizardProgress, WizardStepData
+
+class DatabaseStorage(BaseStorage):
+    """
+    Form wizard storage which keeps each person's progress in the database
+    instead of in their session.
+
+    The session storage re-serializes every page's answers into the session
+    on every request. Here, each page's answers are a separate row, so
+    submitting a page only writes that page. Everything is loaded with two
+    queries the first time the wizard asks for it, and is deleted when the
+    wizard resets, which it does after calling done().
+
+    Progress that hasn't been touched for as long as a session would last
+    is thrown away, as if the session had expired. The
+    purge_wizard_progress management command deletes it for people who
+    never come back.
+
+    None of our wizards take file uploads, so this doesn't store files.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._progress = None
+        self._steps = None
+
+    def _load(self):
+        if self._steps is not None:
+            return
+
+        self._progress = WizardProgress.objects.filter(
+            user=self.request.user,
+            prefix=self.prefix,
+        ).first()
+        self._steps = {}
+
+        if self._progress is None:
+            return
+
+        if self._progress.updated < WizardProgress.expiry_cutoff():
+            self._progress.delete()
+            self._progress = None
+            return
+
+        self._steps = {
+            step.step: step.data
+            for step in self._progress.steps.all()
+        }
+
+    def _get_or_create_progress(self):
+        self._load()
+        if self._progress is None:
+            self._progress, _ = WizardProgress.objects.get_or_create(
+                user=self.request.user,
+                prefix=self.prefix,
+            )
+        return self._progress
+
+    def init_data(self):
+        self._progress = None
+        self._steps = {}
+
+    def reset(self):
+        WizardProgress.objects.filter(
+            user=self.request.user,
+            prefix=self.prefix,
+        ).delete()
+        self.init_data()
+
+    def _get_current_step(self):
+        self._load()
+        if self._progress is None:
+            return None
+        return self._progress.current_step or None
+
+    def _set_current_step(self, step):
+        if self._get_current_step() == step:
+            return
+        progress = self._get_or_create_progress()
+        progress.current_step = step or ''
+        progress.save(update_fields=['current_step', 'updated'])
+
+    def _get_extra_data(self):
+        self._load()
+        if self._progress is None:
+            return {}
+        return self._progress.extra_data
+
+    def _set_extra_data(self, extra_data):
+        progress = self._get_or_create_progress()
+        progress.extra_data = extra_data
+        progress.save(update_fields=['extra_data', 'updated'])
+
+    def get_step_data(self, step):
+        self._load()
+        values = self._steps.get(step)
+        if values is not None:
+            values = MultiValueDict(values)
+        return values
+
+    def set_step_data(self, step, cleaned_data):
+        if isinstance(cleaned_data, MultiValueDict):
+            cleaned_data = dict(cleaned_data.lists())
+
+        # The wizard hands us everything that was POSTed, including the CSRF
+        # token and its own management form, which change on every page
+        # load. They aren't answers, so don't store or compare them.
+        not_answers = ('csrfmiddlewaretoken', self.prefix[len('wizard_'):] + '-current_step')
+        cleaned_data = {
+            key: value
+            for key, value in cleaned_data.items()
+            if key not in not_answers
+        }
+
+        self._load()
+        if self._steps.get(step) == cleaned_data:
+            return
+
+        WizardStepData.objects.update_or_create(
+            progress=self._get_or_create_progress(),
+            step=step,
+            defaults={'data': cleaned_data},
+        )
+        self._steps[step] = cleaned_data
+
+    def get_step_files(self, step):
+        return None
+
+    def set_step_files(self, step, files):
+        if files:
+            raise NoFileStorageConfigured(
+                "DatabaseStorage can't store file uploads; "
+                "use a different storage_name for this wizard.")
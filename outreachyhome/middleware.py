@@ -1,5 +1,9 @@
 from django.conf import settings
 from django.core.exceptions import MiddlewareNotUsed
+from django.utils.cache import patch_vary_headers
+from whitenoise.base import WhiteNoise
+from whitenoise.middleware import WhiteNoiseMiddleware
+import os
 
 class XForwardedForMiddleware(object):
     def __init__(self, get_response):
@@ -13,3 +17,42 @@ class XForwardedForMiddleware(object):
         if forwarded and request.META.get('REMOTE_ADDR') in self.trusted_proxies:
             request.META['REMOTE_ADDR'] = forwarded.split(',')[-1].strip()
         return self.get_response(request)
+
+class PrerenderedPageMiddleware(WhiteNoise):
+    """
+    Serve pages written by the prerender_blog management command to anyone
+    who doesn't have a session cookie, without touching the database.
+
+    Logged in people see their name and their dashboard in every page, so
+    they still get a freshly rendered page from the view. The page URLs
+    never change when their content does, so browsers are only allowed to
+    keep a copy for an hour, and must ask again once they have a session.
+    """
+
+    max_age = 60 * 60
+
+    def __init__(self, get_response):
+        root = getattr(settings, 'PRERENDERED_ROOT', None)
+        if not root or not os.path.isdir(root):
+            raise MiddlewareNotUsed
+        super().__init__(
+            None,
+            root=root,
+            autorefresh=settings.DEBUG,
+            max_age=self.max_age,
+            allow_all_origins=False,
+            index_file=True,
+        )
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if request.method in ('GET', 'HEAD') and settings.SESSION_COOKIE_NAME not in request.COOKIES:
+            if self.autorefresh:
+                static_file = self.find_file(request.path_info)
+            else:
+                static_file = self.files.get(request.path_info)
+            if static_file is not None:
+                response = WhiteNoiseMiddleware.serve(static_file, request)
+                patch_vary_headers(response, ('Cookie',))
+                return response
+        return self.get_response(request)
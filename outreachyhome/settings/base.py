@@ -82,6 +82,7 @@ MIDDLEWARE = [
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'whitenoise.middleware.WhiteNoiseMiddleware',
+    'outreachyhome.middleware.PrerenderedPageMiddleware',
     # The documentation says 'You should include the Debug Toolbar middleware
     # as early as possible in the list. However, it must come after any other
     # middleware that encodes the response’s content'
@@ -172,6 +173,37 @@ DATABASES = {
         default='sqlite:///' + os.path.join(BASE_DIR, 'db.sqlite3'))
 }
 
+# Cache
+# https://docs.djangoproject.com/en/4.2/topics/cache/
+#
+# By default each process keeps its own cache in memory. Set $CACHE_DIR to
+# share a file-based cache between processes on one machine, or $REDIS_URL
+# to use a Redis-compatible server (this needs the redis package installed).
+# Cached values are invalidated when the models they depend on change (see
+# the end of home/models.py), but a process-local cache only hears about
+# changes made in the same process, so those caches also use short timeouts.
+
+if os.getenv('REDIS_URL'):
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': os.environ['REDIS_URL'],
+        }
+    }
+elif os.getenv('CACHE_DIR'):
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+            'LOCATION': os.environ['CACHE_DIR'],
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+    }
+
 # In Django 3.2, developers introduced a new way to generate object IDs (pks)
 # migrating from the old method (django.db.models.AutoField)
 # to the new method (django.db.models.BigAutoField)
@@ -219,6 +251,9 @@ STATICFILES_STORAGE = 'whitenoise.storage.CompressedManifestStaticFilesStorage'
 STATIC_ROOT = os.path.join(BASE_DIR, 'static')
 STATIC_URL = '/static/'
 
+# Blog posts rendered at deploy time by the prerender_blog management command.
+PRERENDERED_ROOT = os.path.join(BASE_DIR, 'prerendered')
+
 MEDIA_ROOT = os.path.join(BASE_DIR, 'media')
 MEDIA_URL = '/media/'
 
@@ -267,6 +302,11 @@ ACCOUNT_ACTIVATION_DAYS = 7
 
 DEFAULT_FROM_EMAIL = 'organizers@outreachy.org'
 
+# When EMAIL_BACKEND is 'home.email.OutboxBackend', outgoing mail is queued
+# in the database, and the deliver_outbox management command sends it using
+# this backend.
+OUTBOX_EMAIL_BACKEND = 'django.core.mail.backends.console.EmailBackend'
+
 # Get optional settings for Raven/Sentry error logging. The Sentry DSN
 # should be given by the environment variable SENTRY_DSN, which is the
 # only environment variable that Raven automatically checks so we don't
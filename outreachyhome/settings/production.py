@@ -18,9 +18,13 @@ TRUSTED_PROXIES = os.getenv('TRUSTED_PROXIES', '172.17.0.1').split()
 
 SECRET_KEY = os.environ['SECRET_KEY']
 
+# Web requests only queue outgoing mail; the worker process (see Procfile)
+# runs deliver_outbox to send it.
+EMAIL_BACKEND = 'home.email.OutboxBackend'
+
 EMAIL_HOST = os.environ.get('EMAIL_HOST')
 if EMAIL_HOST:
-    EMAIL_BACKEND = 'django.core.mail.backends.smtp.EmailBackend'
+    OUTBOX_EMAIL_BACKEND = 'django.core.mail.backends.smtp.EmailBackend'
     # Environment variables are strings, so we need to convert to an integer
     EMAIL_PORT = int(os.environ.get('EMAIL_PORT', 25))
     EMAIL_HOST_USER = os.environ.get('EMAIL_HOST_USER', '')
@@ -28,7 +32,7 @@ if EMAIL_HOST:
     # Environment variables are strings, so we need to convert to an bool
     EMAIL_USE_SSL = bool(os.environ.get('EMAIL_USE_SSL', False))
 else:
-    EMAIL_BACKEND = 'django.core.mail.backends.console.EmailBackend'
+    OUTBOX_EMAIL_BACKEND = 'django.core.mail.backends.console.EmailBackend'
 
 # In production, log warnings and errors to the console where Dokku will
 # capture them for display using `dokku logs`. You can get more detailed